@@ -0,0 +1,29 @@
+"""
+Runs every benchmark. Set HARLEQUIN_MYSQL_BENCH_OUTPUT to collect the
+results in one file, which can be compared to another run with
+benchmarks.compare.
+
+Usage: python -m benchmarks
+"""
+
+from __future__ import annotations
+
+from benchmarks import (
+    cancel,
+    catalog,
+    completions,
+    decode,
+    fetch,
+    pool,
+)
+
+SUITE = [fetch, decode, catalog, completions, pool, cancel]
+
+
+def main() -> None:
+    for module in SUITE:
+        module.main()
+
+
+if __name__ == "__main__":
+    main()
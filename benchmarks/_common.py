@@ -0,0 +1,163 @@
+"""
+Helpers shared by the benchmark scripts in this directory.
+
+The benchmarks run against a real MySQL server. By default they connect to
+the server started by `make init` (see docker-compose.yml); set the
+HARLEQUIN_MYSQL_BENCH_* environment variables to use another server.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import PackageNotFoundError, version
+from multiprocessing import get_context
+from typing import Any, Callable, Sequence
+
+import pyarrow as pa
+
+
+def connect_options() -> dict[str, Any]:
+    return {
+        "host": os.environ.get("HARLEQUIN_MYSQL_BENCH_HOST", "localhost"),
+        "port": int(os.environ.get("HARLEQUIN_MYSQL_BENCH_PORT", "3306")),
+        "user": os.environ.get("HARLEQUIN_MYSQL_BENCH_USER", "root"),
+        "password": os.environ.get("HARLEQUIN_MYSQL_BENCH_PASSWORD", "example"),
+    }
+
+
+def sequence_query(rows: int, exprs: str) -> str:
+    """
+    Selects exprs for n in 1..rows. The recursion limit is raised by a hint
+    on the statement, since the query may run on any pooled connection.
+    """
+    return (
+        "with recursive seq (n) as "
+        f"(select 1 union all select n + 1 from seq where n < {rows}) "
+        f"select /*+ SET_VAR(cte_max_recursion_depth = {rows + 1}) */ {exprs} "
+        "from seq"
+    )
+
+
+def numeric_query(rows: int, cols: int) -> str:
+    """
+    A query that generates a wide numeric result set without needing
+    any tables.
+    """
+    exprs = ", ".join(
+        f"n * {i} as i_{i}" if i % 2 else f"n / {i + 1} as d_{i}" for i in range(cols)
+    )
+    return sequence_query(rows, exprs)
+
+
+def temporal_query(rows: int, cols: int) -> str:
+    """
+    Like numeric_query, but every column is a DATE, DATETIME, or TIME.
+    """
+    kinds = (
+        "date('2020-01-01') + interval n day",
+        "timestamp('2020-01-01 00:00:00') + interval n second",
+        "sec_to_time(n)",
+    )
+    exprs = ", ".join(f"{kinds[i % 3]} as t_{i}" for i in range(cols))
+    return sequence_query(rows, exprs)
+
+
+@dataclass
+class BenchResult:
+    benchmark: str
+    variant: str
+    params: dict[str, Any]
+    seconds: list[float]
+    peak_bytes: int | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def best(self) -> float:
+        return min(self.seconds)
+
+
+def measure(
+    fn: Callable[[], Any], repeat: int = 3, trace_memory: bool = False
+) -> tuple[list[float], int | None]:
+    """
+    Times fn, repeat times. If trace_memory, also returns the peak memory
+    of the first run, counting both Python objects and Arrow buffers.
+    """
+    seconds: list[float] = []
+    peak: int | None = None
+    for i in range(repeat):
+        if trace_memory and i == 0:
+            tracemalloc.start()
+            start = time.perf_counter()
+            fn()
+            seconds.append(time.perf_counter() - start)
+            _, py_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peak = py_peak + pa.default_memory_pool().max_memory()
+        else:
+            start = time.perf_counter()
+            fn()
+            seconds.append(time.perf_counter() - start)
+    return seconds, peak
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    The q-th percentile (0-100) of values, by the nearest-rank method.
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def latency_summary(seconds: Sequence[float]) -> dict[str, float]:
+    return {
+        "p50_seconds": percentile(seconds, 50),
+        "p99_seconds": percentile(seconds, 99),
+        "max_seconds": max(seconds),
+    }
+
+
+def _package_version(name: str) -> str | None:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+def run_isolated(fn: Callable[..., BenchResult], *args: Any) -> BenchResult:
+    """
+    Runs a benchmark in a fresh process, so its peak memory isn't polluted
+    by earlier benchmarks. fn must be a module-level function.
+    """
+    with get_context("spawn").Pool(1) as pool:
+        return pool.apply(fn, args)
+
+
+def emit(results: Sequence[BenchResult]) -> None:
+    """
+    Writes results as JSON lines to the file named by HARLEQUIN_MYSQL_BENCH_OUTPUT,
+    or stdout. Each line records the package versions, so results from
+    different releases can be compared with benchmarks.compare.
+    """
+    meta = {
+        "harlequin_mysql": _package_version("harlequin-mysql"),
+        "mysql_connector": _package_version("mysql-connector-python"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+    }
+    lines = [json.dumps({**asdict(r), "best": r.best, "meta": meta}) for r in results]
+    path = os.environ.get("HARLEQUIN_MYSQL_BENCH_OUTPUT")
+    if path:
+        with open(path, "a") as f:
+            f.write("\n".join(lines) + "\n")
+    else:
+        sys.stdout.write("\n".join(lines) + "\n")
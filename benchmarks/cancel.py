@@ -0,0 +1,60 @@
+"""
+Measures cancel latency: the time from cancelling a running query to the
+query returning control to Harlequin. The control connection's own time to
+send KILL QUERY is reported separately, from cancel_stats.
+
+Usage: python -m benchmarks.cancel
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from benchmarks._common import (
+    BenchResult,
+    connect_options,
+    emit,
+    latency_summary,
+    run_isolated,
+)
+from harlequin_mysql.adapter import HarlequinMySQLAdapter
+
+REPEAT = 20
+QUERY = "select sleep(60)"
+
+
+def bench_cancel() -> BenchResult:
+    conn = HarlequinMySQLAdapter(conn_str=tuple(), **connect_options()).connect()
+    seconds: list[float] = []
+    kill_seconds: list[float] = []
+    for _ in range(REPEAT):
+        worker = threading.Thread(target=conn.execute, args=(QUERY,))
+        worker.start()
+        while not conn._in_use_connections:
+            time.sleep(0.001)
+        # give the server time to start the query.
+        time.sleep(0.05)
+        [connection_id] = conn._in_use_connections
+        start = time.perf_counter()
+        assert conn.cancel_connection(connection_id)
+        worker.join()
+        seconds.append(time.perf_counter() - start)
+        assert conn.cancel_stats.last_seconds is not None
+        kill_seconds.append(conn.cancel_stats.last_seconds)
+    conn.close()
+    return BenchResult(
+        benchmark="cancel",
+        variant="control",
+        params={"repeat": REPEAT},
+        seconds=seconds,
+        extra={**latency_summary(seconds), "kill_seconds": kill_seconds},
+    )
+
+
+def main() -> None:
+    emit([run_isolated(bench_cancel)])
+
+
+if __name__ == "__main__":
+    main()
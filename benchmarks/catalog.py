@@ -0,0 +1,113 @@
+"""
+Measures loading the Data Catalog for synthetic schemas with thousands of
+tables, comparing the default (lazy) catalog to --bulk-catalog. Reports the
+time for get_catalog(), and for expanding every item in the synthetic
+database, as Harlequin does when a user expands the whole tree.
+
+The synthetic databases are created on the first run (which is slow) and
+kept, so later runs can be compared. Set HARLEQUIN_MYSQL_BENCH_DROP=1 to
+drop them afterwards.
+
+Usage: python -m benchmarks.catalog
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Sequence
+
+from harlequin.catalog import CatalogItem, InteractiveCatalogItem
+
+from benchmarks._common import BenchResult, connect_options, emit, run_isolated
+from harlequin_mysql.adapter import HarlequinMySQLAdapter, HarlequinMySQLConnection
+
+TABLE_COUNTS = [1_000, 5_000]
+COLUMNS_PER_TABLE = 8
+REPEAT = 3
+
+
+def _database(tables: int) -> str:
+    return f"harlequin_bench_catalog_{tables}"
+
+
+def create_schema(conn: HarlequinMySQLConnection, tables: int) -> None:
+    db = _database(tables)
+    conn.execute(f"create database if not exists {db}")
+    cur = conn.execute(
+        f"select count(*) from information_schema.tables where table_schema = '{db}'"
+    )
+    assert cur is not None
+    rows = cur.fetchall()
+    assert isinstance(rows, list)
+    [(existing,)] = rows
+    columns = ", ".join(
+        f"c_{i} {'int' if i % 2 else 'varchar(64)'}" for i in range(COLUMNS_PER_TABLE)
+    )
+    for i in range(existing, tables):
+        conn.execute(
+            f"create table if not exists {db}.t_{i:05} (id int primary key, {columns})"
+        )
+
+
+def _expand(items: Sequence[CatalogItem]) -> int:
+    """
+    Loads the children of every item, recursively, and returns the number
+    of items in the tree.
+    """
+    count = 0
+    for item in items:
+        if isinstance(item, InteractiveCatalogItem) and not item.loaded:
+            item.children = list(item.fetch_children())
+            item.loaded = True
+        count += 1 + _expand(item.children)
+    return count
+
+
+def bench_catalog(variant: str, tables: int) -> BenchResult:
+    conn = HarlequinMySQLAdapter(
+        conn_str=tuple(), bulk_catalog=variant == "bulk", **connect_options()
+    ).connect()
+    catalog_seconds: list[float] = []
+    expand_seconds: list[float] = []
+    items = 0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        catalog = conn.get_catalog()
+        catalog_seconds.append(time.perf_counter() - start)
+        [db_item] = [item for item in catalog.items if item.label == _database(tables)]
+        start = time.perf_counter()
+        items = _expand([db_item])
+        expand_seconds.append(time.perf_counter() - start)
+    conn.close()
+    return BenchResult(
+        benchmark="catalog",
+        variant=variant,
+        params={"tables": tables, "columns_per_table": COLUMNS_PER_TABLE},
+        seconds=[c + e for c, e in zip(catalog_seconds, expand_seconds, strict=True)],
+        extra={
+            "get_catalog_seconds": catalog_seconds,
+            "expand_seconds": expand_seconds,
+            "items": items,
+        },
+    )
+
+
+def main() -> None:
+    conn = HarlequinMySQLAdapter(conn_str=tuple(), **connect_options()).connect()
+    for tables in TABLE_COUNTS:
+        create_schema(conn, tables)
+    results = [
+        run_isolated(bench_catalog, variant, tables)
+        for tables in TABLE_COUNTS
+        for variant in ("lazy", "bulk")
+    ]
+    if os.environ.get("HARLEQUIN_MYSQL_BENCH_DROP"):
+        for tables in TABLE_COUNTS:
+            conn.execute(f"drop database if exists {_database(tables)}")
+    conn.close()
+    emit(results)
+
+
+if __name__ == "__main__":
+    main()
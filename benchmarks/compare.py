@@ -0,0 +1,85 @@
+"""
+Compares two files of benchmark results (JSON lines, as written by the
+benchmarks with HARLEQUIN_MYSQL_BENCH_OUTPUT set), e.g., from two releases.
+Results are matched by benchmark, variant, and params, and compared by their
+best time.
+
+Exits with an error if any benchmark got slower by more than the threshold
+(default: 10%).
+
+Usage: python -m benchmarks.compare BASELINE.jsonl CANDIDATE.jsonl [THRESHOLD]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+DEFAULT_THRESHOLD = 0.10
+
+Key = tuple[str, str, str]
+
+
+def load(path: Path) -> dict[Key, dict[str, Any]]:
+    """
+    Reads a results file. If a benchmark was run more than once, the last
+    result wins.
+    """
+    results: dict[Key, dict[str, Any]] = {}
+    for line in path.read_text().splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        key = (
+            result["benchmark"],
+            result["variant"],
+            json.dumps(result["params"], sort_keys=True),
+        )
+        results[key] = result
+    return results
+
+
+def compare(
+    baseline: dict[Key, dict[str, Any]],
+    candidate: dict[Key, dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> tuple[list[str], list[Key]]:
+    """
+    Returns a line of the report for each benchmark in both files, and the
+    keys of the benchmarks that regressed by more than threshold.
+    """
+    lines: list[str] = []
+    regressions: list[Key] = []
+    for key in sorted(baseline.keys() & candidate.keys()):
+        before, after = baseline[key]["best"], candidate[key]["best"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        benchmark, variant, params = key
+        lines.append(
+            f"{benchmark:<14} {variant:<12} {params:<48} "
+            f"{before:>10.4f}s {after:>10.4f}s {change:>+8.1%}{flag}"
+        )
+    return lines, regressions
+
+
+def main() -> None:
+    if len(sys.argv) not in (3, 4):
+        sys.exit(__doc__)
+    threshold = float(sys.argv[3]) if len(sys.argv) == 4 else DEFAULT_THRESHOLD
+    lines, regressions = compare(
+        load(Path(sys.argv[1])), load(Path(sys.argv[2])), threshold
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
+    if regressions:
+        sys.exit(
+            f"{len(regressions)} benchmark(s) regressed by more than {threshold:.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Compares building completions by parsing keywords.csv and functions.tsv
+(the legacy path) to loading them from the precompiled data module, each in
+a fresh interpreter, so the cost of importing the data module is included.
+Also times later, memoized calls to load_completions().
+
+Exits with an error if the precompiled path is not faster than the legacy
+path, or if a memoized call takes longer than MAX_MEMOIZED_SECONDS.
+
+This benchmark does not need a MySQL server.
+
+Usage: python -m benchmarks.completions
+"""
+
+from __future__ import annotations
+
+import py_compile
+import sys
+
+from benchmarks._common import BenchResult, emit, measure, run_isolated
+
+REPEAT = 5
+MAX_MEMOIZED_SECONDS = 0.001
+
+
+def bench_load(variant: str) -> BenchResult:
+    # importing the package is slow (it imports harlequin and the
+    # connector), and is the same for every variant, so it happens before
+    # starting the clock. The data module is only imported on first use.
+    from harlequin import HarlequinCompletion
+
+    from harlequin_mysql.completions import load_completions, parse_completion_sources
+
+    def _legacy() -> None:
+        [
+            HarlequinCompletion(
+                label=label,
+                type_label=type_label,
+                value=label,
+                priority=priority,
+                context=None,
+            )
+            for label, type_label, priority, _, until in parse_completion_sources()
+            if until is None
+        ]
+
+    if variant == "legacy":
+        seconds, _ = measure(_legacy, repeat=1)
+    elif variant == "precompiled":
+        seconds, _ = measure(load_completions, repeat=1)
+    else:
+        load_completions()
+        seconds, _ = measure(load_completions, repeat=10)
+    return BenchResult(
+        benchmark="completions", variant=variant, params={}, seconds=seconds
+    )
+
+
+def main() -> None:
+    # installers compile the data module to bytecode, but a source checkout
+    # may not have a .pyc yet (e.g., if PYTHONDONTWRITEBYTECODE is set).
+    from harlequin_mysql.completions import DATA_PATH
+
+    py_compile.compile(str(DATA_PATH))
+
+    results: list[BenchResult] = []
+    for variant in ("legacy", "precompiled", "memoized"):
+        runs = [run_isolated(bench_load, variant) for _ in range(REPEAT)]
+        results.append(
+            BenchResult(
+                benchmark="completions",
+                variant=variant,
+                params={},
+                seconds=[s for run in runs for s in run.seconds],
+            )
+        )
+    emit(results)
+
+    legacy, precompiled, memoized = results
+    if precompiled.best >= legacy.best or memoized.best > MAX_MEMOIZED_SECONDS:
+        sys.exit(
+            f"loading completions took {precompiled.best * 1000:.3f}ms "
+            f"(legacy: {legacy.best * 1000:.3f}ms, "
+            f"memoized: {memoized.best * 1000:.3f}ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares decoding results sent over the text protocol (the default) to
+results sent over the binary protocol (--prepared-statements), and to raw
+results converted to Arrow a column at a time (--raw-fetch), for numeric-
+and date-heavy result sets. Reports rows decoded per second.
+
+Usage: python -m benchmarks.decode
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from benchmarks._common import (
+    BenchResult,
+    connect_options,
+    emit,
+    measure,
+    numeric_query,
+    run_isolated,
+    temporal_query,
+)
+from harlequin_mysql.adapter import HarlequinMySQLAdapter, HarlequinMySQLCursor
+
+ROW_COUNTS = [10_000, 100_000]
+COLUMN_COUNT = 20
+QUERIES: dict[str, Callable[[int, int], str]] = {
+    "numeric": numeric_query,
+    "temporal": temporal_query,
+}
+
+
+def bench_decode(variant: str, result: str, rows: int, cols: int) -> BenchResult:
+    conn = HarlequinMySQLAdapter(
+        conn_str=tuple(),
+        prepared_statements=variant == "binary",
+        raw_fetch=variant == "raw",
+        **connect_options(),
+    ).connect()
+    query = QUERIES[result](rows, cols)
+
+    def _run() -> None:
+        cur = conn.execute(query)
+        assert isinstance(cur, HarlequinMySQLCursor)
+        assert cur._binary is (variant == "binary")
+        assert cur._raw is (variant == "raw")
+        cur.fetchall()
+
+    seconds, _ = measure(_run)
+    conn.close()
+    return BenchResult(
+        benchmark="decode",
+        variant=variant,
+        params={"result": result, "rows": rows, "cols": cols},
+        seconds=seconds,
+        extra={"rows_per_second": [rows / s for s in seconds]},
+    )
+
+
+def main() -> None:
+    results = [
+        run_isolated(bench_decode, variant, result, rows, COLUMN_COUNT)
+        for result in QUERIES
+        for rows in ROW_COUNTS
+        for variant in ("text", "binary", "raw")
+    ]
+    emit(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Measures execute() and fetchall() throughput for numeric results of
+different lengths and widths, comparing the default fetch path (a list of
+tuples, converted to Arrow by textual-fastdatatable) to the --arrow-fetch
+path. Reports rows and cells fetched per second, and peak memory.
+
+Usage: python -m benchmarks.fetch
+"""
+
+from __future__ import annotations
+
+from textual_fastdatatable.backend import create_backend
+
+from benchmarks._common import (
+    BenchResult,
+    connect_options,
+    emit,
+    measure,
+    numeric_query,
+    run_isolated,
+)
+from harlequin_mysql.adapter import HarlequinMySQLAdapter, HarlequinMySQLCursor
+
+ROW_COUNTS = [1_000, 10_000, 100_000]
+COLUMN_COUNTS = [4, 20, 100]
+
+
+def bench_fetch(variant: str, rows: int, cols: int) -> BenchResult:
+    conn = HarlequinMySQLAdapter(
+        conn_str=tuple(), arrow_fetch=variant == "arrow", **connect_options()
+    ).connect()
+    query = numeric_query(rows, cols)
+
+    def _run() -> None:
+        cur = conn.execute(query)
+        assert isinstance(cur, HarlequinMySQLCursor)
+        create_backend(cur.fetchall())
+
+    seconds, peak = measure(_run, trace_memory=True)
+    conn.close()
+    return BenchResult(
+        benchmark="fetch",
+        variant=variant,
+        params={"rows": rows, "cols": cols},
+        seconds=seconds,
+        peak_bytes=peak,
+        extra={
+            "rows_per_second": [rows / s for s in seconds],
+            "cells_per_second": [rows * cols / s for s in seconds],
+        },
+    )
+
+
+def main() -> None:
+    results = [
+        run_isolated(bench_fetch, variant, rows, cols)
+        for rows in ROW_COUNTS
+        for cols in COLUMN_COUNTS
+        for variant in ("tuples", "arrow")
+    ]
+    emit(results)
+
+
+if __name__ == "__main__":
+    main()
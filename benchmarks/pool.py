@@ -0,0 +1,122 @@
+"""
+Compares opening a connection pool one connection at a time (as
+MySQLConnectionPool does) to HarlequinConnectionPool's concurrent warm-up.
+Reports the time until the first connection is usable, and until the pool
+is full.
+
+The gap grows with the cost of each connection; run it against a remote
+server with TLS to see the difference Harlequin users would.
+
+Also measures checkout latency (get_connection() on a warm pool), with one
+caller and with more callers than connections.
+
+Usage: python -m benchmarks.pool
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mysql.connector.pooling import MySQLConnectionPool
+
+from benchmarks._common import BenchResult, connect_options, emit, latency_summary
+from harlequin_mysql.pool import HarlequinConnectionPool
+
+POOL_SIZES = [5, 20]
+REPEAT = 3
+CHECKOUT_POOL_SIZE = 5
+CHECKOUT_CALLERS = [1, 20]
+CHECKOUTS_PER_CALLER = 500
+
+
+def bench_sequential(pool_size: int) -> BenchResult:
+    seconds: list[float] = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        pool = MySQLConnectionPool(
+            pool_name="bench", pool_size=pool_size, **connect_options()
+        )
+        # the constructor returns when every connection is open.
+        seconds.append(time.perf_counter() - start)
+        pool._remove_connections()
+    return BenchResult(
+        benchmark="pool_warm_up",
+        variant="sequential",
+        params={"pool_size": pool_size},
+        seconds=seconds,
+        extra={"first_connection_seconds": seconds, "total_seconds": seconds},
+    )
+
+
+def bench_concurrent(pool_size: int) -> BenchResult:
+    first: list[float] = []
+    total: list[float] = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        pool = HarlequinConnectionPool(
+            pool_name="bench", pool_size=pool_size, **connect_options()
+        )
+        pool.warm_up()
+        first.append(time.perf_counter() - start)
+        while pool.warm_up_stats.total_seconds is None:
+            time.sleep(0.001)
+        total.append(time.perf_counter() - start)
+        pool.close()
+    return BenchResult(
+        benchmark="pool_warm_up",
+        variant="concurrent",
+        params={"pool_size": pool_size},
+        seconds=first,
+        extra={"first_connection_seconds": first, "total_seconds": total},
+    )
+
+
+def bench_checkout(callers: int) -> BenchResult:
+    pool = HarlequinConnectionPool(
+        pool_name="bench",
+        pool_size=CHECKOUT_POOL_SIZE,
+        max_size=CHECKOUT_POOL_SIZE,
+        timeout=60,
+        **connect_options(),
+    )
+    pool.warm_up()
+    # stats().open also counts connections that are still being opened, so
+    # wait for the warm-up itself to finish before starting the clock.
+    while pool.warm_up_stats.total_seconds is None:
+        time.sleep(0.001)
+    assert pool.warm_up_stats.connections == CHECKOUT_POOL_SIZE
+
+    def _checkouts(_: int) -> list[float]:
+        seconds: list[float] = []
+        for _ in range(CHECKOUTS_PER_CALLER):
+            start = time.perf_counter()
+            cnx = pool.get_connection()
+            seconds.append(time.perf_counter() - start)
+            cnx.close()
+        return seconds
+
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        seconds = [s for run in executor.map(_checkouts, range(callers)) for s in run]
+    pool.close()
+    return BenchResult(
+        benchmark="pool_checkout",
+        variant="sync",
+        params={"pool_size": CHECKOUT_POOL_SIZE, "callers": callers},
+        seconds=seconds,
+        extra=latency_summary(seconds),
+    )
+
+
+def main() -> None:
+    results = [
+        bench(pool_size)
+        for pool_size in POOL_SIZES
+        for bench in (bench_sequential, bench_concurrent)
+    ]
+    results.extend(bench_checkout(callers) for callers in CHECKOUT_CALLERS)
+    emit(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1383 @@
+# This file is generated from keywords.csv and functions.tsv by
+# `make completions`. Do not edit it by hand.
+
+from __future__ import annotations
+
+# completions available in every server version, as
+# (type_label, priority, labels), with one label per line.
+UNVERSIONED: tuple[tuple[str, int, str], ...] = (
+    (
+        "kw",
+        100,
+        (
+            "accessible\n"
+            "account\n"
+            "action\n"
+            "active\n"
+            "add\n"
+            "admin\n"
+            "after\n"
+            "against\n"
+            "aggregate\n"
+            "algorithm\n"
+            "all\n"
+            "alter\n"
+            "always\n"
+            "analyze\n"
+            "and\n"
+            "any\n"
+            "array\n"
+            "as\n"
+            "asc\n"
+            "ascii\n"
+            "asensitive\n"
+            "at\n"
+            "attribute\n"
+            "authentication\n"
+            "autoextend_size\n"
+            "auto_increment\n"
+            "avg\n"
+            "avg_row_length\n"
+            "backup\n"
+            "before\n"
+            "begin\n"
+            "between\n"
+            "bigint\n"
+            "binary\n"
+            "binlog\n"
+            "bit\n"
+            "blob\n"
+            "block\n"
+            "bool\n"
+            "boolean\n"
+            "both\n"
+            "btree\n"
+            "buckets\n"
+            "bulk\n"
+            "by\n"
+            "byte\n"
+            "cache\n"
+            "call\n"
+            "cascade\n"
+            "cascaded\n"
+            "case\n"
+            "catalog_name\n"
+            "chain\n"
+            "challenge_response\n"
+            "change\n"
+            "changed\n"
+            "channel\n"
+            "char\n"
+            "character\n"
+            "charset\n"
+            "check\n"
+            "checksum\n"
+            "cipher\n"
+            "class_origin\n"
+            "client\n"
+            "clone\n"
+            "close\n"
+            "coalesce\n"
+            "code\n"
+            "collate\n"
+            "collation\n"
+            "column\n"
+            "columns\n"
+            "column_format\n"
+            "column_name\n"
+            "comment\n"
+            "commit\n"
+            "committed\n"
+            "compact\n"
+            "completion\n"
+            "component\n"
+            "compressed\n"
+            "compression\n"
+            "concurrent\n"
+            "condition\n"
+            "connection\n"
+            "consistent\n"
+            "constraint\n"
+            "constraint_catalog\n"
+            "constraint_name\n"
+            "constraint_schema\n"
+            "contains\n"
+            "context\n"
+            "continue\n"
+            "convert\n"
+            "cpu\n"
+            "create\n"
+            "cross\n"
+            "cube\n"
+            "cume_dist\n"
+            "current\n"
+            "current_date\n"
+            "current_time\n"
+            "current_timestamp\n"
+            "current_user\n"
+            "cursor\n"
+            "cursor_name\n"
+            "data\n"
+            "database\n"
+            "databases\n"
+            "datafile\n"
+            "date\n"
+            "datetime\n"
+            "day\n"
+            "day_hour\n"
+            "day_microsecond\n"
+            "day_minute\n"
+            "day_second\n"
+            "deallocate\n"
+            "dec\n"
+            "decimal\n"
+            "declare\n"
+            "default\n"
+            "default_auth\n"
+            "definer\n"
+            "definition\n"
+            "delayed\n"
+            "delay_key_write\n"
+            "delete\n"
+            "dense_rank\n"
+            "desc\n"
+            "describe\n"
+            "description\n"
+            "deterministic\n"
+            "diagnostics\n"
+            "directory\n"
+            "disable\n"
+            "discard\n"
+            "disk\n"
+            "distinct\n"
+            "distinctrow\n"
+            "div\n"
+            "do\n"
+            "double\n"
+            "drop\n"
+            "dual\n"
+            "dumpfile\n"
+            "duplicate\n"
+            "dynamic\n"
+            "each\n"
+            "else\n"
+            "elseif\n"
+            "empty\n"
+            "enable\n"
+            "enclosed\n"
+            "encryption\n"
+            "end\n"
+            "ends\n"
+            "enforced\n"
+            "engine\n"
+            "engines\n"
+            "engine_attribute\n"
+            "enum\n"
+            "error\n"
+            "errors\n"
+            "escape\n"
+            "escaped\n"
+            "event\n"
+            "events\n"
+            "every\n"
+            "except\n"
+            "exchange\n"
+            "exclude\n"
+            "execute\n"
+            "exists\n"
+            "exit\n"
+            "expansion\n"
+            "expire\n"
+            "explain\n"
+            "export\n"
+            "extended\n"
+            "extent_size\n"
+            "factor\n"
+            "failed_login_attempts\n"
+            "false\n"
+            "fast\n"
+            "faults\n"
+            "fetch\n"
+            "fields\n"
+            "file\n"
+            "file_block_size\n"
+            "filter\n"
+            "finish\n"
+            "first\n"
+            "first_value\n"
+            "fixed\n"
+            "float\n"
+            "float4\n"
+            "float8\n"
+            "flush\n"
+            "following\n"
+            "follows\n"
+            "for\n"
+            "force\n"
+            "foreign\n"
+            "format\n"
+            "found\n"
+            "from\n"
+            "full\n"
+            "fulltext\n"
+            "function\n"
+            "general\n"
+            "generate\n"
+            "generated\n"
+            "geomcollection\n"
+            "geometry\n"
+            "geometrycollection\n"
+            "get\n"
+            "get_format\n"
+            "get_master_public_key\n"
+            "get_source_public_key\n"
+            "global\n"
+            "grant\n"
+            "grants\n"
+            "group\n"
+            "grouping\n"
+            "groups\n"
+            "group_replication\n"
+            "gtid_only\n"
+            "handler\n"
+            "hash\n"
+            "having\n"
+            "help\n"
+            "high_priority\n"
+            "histogram\n"
+            "history\n"
+            "host\n"
+            "hosts\n"
+            "hour\n"
+            "hour_microsecond\n"
+            "hour_minute\n"
+            "hour_second\n"
+            "identified\n"
+            "if\n"
+            "ignore\n"
+            "ignore_server_ids\n"
+            "import\n"
+            "in\n"
+            "inactive\n"
+            "index\n"
+            "indexes\n"
+            "infile\n"
+            "initial\n"
+            "initial_size\n"
+            "initiate\n"
+            "inner\n"
+            "inout\n"
+            "insensitive\n"
+            "insert\n"
+            "insert_method\n"
+            "install\n"
+            "instance\n"
+            "int\n"
+            "int1\n"
+            "int2\n"
+            "int3\n"
+            "int4\n"
+            "int8\n"
+            "integer\n"
+            "intersect\n"
+            "interval\n"
+            "into\n"
+            "invisible\n"
+            "invoker\n"
+            "io\n"
+            "io_after_gtids\n"
+            "io_before_gtids\n"
+            "io_thread\n"
+            "ipc\n"
+            "is\n"
+            "isolation\n"
+            "issuer\n"
+            "iterate\n"
+            "join\n"
+            "json\n"
+            "json_table\n"
+            "json_value\n"
+            "key\n"
+            "keyring\n"
+            "keys\n"
+            "key_block_size\n"
+            "kill\n"
+            "lag\n"
+            "language\n"
+            "last\n"
+            "last_value\n"
+            "lateral\n"
+            "lead\n"
+            "leading\n"
+            "leave\n"
+            "leaves\n"
+            "left\n"
+            "less\n"
+            "level\n"
+            "like\n"
+            "limit\n"
+            "linear\n"
+            "lines\n"
+            "linestring\n"
+            "list\n"
+            "load\n"
+            "local\n"
+            "localtime\n"
+            "localtimestamp\n"
+            "lock\n"
+            "locked\n"
+            "locks\n"
+            "logfile\n"
+            "logs\n"
+            "long\n"
+            "longblob\n"
+            "longtext\n"
+            "loop\n"
+            "low_priority\n"
+            "master\n"
+            "master_auto_position\n"
+            "master_bind\n"
+            "master_compression_algorithms\n"
+            "master_connect_retry\n"
+            "master_delay\n"
+            "master_heartbeat_period\n"
+            "master_host\n"
+            "master_log_file\n"
+            "master_log_pos\n"
+            "master_password\n"
+            "master_port\n"
+            "master_public_key_path\n"
+            "master_retry_count\n"
+            "master_ssl\n"
+            "master_ssl_ca\n"
+            "master_ssl_capath\n"
+            "master_ssl_cert\n"
+            "master_ssl_cipher\n"
+            "master_ssl_crl\n"
+            "master_ssl_crlpath\n"
+            "master_ssl_key\n"
+            "master_ssl_verify_server_cert\n"
+            "master_tls_ciphersuites\n"
+            "master_tls_version\n"
+            "master_user\n"
+            "master_zstd_compression_level\n"
+            "match\n"
+            "maxvalue\n"
+            "max_connections_per_hour\n"
+            "max_queries_per_hour\n"
+            "max_rows\n"
+            "max_size\n"
+            "max_updates_per_hour\n"
+            "max_user_connections\n"
+            "medium\n"
+            "mediumblob\n"
+            "mediumint\n"
+            "mediumtext\n"
+            "member\n"
+            "memory\n"
+            "merge\n"
+            "message_text\n"
+            "microsecond\n"
+            "middleint\n"
+            "migrate\n"
+            "minute\n"
+            "minute_microsecond\n"
+            "minute_second\n"
+            "min_rows\n"
+            "mod\n"
+            "mode\n"
+            "modifies\n"
+            "modify\n"
+            "month\n"
+            "multilinestring\n"
+            "multipoint\n"
+            "multipolygon\n"
+            "mutex\n"
+            "mysql_errno\n"
+            "name\n"
+            "names\n"
+            "national\n"
+            "natural\n"
+            "nchar\n"
+            "ndb\n"
+            "ndbcluster\n"
+            "nested\n"
+            "network_namespace\n"
+            "never\n"
+            "new\n"
+            "next\n"
+            "no\n"
+            "nodegroup\n"
+            "none\n"
+            "not\n"
+            "nowait\n"
+            "no_wait\n"
+            "no_write_to_binlog\n"
+            "nth_value\n"
+            "ntile\n"
+            "null\n"
+            "nulls\n"
+            "number\n"
+            "numeric\n"
+            "nvarchar\n"
+            "of\n"
+            "off\n"
+            "offset\n"
+            "oj\n"
+            "old\n"
+            "on\n"
+            "one\n"
+            "only\n"
+            "open\n"
+            "optimize\n"
+            "optimizer_costs\n"
+            "option\n"
+            "optional\n"
+            "optionally\n"
+            "options\n"
+            "or\n"
+            "order\n"
+            "ordinality\n"
+            "organization\n"
+            "others\n"
+            "out\n"
+            "outer\n"
+            "outfile\n"
+            "over\n"
+            "owner\n"
+            "pack_keys\n"
+            "page\n"
+            "parser\n"
+            "partial\n"
+            "partition\n"
+            "partitioning\n"
+            "partitions\n"
+            "password\n"
+            "password_lock_time\n"
+            "path\n"
+            "percent_rank\n"
+            "persist\n"
+            "persist_only\n"
+            "phase\n"
+            "plugin\n"
+            "plugins\n"
+            "plugin_dir\n"
+            "point\n"
+            "polygon\n"
+            "port\n"
+            "precedes\n"
+            "preceding\n"
+            "precision\n"
+            "prepare\n"
+            "preserve\n"
+            "prev\n"
+            "primary\n"
+            "privileges\n"
+            "privilege_checks_user\n"
+            "procedure\n"
+            "process\n"
+            "processlist\n"
+            "profile\n"
+            "profiles\n"
+            "proxy\n"
+            "purge\n"
+            "quarter\n"
+            "query\n"
+            "quick\n"
+            "random\n"
+            "range\n"
+            "rank\n"
+            "read\n"
+            "reads\n"
+            "read_only\n"
+            "read_write\n"
+            "real\n"
+            "rebuild\n"
+            "recover\n"
+            "recursive\n"
+            "redo_buffer_size\n"
+            "redundant\n"
+            "reference\n"
+            "references\n"
+            "regexp\n"
+            "registration\n"
+            "relay\n"
+            "relaylog\n"
+            "relay_log_file\n"
+            "relay_log_pos\n"
+            "relay_thread\n"
+            "release\n"
+            "reload\n"
+            "remove\n"
+            "rename\n"
+            "reorganize\n"
+            "repair\n"
+            "repeat\n"
+            "repeatable\n"
+            "replace\n"
+            "replica\n"
+            "replicas\n"
+            "replicate_do_db\n"
+            "replicate_do_table\n"
+            "replicate_ignore_db\n"
+            "replicate_ignore_table\n"
+            "replicate_rewrite_db\n"
+            "replicate_wild_do_table\n"
+            "replicate_wild_ignore_table\n"
+            "replication\n"
+            "require\n"
+            "require_row_format\n"
+            "reset\n"
+            "resignal\n"
+            "resource\n"
+            "respect\n"
+            "restart\n"
+            "restore\n"
+            "restrict\n"
+            "resume\n"
+            "retain\n"
+            "return\n"
+            "returned_sqlstate\n"
+            "returning\n"
+            "returns\n"
+            "reuse\n"
+            "reverse\n"
+            "revoke\n"
+            "right\n"
+            "rlike\n"
+            "role\n"
+            "rollback\n"
+            "rollup\n"
+            "rotate\n"
+            "routine\n"
+            "row\n"
+            "rows\n"
+            "row_count\n"
+            "row_format\n"
+            "row_number\n"
+            "rtree\n"
+            "savepoint\n"
+            "schedule\n"
+            "schema\n"
+            "schemas\n"
+            "schema_name\n"
+            "second\n"
+            "secondary\n"
+            "secondary_engine\n"
+            "secondary_engine_attribute\n"
+            "secondary_load\n"
+            "secondary_unload\n"
+            "second_microsecond\n"
+            "security\n"
+            "select\n"
+            "sensitive\n"
+            "separator\n"
+            "serial\n"
+            "serializable\n"
+            "server\n"
+            "session\n"
+            "set\n"
+            "share\n"
+            "show\n"
+            "shutdown\n"
+            "signal\n"
+            "signed\n"
+            "simple\n"
+            "skip\n"
+            "slave\n"
+            "slow\n"
+            "smallint\n"
+            "snapshot\n"
+            "socket\n"
+            "some\n"
+            "soname\n"
+            "sounds\n"
+            "source\n"
+            "source_auto_position\n"
+            "source_bind\n"
+            "source_compression_algorithms\n"
+            "source_connect_retry\n"
+            "source_delay\n"
+            "source_heartbeat_period\n"
+            "source_host\n"
+            "source_log_file\n"
+            "source_log_pos\n"
+            "source_password\n"
+            "source_port\n"
+            "source_public_key_path\n"
+            "source_retry_count\n"
+            "source_ssl\n"
+            "source_ssl_ca\n"
+            "source_ssl_capath\n"
+            "source_ssl_cert\n"
+            "source_ssl_cipher\n"
+            "source_ssl_crl\n"
+            "source_ssl_crlpath\n"
+            "source_ssl_key\n"
+            "source_ssl_verify_server_cert\n"
+            "source_tls_ciphersuites\n"
+            "source_tls_version\n"
+            "source_user\n"
+            "source_zstd_compression_level\n"
+            "spatial\n"
+            "specific\n"
+            "sql\n"
+            "sqlexception\n"
+            "sqlstate\n"
+            "sqlwarning\n"
+            "sql_after_gtids\n"
+            "sql_after_mts_gaps\n"
+            "sql_before_gtids\n"
+            "sql_big_result\n"
+            "sql_buffer_result\n"
+            "sql_calc_found_rows\n"
+            "sql_no_cache\n"
+            "sql_small_result\n"
+            "sql_thread\n"
+            "sql_tsi_day\n"
+            "sql_tsi_hour\n"
+            "sql_tsi_minute\n"
+            "sql_tsi_month\n"
+            "sql_tsi_quarter\n"
+            "sql_tsi_second\n"
+            "sql_tsi_week\n"
+            "sql_tsi_year\n"
+            "srid\n"
+            "ssl\n"
+            "stacked\n"
+            "start\n"
+            "starting\n"
+            "starts\n"
+            "stats_auto_recalc\n"
+            "stats_persistent\n"
+            "stats_sample_pages\n"
+            "status\n"
+            "stop\n"
+            "storage\n"
+            "stored\n"
+            "straight_join\n"
+            "stream\n"
+            "string\n"
+            "subclass_origin\n"
+            "subject\n"
+            "subpartition\n"
+            "subpartitions\n"
+            "super\n"
+            "suspend\n"
+            "swaps\n"
+            "switches\n"
+            "system\n"
+            "table\n"
+            "tables\n"
+            "tablespace\n"
+            "table_checksum\n"
+            "table_name\n"
+            "temporary\n"
+            "temptable\n"
+            "terminated\n"
+            "text\n"
+            "than\n"
+            "then\n"
+            "thread_priority\n"
+            "ties\n"
+            "time\n"
+            "timestamp\n"
+            "timestampadd\n"
+            "timestampdiff\n"
+            "tinyblob\n"
+            "tinyint\n"
+            "tinytext\n"
+            "tls\n"
+            "to\n"
+            "trailing\n"
+            "transaction\n"
+            "trigger\n"
+            "triggers\n"
+            "true\n"
+            "truncate\n"
+            "type\n"
+            "types\n"
+            "unbounded\n"
+            "uncommitted\n"
+            "undefined\n"
+            "undo\n"
+            "undofile\n"
+            "undo_buffer_size\n"
+            "unicode\n"
+            "uninstall\n"
+            "union\n"
+            "unique\n"
+            "unknown\n"
+            "unlock\n"
+            "unregister\n"
+            "unsigned\n"
+            "until\n"
+            "update\n"
+            "upgrade\n"
+            "url\n"
+            "usage\n"
+            "use\n"
+            "user\n"
+            "user_resources\n"
+            "use_frm\n"
+            "using\n"
+            "utc_date\n"
+            "utc_time\n"
+            "utc_timestamp\n"
+            "validation\n"
+            "value\n"
+            "values\n"
+            "varbinary\n"
+            "varchar\n"
+            "varcharacter\n"
+            "variables\n"
+            "varying\n"
+            "vcpu\n"
+            "view\n"
+            "virtual\n"
+            "visible\n"
+            "wait\n"
+            "warnings\n"
+            "week\n"
+            "weight_string\n"
+            "when\n"
+            "where\n"
+            "while\n"
+            "window\n"
+            "with\n"
+            "without\n"
+            "work\n"
+            "wrapper\n"
+            "write\n"
+            "x509\n"
+            "xa\n"
+            "xid\n"
+            "xml\n"
+            "xor\n"
+            "year\n"
+            "year_month\n"
+            "zerofill\n"
+            "zone\n"
+            "mysql\n"
+            "the\n"
+            "a\n"
+            "active\n"
+            "admin\n"
+            "array\n"
+            "attribute\n"
+            "authentication\n"
+            "buckets\n"
+            "bulk\n"
+            "challenge_response\n"
+            "clone\n"
+            "component\n"
+            "cume_dist\n"
+            "definition\n"
+            "dense_rank\n"
+            "description\n"
+            "empty\n"
+            "enforced\n"
+            "engine_attribute\n"
+            "except\n"
+            "exclude\n"
+            "factor\n"
+            "failed_login_attempts\n"
+            "finish\n"
+            "first_value\n"
+            "following\n"
+            "generate\n"
+            "geomcollection\n"
+            "get_master_public_key\n"
+            "get_source_public_key\n"
+            "grouping\n"
+            "groups\n"
+            "gtid_only\n"
+            "histogram\n"
+            "history\n"
+            "inactive\n"
+            "initial\n"
+            "initiate\n"
+            "intersect\n"
+            "invisible\n"
+            "json_table\n"
+            "json_value\n"
+            "keyring\n"
+            "lag\n"
+            "last_value\n"
+            "lateral\n"
+            "lead\n"
+            "locked\n"
+            "master_compression_algorithms\n"
+            "master_public_key_path\n"
+            "master_tls_ciphersuites\n"
+            "master_zstd_compression_level\n"
+            "member\n"
+            "nested\n"
+            "network_namespace\n"
+            "nowait\n"
+            "nth_value\n"
+            "ntile\n"
+            "nulls\n"
+            "of\n"
+            "off\n"
+            "oj\n"
+            "old\n"
+            "optional\n"
+            "ordinality\n"
+            "organization\n"
+            "others\n"
+            "over\n"
+            "password_lock_time\n"
+            "path\n"
+            "percent_rank\n"
+            "persist\n"
+            "persist_only\n"
+            "preceding\n"
+            "privilege_checks_user\n"
+            "process\n"
+            "random\n"
+            "rank\n"
+            "recursive\n"
+            "reference\n"
+            "registration\n"
+            "replica\n"
+            "replicas\n"
+            "require_row_format\n"
+            "resource\n"
+            "respect\n"
+            "restart\n"
+            "retain\n"
+            "returning\n"
+            "reuse\n"
+            "role\n"
+            "row_number\n"
+            "secondary\n"
+            "secondary_engine\n"
+            "secondary_engine_attribute\n"
+            "secondary_load\n"
+            "secondary_unload\n"
+            "skip\n"
+            "source_auto_position\n"
+            "source_bind\n"
+            "source_compression_algorithms\n"
+            "source_connect_retry\n"
+            "source_delay\n"
+            "source_heartbeat_period\n"
+            "source_host\n"
+            "source_log_file\n"
+            "source_log_pos\n"
+            "source_password\n"
+            "source_port\n"
+            "source_public_key_path\n"
+            "source_retry_count\n"
+            "source_ssl\n"
+            "source_ssl_ca\n"
+            "source_ssl_capath\n"
+            "source_ssl_cert\n"
+            "source_ssl_cipher\n"
+            "source_ssl_crl\n"
+            "source_ssl_crlpath\n"
+            "source_ssl_key\n"
+            "source_ssl_verify_server_cert\n"
+            "source_tls_ciphersuites\n"
+            "source_tls_version\n"
+            "source_user\n"
+            "source_zstd_compression_level\n"
+            "srid\n"
+            "stream\n"
+            "system\n"
+            "thread_priority\n"
+            "ties\n"
+            "tls\n"
+            "unbounded\n"
+            "unregister\n"
+            "url\n"
+            "vcpu\n"
+            "visible\n"
+            "window\n"
+            "zone\n"
+        ),
+    ),
+    (
+        "fn",
+        1000,
+        (
+            "abs\n"
+            "acos\n"
+            "adddate\n"
+            "addtime\n"
+            "aes_decrypt\n"
+            "aes_encrypt\n"
+            "and\n"
+            "any_value\n"
+            "ascii\n"
+            "asin\n"
+            "atan\n"
+            "atan2\n"
+            "atan\n"
+            "avg\n"
+            "benchmark\n"
+            "between \n"
+            "bin\n"
+            "bin_to_uuid\n"
+            "bit_and\n"
+            "bit_count\n"
+            "bit_length\n"
+            "bit_or\n"
+            "bit_xor\n"
+            "can_access_column\n"
+            "can_access_database\n"
+            "can_access_table\n"
+            "can_access_view\n"
+            "case\n"
+            "cast\n"
+            "ceil\n"
+            "ceiling\n"
+            "char\n"
+            "char_length\n"
+            "character_length\n"
+            "charset\n"
+            "coalesce\n"
+            "coercibility\n"
+            "collation\n"
+            "compress\n"
+            "concat\n"
+            "concat_ws\n"
+            "connection_id\n"
+            "conv\n"
+            "convert\n"
+            "convert_tz\n"
+            "cos\n"
+            "cot\n"
+            "count\n"
+            "count\n"
+            "crc32\n"
+            "cume_dist\n"
+            "curdate\n"
+            "current_date\n"
+            "current_date\n"
+            "current_role\n"
+            "current_time\n"
+            "current_time\n"
+            "current_timestamp\n"
+            "current_timestamp\n"
+            "current_user\n"
+            "current_user\n"
+            "curtime\n"
+            "database\n"
+            "date\n"
+            "date_add\n"
+            "date_format\n"
+            "date_sub\n"
+            "datediff\n"
+            "day\n"
+            "dayname\n"
+            "dayofmonth\n"
+            "dayofweek\n"
+            "dayofyear\n"
+            "default\n"
+            "degrees\n"
+            "dense_rank\n"
+            "div\n"
+            "elt\n"
+            "exp\n"
+            "export_set\n"
+            "extract\n"
+            "extractvalue\n"
+            "field\n"
+            "find_in_set\n"
+            "first_value\n"
+            "floor\n"
+            "format\n"
+            "found_rows\n"
+            "from_base64\n"
+            "from_days\n"
+            "from_unixtime\n"
+            "geomcollection\n"
+            "geometrycollection\n"
+            "get_dd_column_privileges\n"
+            "get_dd_create_options\n"
+            "get_dd_index_sub_part_length\n"
+            "get_format\n"
+            "get_lock\n"
+            "greatest\n"
+            "group_concat\n"
+            "grouping\n"
+            "gtid_subset\n"
+            "gtid_subtract\n"
+            "hex\n"
+            "hour\n"
+            "icu_version\n"
+            "if\n"
+            "ifnull\n"
+            "in\n"
+            "inet_aton\n"
+            "inet_ntoa\n"
+            "inet6_aton\n"
+            "inet6_ntoa\n"
+            "insert\n"
+            "instr\n"
+            "internal_auto_increment\n"
+            "internal_avg_row_length\n"
+            "internal_check_time\n"
+            "internal_checksum\n"
+            "internal_data_free\n"
+            "internal_data_length\n"
+            "internal_dd_char_length\n"
+            "internal_get_comment_or_error\n"
+            "internal_get_view_warning_or_error\n"
+            "internal_index_column_cardinality\n"
+            "internal_index_length\n"
+            "internal_keys_disabled\n"
+            "internal_max_data_length\n"
+            "internal_table_rows\n"
+            "internal_update_time\n"
+            "interval\n"
+            "is\n"
+            "is_free_lock\n"
+            "is_ipv4\n"
+            "is_ipv4_compat\n"
+            "is_ipv4_mapped\n"
+            "is_ipv6\n"
+            "is not\n"
+            "is not null\n"
+            "is null\n"
+            "is_used_lock\n"
+            "is_uuid\n"
+            "isnull\n"
+            "json_array\n"
+            "json_array_append\n"
+            "json_array_insert\n"
+            "json_arrayagg\n"
+            "json_contains\n"
+            "json_contains_path\n"
+            "json_depth\n"
+            "json_extract\n"
+            "json_insert\n"
+            "json_keys\n"
+            "json_length\n"
+            "json_merge_patch\n"
+            "json_merge_preserve\n"
+            "json_object\n"
+            "json_objectagg\n"
+            "json_pretty\n"
+            "json_quote\n"
+            "json_remove\n"
+            "json_replace\n"
+            "json_search\n"
+            "json_set\n"
+            "json_storage_free\n"
+            "json_storage_size\n"
+            "json_table\n"
+            "json_type\n"
+            "json_unquote\n"
+            "json_valid\n"
+            "lag\n"
+            "last_day\n"
+            "last_insert_id\n"
+            "last_value\n"
+            "lcase\n"
+            "lead\n"
+            "least\n"
+            "left\n"
+            "length\n"
+            "like\n"
+            "linestring\n"
+            "ln\n"
+            "load_file\n"
+            "localtime\n"
+            "localtime\n"
+            "localtimestamp\n"
+            "localtimestamp\n"
+            "locate\n"
+            "log\n"
+            "log10\n"
+            "log2\n"
+            "lower\n"
+            "lpad\n"
+            "ltrim\n"
+            "make_set\n"
+            "makedate\n"
+            "maketime\n"
+            "match\n"
+            "max\n"
+            "mbrcontains\n"
+            "mbrcoveredby\n"
+            "mbrcovers\n"
+            "mbrdisjoint\n"
+            "mbrequals\n"
+            "mbrintersects\n"
+            "mbroverlaps\n"
+            "mbrtouches\n"
+            "mbrwithin\n"
+            "md5\n"
+            "microsecond\n"
+            "mid\n"
+            "min\n"
+            "minute\n"
+            "mod\n"
+            "month\n"
+            "monthname\n"
+            "multilinestring\n"
+            "multipoint\n"
+            "multipolygon\n"
+            "name_const\n"
+            "not\n"
+            "not between \n"
+            "not in\n"
+            "not like\n"
+            "not regexp\n"
+            "now\n"
+            "nth_value\n"
+            "ntile\n"
+            "nullif\n"
+            "oct\n"
+            "octet_length\n"
+            "or\n"
+            "ord\n"
+            "percent_rank\n"
+            "period_add\n"
+            "period_diff\n"
+            "pi\n"
+            "point\n"
+            "polygon\n"
+            "position\n"
+            "pow\n"
+            "power\n"
+            "quarter\n"
+            "quote\n"
+            "radians\n"
+            "rand\n"
+            "random_bytes\n"
+            "rank\n"
+            "regexp\n"
+            "regexp_instr\n"
+            "regexp_like\n"
+            "regexp_replace\n"
+            "regexp_substr\n"
+            "release_all_locks\n"
+            "release_lock\n"
+            "repeat\n"
+            "replace\n"
+            "reverse\n"
+            "right\n"
+            "rlike\n"
+            "roles_graphml\n"
+            "round\n"
+            "row_count\n"
+            "row_number\n"
+            "rpad\n"
+            "rtrim\n"
+            "schema\n"
+            "sec_to_time\n"
+            "second\n"
+            "session_user\n"
+            "sha1\n"
+            "sha\n"
+            "sha2\n"
+            "sign\n"
+            "sin\n"
+            "sleep\n"
+            "soundex\n"
+            "sounds like\n"
+            "space\n"
+            "sqrt\n"
+            "st_area\n"
+            "st_asbinary\n"
+            "st_aswkb\n"
+            "st_asgeojson\n"
+            "st_astext\n"
+            "st_aswkt\n"
+            "st_buffer\n"
+            "st_buffer_strategy\n"
+            "st_centroid\n"
+            "st_contains\n"
+            "st_convexhull\n"
+            "st_crosses\n"
+            "st_difference\n"
+            "st_dimension\n"
+            "st_disjoint\n"
+            "st_distance\n"
+            "st_distance_sphere\n"
+            "st_endpoint\n"
+            "st_envelope\n"
+            "st_equals\n"
+            "st_exteriorring\n"
+            "st_geohash\n"
+            "st_geomcollfromtext\n"
+            "st_geometrycollectionfromtext\n"
+            "st_geomcollfromtxt\n"
+            "st_geomcollfromwkb\n"
+            "st_geometrycollectionfromwkb\n"
+            "st_geometryn\n"
+            "st_geometrytype\n"
+            "st_geomfromgeojson\n"
+            "st_geomfromtext\n"
+            "st_geometryfromtext\n"
+            "st_geomfromwkb\n"
+            "st_geometryfromwkb\n"
+            "st_interiorringn\n"
+            "st_intersection\n"
+            "st_intersects\n"
+            "st_isclosed\n"
+            "st_isempty\n"
+            "st_issimple\n"
+            "st_isvalid\n"
+            "st_latfromgeohash\n"
+            "st_length\n"
+            "st_linefromtext\n"
+            "st_linestringfromtext\n"
+            "st_linefromwkb\n"
+            "st_linestringfromwkb\n"
+            "st_longfromgeohash\n"
+            "st_makeenvelope\n"
+            "st_mlinefromtext\n"
+            "st_multilinestringfromtext\n"
+            "st_mlinefromwkb\n"
+            "st_multilinestringfromwkb\n"
+            "st_mpointfromtext\n"
+            "st_multipointfromtext\n"
+            "st_mpointfromwkb\n"
+            "st_multipointfromwkb\n"
+            "st_mpolyfromtext\n"
+            "st_multipolygonfromtext\n"
+            "st_mpolyfromwkb\n"
+            "st_multipolygonfromwkb\n"
+            "st_numgeometries\n"
+            "st_numinteriorring\n"
+            "st_numinteriorrings\n"
+            "st_numpoints\n"
+            "st_overlaps\n"
+            "st_pointfromgeohash\n"
+            "st_pointfromtext\n"
+            "st_pointfromwkb\n"
+            "st_pointn\n"
+            "st_polyfromtext\n"
+            "st_polygonfromtext\n"
+            "st_polyfromwkb\n"
+            "st_polygonfromwkb\n"
+            "st_simplify\n"
+            "st_srid\n"
+            "st_startpoint\n"
+            "st_swapxy\n"
+            "st_symdifference\n"
+            "st_touches\n"
+            "st_union\n"
+            "st_validate\n"
+            "st_within\n"
+            "st_x\n"
+            "st_y\n"
+            "statement_digest\n"
+            "statement_digest_text\n"
+            "std\n"
+            "stddev\n"
+            "stddev_pop\n"
+            "stddev_samp\n"
+            "str_to_date\n"
+            "strcmp\n"
+            "subdate\n"
+            "substr\n"
+            "substring\n"
+            "substring_index\n"
+            "subtime\n"
+            "sum\n"
+            "sysdate\n"
+            "system_user\n"
+            "tan\n"
+            "time\n"
+            "time_format\n"
+            "time_to_sec\n"
+            "timediff\n"
+            "timestamp\n"
+            "timestampadd\n"
+            "timestampdiff\n"
+            "to_base64\n"
+            "to_days\n"
+            "to_seconds\n"
+            "trim\n"
+            "truncate\n"
+            "ucase\n"
+            "uncompress\n"
+            "uncompressed_length\n"
+            "unhex\n"
+            "unix_timestamp\n"
+            "updatexml\n"
+            "upper\n"
+            "user\n"
+            "utc_date\n"
+            "utc_time\n"
+            "utc_timestamp\n"
+            "uuid\n"
+            "uuid_short\n"
+            "uuid_to_bin\n"
+            "validate_password_strength\n"
+            "values\n"
+            "var_pop\n"
+            "var_samp\n"
+            "variance\n"
+            "version\n"
+            "wait_for_executed_gtid_set\n"
+            "week\n"
+            "weekday\n"
+            "weekofyear\n"
+            "weight_string\n"
+            "xor\n"
+            "year\n"
+            "yearweek\n"
+        ),
+    ),
+)
+
+# the other completions, as (label, type_label, priority, since, until).
+VERSIONED: tuple[tuple[str, str, int, tuple[int, ...], tuple[int, ...] | None], ...] = (
+    ("analyse", "kw", 100, (), (8, 0, 0)),
+    ("des_key_file", "kw", 100, (), (8, 0, 0)),
+    ("master_server_id", "kw", 100, (), (8, 0, 0)),
+    ("redofile", "kw", 100, (), (8, 0, 0)),
+    ("remote", "kw", 100, (), (8, 0, 0)),
+    ("sql_cache", "kw", 100, (), (8, 0, 0)),
+    ("asynchronous_connection_failover_add_managed", "fn", 1000, (8, 0, 23), None),
+    ("asynchronous_connection_failover_add_source", "fn", 1000, (8, 0, 22), None),
+    ("asynchronous_connection_failover_delete_managed", "fn", 1000, (8, 0, 23), None),
+    ("asynchronous_connection_failover_delete_source", "fn", 1000, (8, 0, 22), None),
+    ("asynchronous_connection_failover_reset", "fn", 1000, (8, 0, 27), None),
+    ("binary", "fn", 1000, (), (8, 0, 27)),
+    ("can_access_user", "fn", 1000, (8, 0, 22), None),
+    ("format_bytes", "fn", 1000, (8, 0, 16), None),
+    ("format_pico_time", "fn", 1000, (8, 0, 16), None),
+    ("group_replication_disable_member_action", "fn", 1000, (8, 0, 26), None),
+    ("group_replication_enable_member_action", "fn", 1000, (8, 0, 26), None),
+    ("group_replication_get_communication_protocol", "fn", 1000, (8, 0, 16), None),
+    ("group_replication_get_write_concurrency", "fn", 1000, (8, 0, 13), None),
+    ("group_replication_reset_member_actions", "fn", 1000, (8, 0, 26), None),
+    ("group_replication_set_as_primary", "fn", 1000, (8, 0, 29), None),
+    ("group_replication_set_communication_protocol", "fn", 1000, (8, 0, 16), None),
+    ("group_replication_set_write_concurrency", "fn", 1000, (8, 0, 13), None),
+    ("group_replication_switch_to_multi_primary_mode", "fn", 1000, (8, 0, 13), None),
+    ("group_replication_switch_to_single_primary_mode", "fn", 1000, (8, 0, 13), None),
+    ("internal_get_enabled_role_json", "fn", 1000, (8, 0, 19), None),
+    ("internal_get_hostname", "fn", 1000, (8, 0, 19), None),
+    ("internal_get_username", "fn", 1000, (8, 0, 19), None),
+    ("internal_is_enabled_role", "fn", 1000, (8, 0, 19), None),
+    ("internal_is_mandatory_role", "fn", 1000, (8, 0, 19), None),
+    ("json_merge", "fn", 1000, (), ()),
+    ("json_overlaps", "fn", 1000, (8, 0, 17), None),
+    ("json_schema_valid", "fn", 1000, (8, 0, 17), None),
+    ("json_schema_validation_report", "fn", 1000, (8, 0, 17), None),
+    ("json_value", "fn", 1000, (8, 0, 21), None),
+    ("master_pos_wait", "fn", 1000, (), (8, 0, 26)),
+    ("member of", "fn", 1000, (8, 0, 17), None),
+    ("ps_current_thread_id", "fn", 1000, (8, 0, 16), None),
+    ("ps_thread_id", "fn", 1000, (8, 0, 16), None),
+    ("source_pos_wait", "fn", 1000, (8, 0, 26), None),
+    ("st_collect", "fn", 1000, (8, 0, 24), None),
+    ("st_frechetdistance", "fn", 1000, (8, 0, 23), None),
+    ("st_hausdorffdistance", "fn", 1000, (8, 0, 23), None),
+    ("st_latitude", "fn", 1000, (8, 0, 12), None),
+    ("st_lineinterpolatepoint", "fn", 1000, (8, 0, 24), None),
+    ("st_lineinterpolatepoints", "fn", 1000, (8, 0, 24), None),
+    ("st_longitude", "fn", 1000, (8, 0, 12), None),
+    ("st_pointatdistance", "fn", 1000, (8, 0, 24), None),
+    ("st_transform", "fn", 1000, (8, 0, 13), None),
+    ("wait_until_sql_thread_after_gtids", "fn", 1000, (), (8, 0, 18)),
+)
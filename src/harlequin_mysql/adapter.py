@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import logging
 import re
-from contextlib import suppress
-from typing import Any, Sequence
+import threading
+import time
+from contextlib import closing, suppress
+from typing import Any, Generator, Iterator, Sequence, TypeVar, cast
 
+import mysql.connector
+import pyarrow as pa
 from harlequin import (
     HarlequinAdapter,
     HarlequinConnection,
@@ -11,28 +16,115 @@ from harlequin import (
 )
 from harlequin.autocomplete.completion import HarlequinCompletion
 from harlequin.catalog import Catalog, CatalogItem
+from harlequin.driver import HarlequinDriver
 from harlequin.exception import (
     HarlequinConfigError,
     HarlequinConnectionError,
     HarlequinQueryError,
 )
 from mysql.connector import FieldType
+from mysql.connector.connection import MySQLConnection
 from mysql.connector.cursor import MySQLCursor
-from mysql.connector.errors import InternalError, PoolError
+from mysql.connector.errors import Error, InternalError, PoolError
 from mysql.connector.pooling import (
-    MySQLConnectionPool,
     PooledMySQLConnection,
 )
+from textual.notifications import SeverityLevel
+from textual.worker import NoActiveWorker, get_current_worker
 from textual_fastdatatable.backend import AutoBackendType
 
-from harlequin_mysql.catalog import DatabaseCatalogItem
-from harlequin_mysql.cli_options import MYSQLADAPTER_OPTIONS
+from harlequin_mysql.arrow import batches_to_table, fetch_arrow_table
+from harlequin_mysql.catalog import (
+    DatabaseCatalogItem,
+    RelationCatalogItem,
+    TableCatalogItem,
+    ViewCatalogItem,
+    build_catalog_tree,
+)
+from harlequin_mysql.catalog_cache import CatalogCache
+from harlequin_mysql.cli_options import (
+    EXPLAIN_MODES,
+    LIMIT_PUSHDOWN_MODES,
+    MYSQLADAPTER_OPTIONS,
+)
 from harlequin_mysql.completions import load_completions
+from harlequin_mysql.control import CancelStats, ControlConnection
+from harlequin_mysql.explain import (
+    ANALYZE_MIN_VERSION,
+    PLAN_COLUMNS,
+    PlanNode,
+    flagged_nodes,
+    parse_json_plan,
+    parse_tree_plan,
+)
+from harlequin_mysql.keys import RelationKeys, group_key_rows
+from harlequin_mysql.pool import (
+    DEFAULT_IDLE_TIMEOUT_SECONDS,
+    DEFAULT_TIMEOUT_SECONDS,
+    HarlequinConnectionPool,
+    PoolStats,
+)
+from harlequin_mysql.preview import preview_query
+from harlequin_mysql.result_cache import (
+    DEFAULT_TTL_SECONDS,
+    CachedResult,
+    ResultCache,
+    ResultCacheStats,
+    ResultKey,
+    result_nbytes,
+)
+from harlequin_mysql.schema_completions import (
+    DEFAULT_MAX_COMPLETIONS,
+    SchemaCompletionIndex,
+)
+from harlequin_mysql.server import ServerInfo, parse_server_info
+from harlequin_mysql.statement_stats import (
+    DigestSummary,
+    StatementStats,
+    StatementStatsLog,
+    statement_stats_query,
+)
+from harlequin_mysql.statements import (
+    CatalogChange,
+    add_limit,
+    add_max_execution_time,
+    can_prepare,
+    is_analyzable,
+    is_cacheable,
+    is_explainable,
+    is_read_only,
+    parse_catalog_changes,
+)
+from harlequin_mysql.streaming import (
+    StreamStats,
+    count_unread_rows,
+    format_bytes,
+    parse_bytes,
+    stream_record_batches,
+)
+from harlequin_mysql.tracing import (
+    FirstRowTimer,
+    QueryTrace,
+    TraceHook,
+    make_trace_hook,
+)
+
+logger = logging.getLogger(__name__)
 
 USE_DATABASE_PROG = re.compile(
     r"\s*use\s+([^\\/?%*:|\"<>.]{1,64})", flags=re.IGNORECASE
 )
 QUERY_INTERRUPT_MSG = "1317 (70100): Query execution was interrupted"
+# MySQL's ER_QUERY_TIMEOUT and MariaDB's ER_STATEMENT_TIMEOUT.
+EXECUTION_TIME_ERRNOS = (3024, 1969)
+# ER_UNSUPPORTED_PS: the statement can't be run as a prepared statement.
+UNSUPPORTED_PS_ERRNO = 1295
+SYSTEM_SCHEMAS = ("sys", "information_schema", "performance_schema", "mysql")
+METADATA_BATCH_SIZE = 5_000
+# the number of connections reserved for catalog and completion queries.
+DEFAULT_METADATA_POOL_SIZE = 2
+# how long get_completions() waits for the current database's names to load.
+SCHEMA_COMPLETIONS_TIMEOUT = 5.0
 
 
 class HarlequinMySQLCursor(HarlequinCursor):
@@ -42,6 +134,12 @@ class HarlequinMySQLCursor(HarlequinCursor):
         conn: PooledMySQLConnection,
         harlequin_conn: HarlequinMySQLConnection,
         *_: Any,
+        query: str | None = None,
+        server_limit: int | None = None,
+        cache_key: ResultKey | None = None,
+        prepared: bool = False,
+        raw: bool = False,
+        trace: QueryTrace | None = None,
         **__: Any,
     ) -> None:
         self.cur = cur
@@ -54,35 +152,282 @@ class HarlequinMySQLCursor(HarlequinCursor):
         self.harlequin_conn = harlequin_conn
         self.connection_id = conn._cnx.connection_id
         self._limit: int | None = None
+        # the original query and the LIMIT we appended to it, if the
+        # connection pushed a limit down to the server.
+        self._query = query
+        self._server_limit = server_limit
+        # where to save the result in the connection's result cache.
+        self._cache_key = cache_key
+        self._interrupted = False
+        # set if the connection was closed mid-result, so it must not be
+        # returned to the pool.
+        self._abandoned = False
+        # prepared statements return rows in the binary protocol, which
+        # can't be read by consume_results().
+        self._binary = prepared
+        # raw cursors return undecoded bytes, which are only converted
+        # (to Arrow) after they are fetched.
+        self._raw = raw
+        self.stream_stats: StreamStats | None = None
+        # only set if the connection has trace hooks.
+        self._trace = trace
+        self._fetch_started_at: float | None = None
+        # the server's statistics for this query, with --statement-stats.
+        self.statement_stats: StatementStats | None = None
+        if trace is not None:
+            trace.connection_id = self.connection_id
+            self.cur = cast(MySQLCursor, FirstRowTimer(cur, trace))
 
     def columns(self) -> list[tuple[str, str]]:
         return [(col[0], self._get_short_type(col[1])) for col in self.description]
 
     def set_limit(self, limit: int) -> "HarlequinMySQLCursor":
         self._limit = limit
+        self.harlequin_conn._last_limit = limit
+        if self._server_limit is not None and limit > self._server_limit:
+            self._reexecute_with_limit(limit)
         return self
 
     def fetchall(self) -> AutoBackendType:
+        conn = self.harlequin_conn
+        if self._trace is not None:
+            self._fetch_started_at = time.perf_counter()
+        if (
+            conn.fetch_memory_budget is not None
+            or conn.max_result_rows is not None
+            or conn.max_result_bytes is not None
+        ):
+            batches = list(
+                self.iter_batches(
+                    max_rows=self._limit, max_bytes=conn.fetch_memory_budget
+                )
+            )
+            table = batches_to_table(batches, self.description)
+            self._cache_result(table)
+            return table
         try:
-            if self._limit is None:
+            results: AutoBackendType
+            if self.harlequin_conn.arrow_fetch or self._raw:
+                results = fetch_arrow_table(
+                    self.cur, self.description, limit=self._limit, raw=self._raw
+                )
+            elif self._limit is None:
                 results = self.cur.fetchall()
             else:
                 results = self.cur.fetchmany(self._limit)
+            if self._limit is not None and self.harlequin_conn.limit_pushdown != "off":
+                self._stop_early(kill=self.harlequin_conn.limit_pushdown == "kill")
+            self._cache_result(results)
+            if self._trace is not None:
+                self._trace.rows = len(results)
+                self._trace.bytes = result_nbytes(results)
             return results
         except Exception as e:
+            if self._trace is not None:
+                self._trace.error = str(e)
             if str(e) == QUERY_INTERRUPT_MSG:
                 return []
             else:
-                raise HarlequinQueryError(
-                    msg=str(e),
-                    title="Harlequin encountered an error while executing your query.",
-                ) from e
+                raise self.harlequin_conn._query_error(e) from e
         finally:
-            self.conn.consume_results()
-            self.cur.close()
+            self._release()
+
+    def iter_batches(
+        self,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Streams the result set as Arrow record batches, stopping before
+        max_rows rows or max_bytes bytes have been yielded. After iteration,
+        stream_stats records how much was fetched and how much was left
+        unfetched. The connection is returned to the pool when the iterator
+        is exhausted or closed.
+
+        If batch_size is None, batches are sized to hold a roughly constant
+        number of bytes.
+
+        If the result is larger than --max-result-rows or --max-result-bytes,
+        the query is stopped, and a HarlequinQueryError is raised after the
+        batches that fit.
+        """
+        conn = self.harlequin_conn
+        if self._trace is not None and self._fetch_started_at is None:
+            self._fetch_started_at = time.perf_counter()
+        rows_cap = _min(max_rows, conn.max_result_rows)
+        bytes_cap = _min(max_bytes, conn.max_result_bytes)
+        self.stream_stats = stats = StreamStats()
+        governed = False
+        try:
+            yield from stream_record_batches(
+                self.cur,
+                self.description,
+                stats,
+                max_rows=rows_cap,
+                max_bytes=bytes_cap,
+                batch_size=batch_size,
+                raw=self._raw,
+            )
+            # the governor's limit was stricter than the caller's.
+            governed = (stats.stopped_by == "rows" and rows_cap != max_rows) or (
+                stats.stopped_by == "bytes" and bytes_cap != max_bytes
+            )
+            if stats.stopped_by is not None:
+                self._count_unfetched(stats, stop=governed)
+        except Exception as e:
+            if self._trace is not None:
+                self._trace.error = str(e)
+            if str(e) != QUERY_INTERRUPT_MSG:
+                raise conn._query_error(e) from e
+            self._interrupted = True
+        finally:
+            self._release()
+        if governed and stats.truncated:
+            raise _result_too_large_error(stats, rows_cap, bytes_cap)
+
+    def _count_unfetched(self, stats: StreamStats, stop: bool = False) -> None:
+        """
+        Records how much of the result set was left unfetched, and tells the
+        user if it was truncated. If stop is True, or the limit is pushed
+        down, the query is stopped instead of reading the rest of its result.
+
+        Otherwise, the rest of the result has to be read off the connection
+        before it is returned to the pool anyway, so it is counted as it is
+        read, without converting it to Python objects.
+        """
+        limit_pushdown = self.harlequin_conn.limit_pushdown
+        if stop or limit_pushdown != "off":
+            if self._stop_early(kill=stop or limit_pushdown == "kill"):
+                stats.unfetched_rows = stats.unfetched_bytes = None
+        else:
+            rows, nbytes = count_unread_rows(
+                self.conn, columns=self.description if self._binary else None
+            )
+            assert stats.unfetched_rows is not None
+            assert stats.unfetched_bytes is not None
+            stats.unfetched_rows += rows
+            stats.unfetched_bytes += nbytes
+        if stats.truncated and not stop:
+            logger.warning(stats.message)
+            _notify(stats.message)
+
+    def _cache_result(self, results: AutoBackendType) -> None:
+        cache = self.harlequin_conn.result_cache
+        if cache is None or self._cache_key is None or self._interrupted:
+            return
+        database, query, _ = self._cache_key
+        # Harlequin may have changed the limit since the query was executed.
+        cache.put((database, query, self._limit), self.description, results)
+
+    def cancel(self) -> bool:
+        """
+        Cancels this cursor's query, without affecting other queries. Returns
+        True if the KILL QUERY statement was sent.
+        """
+        if not self.connection_id:
+            return False
+        return self.harlequin_conn.cancel_connection(self.connection_id)
+
+    def _release(self) -> None:
+        """
+        Reads any unread results, closes the cursor, and returns the
+        connection to the pool.
+        """
+        released_at = time.perf_counter()
+        if self._abandoned:
+            pool = getattr(self.conn, "_cnx_pool", None)
+            if isinstance(pool, HarlequinConnectionPool):
+                pool.discard(self.conn._cnx)
+        else:
+            with suppress(Error):
+                self._consume_results()
+                self.cur.close()
+            self.statement_stats = self.harlequin_conn._collect_statement_stats(
+                self.connection_id
+            )
             self.conn.close()
-            if self.connection_id:
-                self.harlequin_conn._in_use_connections.discard(self.connection_id)
+        if self.connection_id:
+            self.harlequin_conn._in_use_connections.discard(self.connection_id)
+        if self._trace is not None:
+            self._finish_trace(self._trace, released_at)
+
+    def _finish_trace(self, trace: QueryTrace, released_at: float) -> None:
+        fetch_started_at = self._fetch_started_at
+        if fetch_started_at is not None:
+            if trace.first_row_at is not None:
+                trace.add_span("first_row", fetch_started_at, trace.first_row_at)
+            trace.add_span("fetch", fetch_started_at, released_at)
+        trace.add_span("release", released_at)
+        if self.stream_stats is not None:
+            trace.rows = self.stream_stats.rows
+            trace.bytes = self.stream_stats.bytes
+        self._trace = None
+        self.harlequin_conn._emit_trace(trace)
+
+    def _consume_results(self) -> None:
+        if not self._binary:
+            self.conn.consume_results()
+        elif self.conn.unread_result:
+            self.conn.get_rows(binary=True, columns=self.description)
+
+    def _reexecute_with_limit(self, limit: int) -> None:
+        """
+        The query was rewritten with a smaller LIMIT than the one Harlequin
+        asked for (the limit changed since the last query), so we run it
+        again with the new limit. The first result is bounded by the old
+        limit, so it is cheap to drain.
+        """
+        assert self._query is not None
+        query = add_limit(self._query, limit)
+        assert query is not None
+        query = self.harlequin_conn._limit_execution_time(query)
+        try:
+            self._consume_results()
+            self.cur.execute(query)
+        except Exception as e:
+            raise self.harlequin_conn._query_error(e) from e
+        self._server_limit = limit
+
+    def _stop_early(self, kill: bool = False) -> bool:
+        """
+        We have all the rows we need. If the server is still sending rows,
+        stop it instead of reading (and throwing away) the rest of the
+        result set in the finally block of fetchall(): with KILL QUERY if
+        kill is True, or else by closing the connection, which is then
+        dropped from the pool.
+
+        The C extension can't close a connection without reading the rest
+        of its result, so with it, the query is also killed before the
+        connection is closed.
+
+        Returns True if there were more rows to stop.
+        """
+        if not self.conn.unread_result:
+            return False
+        # read one more row to see if the result set is really unfinished;
+        # killing a query that has already finished is not safe, since the
+        # kill could interrupt the next query on this connection.
+        if self.cur.fetchone() is None:
+            return False
+        cnx = self.conn._cnx
+        can_shutdown = isinstance(cnx, MySQLConnection)
+        if (kill or not can_shutdown) and self.connection_id:
+            killed = self.harlequin_conn.cancel_connection(self.connection_id)
+            if killed and kill:
+                # the server will abort the result with an error packet
+                # once it sees the KILL.
+                with suppress(Error):
+                    self._consume_results()
+                return True
+        self._abandoned = True
+        with suppress(Exception):
+            if can_shutdown:
+                # closes the socket without reading the rest of the result.
+                cnx.shutdown()
+            else:
+                cnx.disconnect()
+        return True
 
     @staticmethod
     def _get_short_type(type_id: int) -> str:
@@ -119,6 +464,74 @@ class HarlequinMySQLCursor(HarlequinCursor):
         return mapping.get(type_id, "?")
 
 
+class HarlequinMySQLCachedCursor(HarlequinCursor):
+    """
+    A result served from the connection's result cache, without running the
+    query. If Harlequin asks for a different limit than the cached result
+    was fetched with, the query is executed again.
+    """
+
+    def __init__(
+        self,
+        entry: CachedResult,
+        harlequin_conn: HarlequinMySQLConnection,
+        *_: Any,
+        query: str,
+        limit: int | None,
+        **__: Any,
+    ) -> None:
+        self.description = entry.description
+        self.harlequin_conn = harlequin_conn
+        self._entry = entry
+        self._query = query
+        self._cached_limit = limit
+        self._limit = limit
+
+    def columns(self) -> list[tuple[str, str]]:
+        return [
+            (col[0], HarlequinMySQLCursor._get_short_type(col[1]))
+            for col in self.description
+        ]
+
+    def set_limit(self, limit: int) -> "HarlequinMySQLCachedCursor":
+        self._limit = limit
+        self.harlequin_conn._last_limit = limit
+        return self
+
+    def fetchall(self) -> AutoBackendType:
+        if self._limit == self._cached_limit:
+            results: AutoBackendType = self._entry.data
+            return results
+        cur = self.harlequin_conn.execute(self._query)
+        if cur is None:
+            return []
+        if self._limit is not None:
+            cur.set_limit(self._limit)
+        return cur.fetchall()
+
+
+class HarlequinMySQLPlanCursor(HarlequinCursor):
+    """
+    A query plan, parsed from the output of EXPLAIN, shown as a result set
+    with one row per plan node, indented by its depth in the plan tree.
+    """
+
+    def __init__(self, nodes: Sequence[PlanNode], *_: Any, **__: Any) -> None:
+        self.nodes = list(nodes)
+        self._limit: int | None = None
+
+    def columns(self) -> list[tuple[str, str]]:
+        return list(PLAN_COLUMNS)
+
+    def set_limit(self, limit: int) -> "HarlequinMySQLPlanCursor":
+        self._limit = limit
+        return self
+
+    def fetchall(self) -> AutoBackendType:
+        rows = [node.as_row() for node in self.nodes]
+        return rows if self._limit is None else rows[: self._limit]
+
+
 class HarlequinMySQLConnection(HarlequinConnection):
     def __init__(
         self,
@@ -126,30 +539,159 @@ class HarlequinMySQLConnection(HarlequinConnection):
         *_: Any,
         init_message: str = "",
         options: dict[str, Any],
+        adapter_options: dict[str, Any] | None = None,
     ) -> None:
         self.init_message = init_message
         self._in_use_connections: set[int] = set()
-        try:
-            self._pool: MySQLConnectionPool = MySQLConnectionPool(
-                pool_name="harlequin",
-                pool_reset_session=False,
-                autocommit=True,
-                **options,
+        adapter_options = adapter_options or {}
+        self.limit_pushdown: str = adapter_options.get("limit_pushdown", "off")
+        self.explain_mode: str = adapter_options.get("explain", "off")
+        self.arrow_fetch: bool = adapter_options.get("arrow_fetch", False)
+        self.fetch_memory_budget: int | None = adapter_options.get(
+            "fetch_memory_budget"
+        )
+        self.max_execution_time: float | None = adapter_options.get(
+            "max_execution_time"
+        )
+        self.max_result_rows: int | None = adapter_options.get("max_result_rows")
+        self.max_result_bytes: int | None = adapter_options.get("max_result_bytes")
+        self.result_cache: ResultCache | None = (
+            ResultCache(
+                max_bytes=adapter_options["result_cache_size"],
+                ttl=adapter_options.get("result_cache_ttl", DEFAULT_TTL_SECONDS),
+            )
+            if adapter_options.get("result_cache_size")
+            else None
+        )
+        self.prepared_statements: bool = adapter_options.get(
+            "prepared_statements", False
+        )
+        self.raw_fetch: bool = adapter_options.get("raw_fetch", False)
+        self.statement_stats: StatementStatsLog | None = (
+            StatementStatsLog() if adapter_options.get("statement_stats") else None
+        )
+        # turned off if performance_schema can't be read.
+        self._statement_stats_available = True
+        self._trace_hooks: list[TraceHook] = (
+            [adapter_options["query_trace"]]
+            if adapter_options.get("query_trace")
+            else []
+        )
+        self.bulk_catalog: bool = adapter_options.get("bulk_catalog", False)
+        self.catalog_cache: CatalogCache | None = (
+            CatalogCache(key=adapter_options["catalog_cache_key"])
+            if adapter_options.get("catalog_cache")
+            and adapter_options.get("catalog_cache_key")
+            else None
+        )
+        self._catalog_cache_lock = threading.Lock()
+        self._catalog_cache_started = False
+        # the tree returned by the last call to get_catalog(), and the DDL
+        # executed since then, so we can refresh only what changed.
+        self._catalog_items: list[DatabaseCatalogItem] | None = None
+        self._catalog_changes: list[CatalogChange] = []
+        self._catalog_changes_lock = threading.Lock()
+        self._catalog_cache_thread: threading.Thread | None = None
+        self._server_info: ServerInfo | None = None
+        self.schema_completions: SchemaCompletionIndex | None = (
+            SchemaCompletionIndex(
+                max_completions=adapter_options.get(
+                    "schema_completions_limit", DEFAULT_MAX_COMPLETIONS
+                )
             )
+            if adapter_options.get("schema_completions")
+            else None
+        )
+        self._schema_completions_lock = threading.Lock()
+        self._schema_completions_thread: threading.Thread | None = None
+        # the list returned by get_completions(), and the keyword and
+        # function completions at its start.
+        self._completions: list[HarlequinCompletion] | None = None
+        self._base_completions: list[HarlequinCompletion] = []
+        # the limit Harlequin passed to the last cursor. Harlequin uses the
+        # same limit for every query, so we can push it down to the server
+        # before it is set on the next cursor.
+        self._last_limit: int | None = None
+        try:
+            self._open_pools(options, adapter_options)
+            self._open_control(options)
         except Exception as e:
             raise HarlequinConnectionError(
                 msg=str(e), title="Harlequin could not connect to your database."
             ) from e
+        if self.schema_completions is not None:
+            self._schema_completions_thread = threading.Thread(
+                target=self._build_schema_completions,
+                name="harlequin-mysql-schema-completions",
+                daemon=True,
+            )
+            self._schema_completions_thread.start()
+
+    def _open_pools(
+        self, options: dict[str, Any], adapter_options: dict[str, Any]
+    ) -> None:
+        pool_size = options.get("pool_size") or 5
+        max_size = adapter_options.get("pool_max_size") or 2 * pool_size
+        timeout = adapter_options.get("pool_timeout", DEFAULT_TIMEOUT_SECONDS)
+        # catalog and completion queries get their own, small pool, so
+        # they aren't starved by long-running user queries. Its
+        # connections are opened on first use.
+        metadata_pool_size = adapter_options.get(
+            "metadata_pool_size", DEFAULT_METADATA_POOL_SIZE
+        )
+        self._metadata_pool: HarlequinConnectionPool | None = None
+        if self.raw_fetch:
+            options = {**options, "use_pure": False}
+        self._pool = HarlequinConnectionPool(
+            pool_name="harlequin",
+            max_size=max_size,
+            timeout=timeout,
+            idle_timeout=adapter_options.get(
+                "pool_idle_timeout", DEFAULT_IDLE_TIMEOUT_SECONDS
+            ),
+            autocommit=True,
+            **options,
+        )
+        # opens one connection now, and the rest in the background.
+        self._pool.warm_up()
+        self._server_info = parse_server_info(self._pool.server_info or "")
+        if metadata_pool_size > 0:
+            self._metadata_pool = HarlequinConnectionPool(
+                pool_name="harlequin-metadata",
+                timeout=timeout,
+                autocommit=True,
+                **{**options, "pool_size": metadata_pool_size},
+            )
+
+    def _open_control(self, options: dict[str, Any]) -> None:
+        """
+        Opens a connection outside of the pools, for KILL QUERY, in the
+        background, so it's ready before the first cancel.
+        """
+        control_options = {
+            k: v for k, v in options.items() if k not in ("pool_size", "database")
+        }
+        self._control = ControlConnection(**control_options)
+        threading.Thread(
+            target=self._control.open,
+            name="harlequin-mysql-control",
+            daemon=True,
+        ).start()
 
     def safe_get_mysql_cursor(
-        self, buffered: bool = False
+        self,
+        buffered: bool = False,
+        metadata: bool = False,
+        timeout: float | None = None,
     ) -> tuple[PooledMySQLConnection | None, MySQLCursor | None]:
         """
         Return None if the connection pool is exhausted, to avoid getting
         in an unrecoverable state.
         """
         try:
-            conn = self._pool.get_connection()
+            return self.get_mysql_cursor(
+                buffered=buffered, metadata=metadata, timeout=timeout
+            )
         except (InternalError, PoolError):
             # if we're out of connections, we can't raise a query error,
             # or we get in a state where we have cursors without fetched
@@ -159,16 +701,67 @@ class HarlequinMySQLConnection(HarlequinConnection):
             # all the other cursors).
             return None, None
 
+    def get_mysql_cursor(
+        self,
+        buffered: bool = False,
+        metadata: bool = False,
+        prepared: bool = False,
+        raw: bool = False,
+        timeout: float | None = None,
+    ) -> tuple[PooledMySQLConnection, MySQLCursor]:
+        """
+        Gets a connection from the pool, waiting for one if they are all in
+        use, and opens a cursor. Raises PoolError if no connection becomes
+        available before timeout seconds (or the pool's timeout, if it is
+        None).
+
+        If metadata is True, the connection comes from the metadata pool
+        (if there is one), which is reserved for catalog and completion
+        queries.
+
+        If prepared is True, the cursor runs queries as prepared statements,
+        using the binary protocol. If raw is True, the cursor returns values
+        as the bytes sent by the server, without converting them.
+        """
+        pool = self._metadata_pool if metadata and self._metadata_pool else self._pool
+        conn = pool.get_connection(timeout=timeout)
         try:
-            cur: MySQLCursor = conn.cursor(buffered=buffered)
+            cur: MySQLCursor = conn.cursor(
+                buffered=buffered, prepared=prepared, raw=raw
+            )
         except InternalError:
             # cursor has an unread result. Try to consume the results,
             # and try again.
             conn.consume_results()
-            cur = conn.cursor(buffered=buffered)
+            cur = conn.cursor(buffered=buffered, prepared=prepared, raw=raw)
 
         return conn, cur
 
+    @property
+    def pool_stats(self) -> PoolStats:
+        """
+        The connection pool's size, utilization, and wait times, which can
+        be used to choose --pool-size and --pool-max-size.
+        """
+        return self._pool.stats()
+
+    @property
+    def metadata_pool_stats(self) -> PoolStats | None:
+        """
+        The metadata pool's size, utilization, and wait times, or None if
+        catalog queries share the main pool.
+        """
+        return self._metadata_pool.stats() if self._metadata_pool else None
+
+    @property
+    def current_database(self) -> str | None:
+        """
+        The database used by new connections from the pool, which is updated
+        when the user runs a USE statement.
+        """
+        database: str | None = self._pool.config.get("database")
+        return database
+
     def set_pool_config(self, **config: Any) -> None:
         """
         Updates the config of the MySQL connection pool.
@@ -176,38 +769,330 @@ class HarlequinMySQLConnection(HarlequinConnection):
         self._pool.set_config(**config)
 
     def execute(self, query: str) -> HarlequinCursor | None:
+        if self.explain_mode != "off" and is_explainable(query):
+            return self.explain(query, analyze=self.explain_mode == "analyze")
         retval: HarlequinCursor | None = None
+        cache_key: ResultKey | None = None
+        if self.result_cache is not None and is_cacheable(query):
+            cache_key = ResultCache.key(self.current_database, query, self._last_limit)
+            if (entry := self.result_cache.get(cache_key)) is not None:
+                return HarlequinMySQLCachedCursor(
+                    entry, harlequin_conn=self, query=query, limit=self._last_limit
+                )
 
-        conn, cur = self.safe_get_mysql_cursor()
-        if conn is None or cur is None:
-            return None
-        else:
-            connection_id = conn._cnx.connection_id
-            if connection_id:
-                self._in_use_connections.add(connection_id)
+        trace = QueryTrace(query=query) if self._trace_hooks else None
+        server_query, server_limit = self._push_down_limit(query)
+        server_query = self._limit_execution_time(server_query)
+        # raw cursors use the text protocol.
+        prepared = (
+            self.prepared_statements
+            and not self.raw_fetch
+            and can_prepare(server_query)
+        )
+        checkout_started_at = time.perf_counter()
+        try:
+            conn, cur = self.get_mysql_cursor(prepared=prepared, raw=self.raw_fetch)
+        except (InternalError, PoolError) as e:
+            if trace is not None:
+                trace.add_span("checkout", checkout_started_at)
+                trace.error = str(e)
+                self._emit_trace(trace)
+            raise _pool_exhausted_error(e) from e
+        connection_id = conn._cnx.connection_id
+        if connection_id:
+            self._in_use_connections.add(connection_id)
 
+        execute_started_at = time.perf_counter()
+        if trace is not None:
+            trace.connection_id = connection_id
+            trace.add_span("checkout", checkout_started_at, execute_started_at)
         try:
-            cur.execute(query)
+            try:
+                cur.execute(server_query)
+            except Error as e:
+                if not prepared or e.errno != UNSUPPORTED_PS_ERRNO:
+                    raise
+                # the server can't prepare this statement; run it as text.
+                cur.close()
+                cur = conn.cursor(raw=self.raw_fetch)
+                prepared = False
+                cur.execute(server_query)
         except Exception as e:
+            if trace is not None:
+                trace.add_span("execute", execute_started_at)
+                trace.error = str(e)
             cur.close()
+            self._collect_statement_stats(connection_id)
             conn.close()
             if connection_id:
                 self._in_use_connections.discard(connection_id)
+            if trace is not None:
+                self._emit_trace(trace)
             if str(e) == QUERY_INTERRUPT_MSG:
                 return None
             else:
-                raise HarlequinQueryError(
-                    msg=str(e),
-                    title="Harlequin encountered an error while executing your query.",
-                ) from e
+                raise self._query_error(e) from e
         else:
+            if trace is not None:
+                trace.add_span("execute", execute_started_at)
             if cur.description is not None:
-                retval = HarlequinMySQLCursor(cur, conn=conn, harlequin_conn=self)
+                retval = HarlequinMySQLCursor(
+                    cur,
+                    conn=conn,
+                    harlequin_conn=self,
+                    query=query,
+                    server_limit=server_limit,
+                    cache_key=cache_key,
+                    prepared=prepared,
+                    raw=self.raw_fetch,
+                    trace=trace,
+                )
             else:
+                released_at = time.perf_counter()
+                if trace is not None:
+                    trace.rows = max(cur.rowcount, 0)
                 cur.close()
+                self._collect_statement_stats(connection_id)
                 conn.close()
                 if connection_id:
                     self._in_use_connections.discard(connection_id)
+                if trace is not None:
+                    trace.add_span("release", released_at)
+                    self._emit_trace(trace)
+
+        self._after_execute(query)
+        return retval
+
+    def _collect_statement_stats(
+        self, connection_id: int | None
+    ) -> StatementStats | None:
+        """
+        Reads the server's statistics for the last statement run on a
+        connection, with --statement-stats, and adds them to the session's
+        statement_stats. Must be called before the connection is returned to
+        the pool, so it can't run another statement first. The query's
+        connection is released after this returns, so this doesn't wait for
+        a metadata connection: if they are all busy, the statement is skipped.
+        """
+        if (
+            self.statement_stats is None
+            or not self._statement_stats_available
+            or not connection_id
+        ):
+            return None
+        try:
+            rows = self._fetch_metadata_rows(
+                statement_stats_query(connection_id), timeout=0
+            )
+        except HarlequinConnectionError:
+            # the metadata pool is busy; skip this statement.
+            return None
+        except Exception:
+            logger.warning(
+                "Could not read performance_schema.events_statements_history; "
+                "statement stats are turned off.",
+                exc_info=True,
+            )
+            self._statement_stats_available = False
+            return None
+        if not rows:
+            return None
+        stats = StatementStats.from_row(rows[0])
+        self.statement_stats.add(stats)
+        logger.info("Statement stats: %s", stats.compact)
+        return stats
+
+    @property
+    def statement_stats_summary(self) -> list[DigestSummary] | None:
+        """
+        With --statement-stats, the server's statistics for this session's
+        statements, totalled by digest, slowest first. None if the option is
+        off.
+        """
+        return self.statement_stats.summary() if self.statement_stats else None
+
+    def add_trace_hook(self, hook: TraceHook) -> None:
+        """
+        Calls hook with a QueryTrace after each query, once its connection
+        is returned to the pool. Queries served from the result cache are
+        not traced.
+        """
+        self._trace_hooks.append(hook)
+
+    def _emit_trace(self, trace: QueryTrace) -> None:
+        for hook in self._trace_hooks:
+            try:
+                hook(trace)
+            except Exception:
+                logger.exception("Query trace hook %r failed", hook)
+
+    def explain(
+        self, query: str, analyze: bool = False
+    ) -> HarlequinMySQLPlanCursor | None:
+        """
+        Profiles a statement, and returns its parsed plan as a result set.
+        Uses EXPLAIN FORMAT=JSON over a metadata connection, which doesn't
+        run the statement, or, if analyze is True, EXPLAIN ANALYZE, which runs
+        the statement and measures each node. EXPLAIN ANALYZE is only used
+        for queries, on MySQL 8.0.18 and later. Since it runs the query, it
+        uses a connection from the main pool, like execute(), so it can be
+        cancelled and is capped by --max-execution-time. Returns None if it
+        was cancelled.
+
+        Nodes that scan a whole table or index, or use filesort, are flagged.
+        """
+        server_info = self.server_info
+        use_analyze = (
+            analyze
+            and is_analyzable(query)
+            and server_info is not None
+            and not server_info.is_mariadb
+            and server_info.version >= ANALYZE_MIN_VERSION
+        )
+        statement = query.strip().rstrip(";")
+        if use_analyze:
+            rows = self._explain_analyze(statement)
+            if rows is None:
+                return None
+        else:
+            rows = self._explain_json(statement)
+        plan = str(rows[0][0]) if rows else ""
+        nodes = parse_tree_plan(plan) if use_analyze else parse_json_plan(plan or "{}")
+        if flagged := flagged_nodes(nodes):
+            logger.warning(
+                "The plan for %s has %s",
+                query,
+                "; ".join(
+                    ", ".join(n.flags) + (f" on {n.table}" if n.table else "")
+                    for n in flagged
+                ),
+            )
+        return HarlequinMySQLPlanCursor(nodes)
+
+    def _explain_json(self, statement: str) -> list[Any]:
+        conn, cur = self.safe_get_mysql_cursor(buffered=True, metadata=True)
+        if conn is None or cur is None:
+            raise _pool_exhausted_error(PoolError("Connection pool exhausted"))
+        try:
+            # metadata connections don't follow USE statements.
+            if (database := self.current_database) is not None:
+                cur.execute(f"use `{database.replace('`', '``')}`")
+            cur.execute(f"explain format=json {statement}")
+            return cur.fetchall()
+        except Exception as e:
+            raise self._query_error(e) from e
+        finally:
+            cur.close()
+            conn.close()
+
+    def _explain_analyze(self, statement: str) -> list[Any] | None:
+        """
+        Runs EXPLAIN ANALYZE on a connection from the main pool, which is
+        tracked so cancel() can stop it. Returns None if it was cancelled.
+        """
+        statement = f"explain analyze {self._limit_execution_time(statement)}"
+        try:
+            conn, cur = self.get_mysql_cursor(buffered=True)
+        except (InternalError, PoolError) as e:
+            raise _pool_exhausted_error(e) from e
+        connection_id = conn._cnx.connection_id
+        if connection_id:
+            self._in_use_connections.add(connection_id)
+        try:
+            cur.execute(statement)
+            return cur.fetchall()
+        except Exception as e:
+            if str(e) == QUERY_INTERRUPT_MSG:
+                return None
+            raise self._query_error(e) from e
+        finally:
+            cur.close()
+            conn.close()
+            if connection_id:
+                self._in_use_connections.discard(connection_id)
+
+    def preview_query(self, item: RelationCatalogItem) -> str:
+        """
+        Returns a query that previews a relation cheaply, using the table's
+        statistics and primary key: see harlequin_mysql.preview.
+        """
+        is_view = isinstance(item, ViewCatalogItem)
+        rows_estimate = (
+            item.rows_estimate if isinstance(item, TableCatalogItem) else None
+        )
+        primary_key: list[tuple[str, str]] = []
+        if not is_view and item.parent is not None:
+            # the keys and columns are usually loaded with the catalog tree.
+            keys = item.parent.get_relation_keys(item.label)
+            if keys is not None and (pk := keys.primary_key) is not None:
+                type_labels = {col.name: col.type_label for col in item.column_items()}
+                primary_key = [(col, type_labels.get(col, "?")) for col in pk.columns]
+        server_info = self.server_info
+        return preview_query(
+            item.query_name,
+            primary_key=primary_key,
+            rows_estimate=rows_estimate,
+            is_view=is_view,
+            mariadb=server_info is not None and server_info.is_mariadb,
+        )
+
+    def preview(self, item: RelationCatalogItem) -> HarlequinCursor | None:
+        """
+        Runs the preview query for a relation, and returns its cursor.
+        """
+        return self.execute(self.preview_query(item))
+
+    def _push_down_limit(self, query: str) -> tuple[str, int | None]:
+        """
+        Returns the query to send to the server, and the LIMIT appended to
+        it, if the limit was pushed down.
+        """
+        if self.limit_pushdown != "off" and self._last_limit is not None:
+            if (limited_query := add_limit(query, self._last_limit)) is not None:
+                return limited_query, self._last_limit
+        return query, None
+
+    def _limit_execution_time(self, query: str) -> str:
+        """
+        Caps the execution time of SELECT statements on the server, if
+        --max-execution-time is set.
+        """
+        if self.max_execution_time is None:
+            return query
+        server_info = self.server_info
+        return (
+            add_max_execution_time(
+                query,
+                self.max_execution_time,
+                mariadb=server_info is not None and server_info.is_mariadb,
+            )
+            or query
+        )
+
+    def _query_error(self, e: Exception) -> HarlequinQueryError:
+        if (
+            getattr(e, "errno", None) in EXECUTION_TIME_ERRNOS
+            and self.max_execution_time is not None
+        ):
+            return HarlequinQueryError(
+                title="Your query took too long.",
+                msg=(
+                    f"The server stopped your query after "
+                    f"{self.max_execution_time:g} seconds, the limit set by "
+                    "--max-execution-time. Try filtering or aggregating more "
+                    f"before returning rows.\n\n{e}"
+                ),
+            )
+        return HarlequinQueryError(
+            msg=str(e),
+            title="Harlequin encountered an error while executing your query.",
+        )
+
+    def _after_execute(self, query: str) -> None:
+        self._record_catalog_changes(query)
+        if self.result_cache is not None and not is_read_only(query):
+            # DML, DDL, or SET may have changed any cached result.
+            self.result_cache.clear()
 
         # this is a hack to update all connections in the pool if the user
         # changes the database for the active connection.
@@ -218,42 +1103,293 @@ class HarlequinMySQLConnection(HarlequinConnection):
         if match := USE_DATABASE_PROG.match(query):
             new_db = match.group(1)
             self.set_pool_config(database=new_db)
-        return retval
 
     def cancel(self) -> None:
-        # get a new cursor to execute the KILL statements
-        conn, cur = self.safe_get_mysql_cursor()
-        if conn is None or cur is None:
-            return None
+        # KILL every running query over the control connection, which is
+        # available even if every pooled connection is busy.
+        connection_ids = list(self._in_use_connections)
+        self._control.kill_queries(connection_ids)
+        self._in_use_connections.difference_update(connection_ids)
 
-        # loop through in-use connections and kill each of them
-        for connection_id in self._in_use_connections:
-            try:
-                cur.execute("KILL QUERY %s", (connection_id,))
-            except BaseException:
-                continue
+    def cancel_connection(self, connection_id: int) -> bool:
+        """
+        Cancels the query running on a single connection (e.g., a
+        HarlequinMySQLCursor's connection_id). Returns True if the KILL
+        QUERY statement was sent.
+        """
+        return self._control.kill_query(connection_id)
+
+    @property
+    def result_cache_stats(self) -> ResultCacheStats | None:
+        """
+        The result cache's hits, misses, evictions, and size, or None if the
+        result cache is off.
+        """
+        return self.result_cache.stats if self.result_cache else None
 
-        cur.close()
-        conn.close()
-        self._in_use_connections = set()
+    @property
+    def cancel_stats(self) -> CancelStats:
+        """
+        How many queries have been cancelled, and how long it took.
+        """
+        return self._control.stats
 
     def close(self) -> None:
+        self._control.close()
         with suppress(PoolError):
-            self._pool._remove_connections()
+            self._pool.close()
+        if self._metadata_pool is not None:
+            with suppress(PoolError):
+                self._metadata_pool.close()
 
     def get_catalog(self) -> Catalog:
-        databases = self._get_databases()
-        db_items: list[CatalogItem] = [
-            DatabaseCatalogItem.from_label(label=db, connection=self)
-            for (db,) in databases
-        ]
+        changes = self._take_catalog_changes()
+        if changes and self.schema_completions is not None:
+            self._schedule_schema_completions_update(changes)
+        if self.catalog_cache is not None:
+            # revalidating the cache only re-fetches databases that changed.
+            items = self._get_cached_catalog_tree()
+        elif self._catalog_items is not None and changes:
+            items = self._patch_catalog(self._catalog_items, changes)
+        elif self.bulk_catalog:
+            items = self._get_catalog_tree()
+        else:
+            items = [
+                DatabaseCatalogItem.from_label(label=db, connection=self)
+                for (db,) in self._get_databases()
+            ]
+        self._catalog_items = items
+        db_items: list[CatalogItem] = list(items)
         return Catalog(items=db_items)
 
+    def _record_catalog_changes(self, query: str) -> None:
+        changes = parse_catalog_changes(query)
+        if not changes:
+            return
+        current_database = self.current_database
+        changes = [
+            CatalogChange(
+                kind=change.kind,
+                database=change.database or current_database,
+                relation=change.relation,
+            )
+            for change in changes
+        ]
+        with self._catalog_changes_lock:
+            self._catalog_changes.extend(changes)
+
+    def _take_catalog_changes(self) -> list[CatalogChange]:
+        with self._catalog_changes_lock:
+            changes, self._catalog_changes = self._catalog_changes, []
+        return changes
+
+    def _patch_catalog(
+        self, items: list[DatabaseCatalogItem], changes: Sequence[CatalogChange]
+    ) -> list[DatabaseCatalogItem]:
+        """
+        Refreshes only the parts of a catalog tree affected by DDL: the list
+        of databases, the relations in one database, or the columns of one
+        relation. Items that were not affected keep their loaded children.
+        """
+        if any(change.kind == "databases" for change in changes):
+            existing = {item.label: item for item in items}
+            items = [
+                existing.get(db)
+                or DatabaseCatalogItem.from_label(label=db, connection=self)
+                for (db,) in self._get_databases()
+            ]
+        by_label = {item.label: item for item in items}
+        changed_relations: dict[str, set[str]] = {}
+        changed_columns: dict[str, set[str]] = {}
+        for change in changes:
+            if change.database is None or change.relation is None:
+                continue
+            target = (
+                changed_relations if change.kind == "relations" else changed_columns
+            )
+            target.setdefault(change.database, set()).add(change.relation)
+        for db_name, relations in changed_relations.items():
+            if (db_item := _find_item(by_label, db_name)) is not None:
+                db_item.refresh(changed_relations=relations)
+        for db_name, relations in changed_columns.items():
+            if db_name in changed_relations:
+                continue
+            db_item = _find_item(by_label, db_name)
+            if db_item is None or not db_item.loaded:
+                continue
+            rel_by_label = {rel.label: rel for rel in db_item.children}
+            for rel_name in relations:
+                rel_item = _find_item(rel_by_label, rel_name)
+                if isinstance(rel_item, RelationCatalogItem):
+                    rel_item.refresh()
+        return items
+
     def get_completions(self) -> list[HarlequinCompletion]:
-        return load_completions()
+        server_info = self.server_info
+        # keywords.csv and functions.tsv describe MySQL versions, which
+        # don't apply to MariaDB.
+        if server_info is None or server_info.is_mariadb:
+            completions = load_completions()
+        else:
+            completions = load_completions(server_info.version)
+        if self.schema_completions is None:
+            return completions
+        # Harlequin calls this once, from a worker thread, so it is worth
+        # waiting a little for the current database's names. The rest are
+        # added to the returned list as they load; see _refresh_completions.
+        self.schema_completions.ready.wait(SCHEMA_COMPLETIONS_TIMEOUT)
+        self._base_completions = completions
+        self._completions = [
+            *completions,
+            *self.schema_completions.completions(self.current_database),
+        ]
+        return self._completions
 
-    def _get_databases(self) -> list[tuple[str]]:
-        conn, cur = self.safe_get_mysql_cursor(buffered=True)
+    def _refresh_completions(self) -> None:
+        """
+        Rebuilds the list returned by get_completions() in place. Harlequin
+        keeps that list, and merges it into its completers again each time
+        it reads the catalog (e.g., after DDL), so this is how names loaded
+        or changed later reach the editor.
+        """
+        if self._completions is None or self.schema_completions is None:
+            return
+        self._completions[:] = [
+            *self._base_completions,
+            *self.schema_completions.completions(self.current_database),
+        ]
+
+    def _build_schema_completions(self) -> None:
+        """
+        Fills the schema completion index with the current database's
+        relations and columns, then with every other relation, then with
+        other columns, until it is full.
+        """
+        index = self.schema_completions
+        assert index is not None
+        try:
+            with self._schema_completions_lock:
+                current = self.current_database
+                if current is not None:
+                    self._add_schema_completions([current])
+                index.ready.set()
+                self._add_schema_completions(exclude=current)
+        except Exception:
+            logger.warning("Could not load schema completions.", exc_info=True)
+        finally:
+            index.ready.set()
+        self._refresh_completions()
+
+    def _add_schema_completions(
+        self, db_names: Sequence[str] | None = None, exclude: str | None = None
+    ) -> None:
+        """
+        Adds the relations, then the columns, of db_names (or of every
+        database but exclude) to the schema completion index.
+        """
+        index = self.schema_completions
+        assert index is not None
+        relations: dict[str, list[tuple[str | None, str | None]]] = {}
+        for db_name, rel_name, table_type, *_ in self._stream_relation_rows(db_names):
+            if db_name != exclude:
+                relations.setdefault(db_name, []).append((rel_name, table_type))
+        for db_name, rows in relations.items():
+            index.set_relations(db_name, rows)
+        if not relations or index.is_full:
+            return
+        with closing(self._stream_column_rows(list(relations))) as column_rows:
+            index.add_columns(
+                (db, rel, col, self._short_column_type(col_type))
+                for db, rel, col, col_type in column_rows
+            )
+
+    def _schedule_schema_completions_update(
+        self, changes: Sequence[CatalogChange]
+    ) -> None:
+        """
+        Updates the schema completions affected by DDL. This is called from
+        get_catalog(), so the update is usually done before Harlequin merges
+        the completions again; if the names are still loading, it waits for
+        them in the background, and shows after the next catalog refresh.
+        """
+        loader = self._schema_completions_thread
+        if loader is None or not loader.is_alive():
+            self._update_schema_completions(changes)
+            return
+        threading.Thread(
+            target=self._update_schema_completions,
+            args=(changes,),
+            name="harlequin-mysql-schema-completions-update",
+            daemon=True,
+        ).start()
+
+    def _update_schema_completions(self, changes: Sequence[CatalogChange]) -> None:
+        """
+        Re-fetches the parts of the schema completion index affected by DDL.
+        """
+        index = self.schema_completions
+        assert index is not None
+        try:
+            with self._schema_completions_lock:
+                for change in changes:
+                    db_name = change.database
+                    if db_name is None:
+                        continue
+                    if change.kind == "databases":
+                        rows = [
+                            (rel_name, table_type)
+                            for _, rel_name, table_type, *_ in (
+                                self._stream_relation_rows([db_name])
+                            )
+                        ]
+                        if rows:
+                            index.set_relations(db_name, rows)
+                        else:
+                            index.drop_database(db_name)
+                        continue
+                    relations = [
+                        (rel_name, table_type)
+                        for rel_name, table_type, *_ in self._get_relations(db_name)
+                    ]
+                    if change.kind == "relations":
+                        index.set_relations(db_name, relations)
+                    rel_name = _find_item(
+                        {name: name for name, _ in relations}, change.relation or ""
+                    )
+                    if rel_name is not None:
+                        index.set_columns(
+                            db_name,
+                            rel_name,
+                            [
+                                (col, self._short_column_type(col_type))
+                                for col, col_type in self._get_columns(
+                                    db_name, rel_name
+                                )
+                            ],
+                        )
+        except Exception:
+            logger.warning("Could not update schema completions.", exc_info=True)
+        self._refresh_completions()
+
+    @property
+    def server_info(self) -> ServerInfo | None:
+        """
+        The flavor and version of the server, detected when the first
+        connection was opened. None if it could not be detected.
+        """
+        return self._server_info
+
+    def _fetch_metadata_rows(
+        self, query: str, timeout: float | None = None
+    ) -> list[Any]:
+        """
+        Runs a small metadata query on a buffered cursor and returns its rows.
+        Raises HarlequinConnectionError if no connection becomes available
+        before timeout seconds (or the pool's timeout, if it is None).
+        """
+        conn, cur = self.safe_get_mysql_cursor(
+            buffered=True, metadata=True, timeout=timeout
+        )
         if conn is None or cur is None:
             raise HarlequinConnectionError(
                 title="Connection pool exhausted",
@@ -262,7 +1398,16 @@ class HarlequinMySQLConnection(HarlequinConnection):
                     "with a larger pool or running fewer queries at once."
                 ),
             )
-        cur.execute(
+        try:
+            cur.execute(query)
+            return cur.fetchall()
+        finally:
+            with suppress(Error):
+                cur.close()
+            conn.close()
+
+    def _get_databases(self) -> list[tuple[str]]:
+        return self._fetch_metadata_rows(
             """
             show databases
             where `Database` not in (
@@ -270,48 +1415,31 @@ class HarlequinMySQLConnection(HarlequinConnection):
             )
             """
         )
-        results: list[tuple[str]] = cur.fetchall()  # type: ignore
-        cur.close()
-        conn.close()
-        return results
 
-    def _get_relations(self, db_name: str) -> list[tuple[str, str]]:
-        conn, cur = self.safe_get_mysql_cursor(buffered=True)
-        if conn is None or cur is None:
-            raise HarlequinConnectionError(
-                title="Connection pool exhausted",
-                msg=(
-                    "Connection pool exhausted. Try restarting Harlequin "
-                    "with a larger pool or running fewer queries at once."
-                ),
-            )
-        cur.execute(
+    def _get_relations(
+        self, db_name: str
+    ) -> list[tuple[str, str, int | None, int | None, int | None]]:
+        """
+        Returns (relation, relation type, rows, data bytes, index bytes) for
+        each relation in the database. The statistics are None for views.
+        """
+        return self._fetch_metadata_rows(
             f"""
             select 
                 table_name, 
-                table_type
+                table_type,
+                table_rows,
+                data_length,
+                index_length
             from information_schema.tables
             where table_schema = '{db_name}'
             and table_type != 'SYSTEM VIEW'
             order by table_name asc
             ;"""
         )
-        results: list[tuple[str, str]] = cur.fetchall()  # type: ignore
-        cur.close()
-        conn.close()
-        return results
 
     def _get_columns(self, db_name: str, rel_name: str) -> list[tuple[str, str]]:
-        conn, cur = self.safe_get_mysql_cursor(buffered=True)
-        if conn is None or cur is None:
-            raise HarlequinConnectionError(
-                title="Connection pool exhausted",
-                msg=(
-                    "Connection pool exhausted. Try restarting Harlequin "
-                    "with a larger pool or running fewer queries at once."
-                ),
-            )
-        cur.execute(
+        return self._fetch_metadata_rows(
             f"""
             select column_name, data_type
             from information_schema.columns
@@ -322,10 +1450,330 @@ class HarlequinMySQLConnection(HarlequinConnection):
             order by ordinal_position asc
             ;"""
         )
-        results: list[tuple[str, str]] = cur.fetchall()  # type: ignore
-        cur.close()
-        conn.close()
-        return results
+
+    def _get_relation_keys(self, db_name: str) -> dict[str, RelationKeys]:
+        """
+        Returns the indexes and foreign keys of every relation in a database,
+        by relation.
+        """
+        return {
+            rel_name: keys
+            for (_, rel_name), keys in group_key_rows(
+                self._stream_key_rows([db_name])
+            ).items()
+        }
+
+    def _get_catalog_tree(
+        self, db_names: Sequence[str] | None = None
+    ) -> list[DatabaseCatalogItem]:
+        """
+        Loads databases, relations, columns, and keys in four set-based
+        queries, and returns a fully-loaded catalog tree. If db_names is
+        passed, only those databases are loaded.
+        """
+        if db_names is not None and not db_names:
+            return []
+        return build_catalog_tree(
+            connection=self,
+            relations=self._stream_relation_rows(db_names),
+            columns=self._stream_column_rows(db_names),
+            keys=self._stream_key_rows(db_names),
+        )
+
+    def _get_cached_catalog_tree(self) -> list[DatabaseCatalogItem]:
+        """
+        The first time this is called, returns the catalog tree saved on disk
+        (if any). Databases whose fingerprint changed since the cache was
+        saved are loaded lazily instead, while the cache is refreshed in a
+        background thread. Later calls revalidate the cache before returning
+        the tree, which only re-fetches databases that changed.
+        """
+        assert self.catalog_cache is not None
+        first_call = not self._catalog_cache_started
+        self._catalog_cache_started = True
+        if first_call and self.catalog_cache.load():
+            # the fingerprints are one cheap query, so the saved tree is
+            # checked before it is shown.
+            fingerprints = self._get_catalog_fingerprints()
+            with self._catalog_cache_lock:
+                changed, dropped = self.catalog_cache.diff(fingerprints)
+            if changed or dropped:
+                self._catalog_cache_thread = threading.Thread(
+                    target=self._revalidate_catalog_cache,
+                    kwargs={"fingerprints": fingerprints},
+                    name="harlequin-mysql-catalog-cache",
+                    daemon=True,
+                )
+                self._catalog_cache_thread.start()
+            with self._catalog_cache_lock:
+                cached = build_catalog_tree(
+                    connection=self,
+                    relations=list(self.catalog_cache.relation_rows()),
+                    columns=list(self.catalog_cache.column_rows()),
+                    keys=list(self.catalog_cache.key_rows()),
+                )
+            items = [
+                item
+                for item in cached
+                if item.label in fingerprints and item.label not in changed
+            ]
+            items.extend(
+                DatabaseCatalogItem.from_label(label=db_name, connection=self)
+                for db_name in changed
+            )
+            return sorted(items, key=lambda item: item.label)
+        else:
+            if self._catalog_cache_thread is not None:
+                self._catalog_cache_thread.join()
+            self._revalidate_catalog_cache(raise_errors=True)
+        with self._catalog_cache_lock:
+            return build_catalog_tree(
+                connection=self,
+                relations=list(self.catalog_cache.relation_rows()),
+                columns=list(self.catalog_cache.column_rows()),
+                keys=list(self.catalog_cache.key_rows()),
+            )
+
+    def _revalidate_catalog_cache(
+        self,
+        raise_errors: bool = False,
+        fingerprints: dict[str, list[str | None]] | None = None,
+    ) -> None:
+        """
+        Compares a cheap fingerprint of each database to the cached one,
+        re-fetches the databases that changed, and saves the cache.
+        """
+        assert self.catalog_cache is not None
+        try:
+            if fingerprints is None:
+                fingerprints = self._get_catalog_fingerprints()
+            with self._catalog_cache_lock:
+                changed, dropped = self.catalog_cache.diff(fingerprints)
+            if not changed and not dropped:
+                return
+            relations = list(self._stream_relation_rows(changed)) if changed else []
+            columns = list(self._stream_column_rows(changed)) if changed else []
+            keys = list(self._stream_key_rows(changed)) if changed else []
+            with self._catalog_cache_lock:
+                self.catalog_cache.update(
+                    fingerprints,
+                    changed,
+                    relations,
+                    columns,
+                    key_rows=keys,
+                    dropped=dropped,
+                )
+                self.catalog_cache.save()
+        except Exception as e:
+            if raise_errors:
+                raise
+            logger.warning("Could not revalidate the catalog cache: %s", e)
+
+    def _get_catalog_fingerprints(self) -> dict[str, list[str | None]]:
+        """
+        Returns a fingerprint of the tables and columns in each database,
+        which changes when a relation or column is created, dropped, renamed,
+        or altered.
+        """
+        filter_sql, params = self._schema_filter("s.schema_name", None)
+        rows = self._stream_metadata_rows(
+            f"""
+            select
+                s.schema_name,
+                t.relation_count,
+                t.max_create_time,
+                t.max_update_time,
+                t.relation_checksum,
+                c.column_count,
+                c.column_checksum,
+                k.index_checksum,
+                f.foreign_key_checksum
+            from information_schema.schemata as s
+            left join (
+                select
+                    table_schema,
+                    count(*) as relation_count,
+                    max(create_time) as max_create_time,
+                    max(update_time) as max_update_time,
+                    sum(crc32(concat(table_name, table_type))) as relation_checksum
+                from information_schema.tables
+                where table_type != 'SYSTEM VIEW'
+                group by table_schema
+            ) as t on t.table_schema = s.schema_name
+            left join (
+                select
+                    table_schema,
+                    count(*) as column_count,
+                    sum(
+                        crc32(concat(table_name, column_name, column_type))
+                    ) as column_checksum
+                from information_schema.columns
+                group by table_schema
+            ) as c on c.table_schema = s.schema_name
+            left join (
+                select
+                    table_schema,
+                    sum(
+                        crc32(
+                            concat(table_name, index_name, coalesce(column_name, ''))
+                        )
+                    ) as index_checksum
+                from information_schema.statistics
+                group by table_schema
+            ) as k on k.table_schema = s.schema_name
+            left join (
+                select
+                    table_schema,
+                    sum(
+                        crc32(concat(table_name, constraint_name, column_name))
+                    ) as foreign_key_checksum
+                from information_schema.key_column_usage
+                where referenced_table_name is not null
+                group by table_schema
+            ) as f on f.table_schema = s.schema_name
+            where {filter_sql}
+            """,
+            params,
+        )
+        return {
+            db_name: [None if v is None else str(v) for v in fingerprint]
+            for db_name, *fingerprint in rows
+        }
+
+    def _stream_relation_rows(
+        self, db_names: Sequence[str] | None = None
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Yields (database, relation, relation type, rows, data bytes,
+        index bytes) for every relation, and (database, None, None, None,
+        None, None) for databases without relations.
+        """
+        filter_sql, params = self._schema_filter("s.schema_name", db_names)
+        yield from self._stream_metadata_rows(
+            f"""
+            select
+                s.schema_name,
+                t.table_name,
+                t.table_type,
+                t.table_rows,
+                t.data_length,
+                t.index_length
+            from information_schema.schemata as s
+            left join information_schema.tables as t
+                on t.table_schema = s.schema_name
+                and t.table_type != 'SYSTEM VIEW'
+            where {filter_sql}
+            order by s.schema_name asc, t.table_name asc
+            """,
+            params,
+        )
+
+    def _stream_column_rows(
+        self, db_names: Sequence[str] | None = None
+    ) -> Generator[tuple[str, str, str, str], None, None]:
+        """
+        Yields (database, relation, column, data type) for every column.
+        """
+        filter_sql, params = self._schema_filter("table_schema", db_names)
+        yield from self._stream_metadata_rows(
+            f"""
+            select table_schema, table_name, column_name, data_type
+            from information_schema.columns
+            where
+                {filter_sql}
+                and extra not like '%INVISIBLE%'
+            order by table_schema asc, table_name asc, ordinal_position asc
+            """,
+            params,
+        )
+
+    def _stream_key_rows(
+        self, db_names: Sequence[str] | None = None
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Yields (database, relation, key name, non unique, position, column,
+        cardinality, referenced database, referenced relation, referenced
+        column) for every column of every index, and then for every column
+        of every foreign key. The referenced fields are None for indexes.
+        """
+        filter_sql, params = self._schema_filter("table_schema", db_names)
+        yield from self._stream_metadata_rows(
+            f"""
+            select
+                table_schema,
+                table_name,
+                index_name,
+                non_unique,
+                seq_in_index,
+                column_name,
+                cardinality,
+                null,
+                null,
+                null
+            from information_schema.statistics
+            where {filter_sql}
+            order by table_schema, table_name, index_name, seq_in_index
+            """,
+            params,
+        )
+        yield from self._stream_metadata_rows(
+            f"""
+            select
+                table_schema,
+                table_name,
+                constraint_name,
+                null,
+                ordinal_position,
+                column_name,
+                null,
+                referenced_table_schema,
+                referenced_table_name,
+                referenced_column_name
+            from information_schema.key_column_usage
+            where
+                {filter_sql}
+                and referenced_table_name is not null
+            order by table_schema, table_name, constraint_name, ordinal_position
+            """,
+            params,
+        )
+
+    @staticmethod
+    def _schema_filter(
+        column: str, db_names: Sequence[str] | None
+    ) -> tuple[str, tuple[str, ...]]:
+        if db_names is not None:
+            placeholders = ", ".join(["%s"] * len(db_names))
+            return f"{column} in ({placeholders})", tuple(db_names)
+        placeholders = ", ".join(["%s"] * len(SYSTEM_SCHEMAS))
+        return f"{column} not in ({placeholders})", SYSTEM_SCHEMAS
+
+    def _stream_metadata_rows(
+        self, query: str, params: tuple[Any, ...] = ()
+    ) -> Iterator[Any]:
+        """
+        Runs a metadata query on an unbuffered cursor and yields its rows,
+        METADATA_BATCH_SIZE rows at a time, so large catalogs are never held
+        in memory twice.
+        """
+        conn, cur = self.safe_get_mysql_cursor(metadata=True)
+        if conn is None or cur is None:
+            raise HarlequinConnectionError(
+                title="Connection pool exhausted",
+                msg=(
+                    "Connection pool exhausted. Try restarting Harlequin "
+                    "with a larger pool or running fewer queries at once."
+                ),
+            )
+        try:
+            cur.execute(query, params)
+            while rows := cur.fetchmany(METADATA_BATCH_SIZE):
+                yield from rows
+        finally:
+            with suppress(Error):
+                conn.consume_results()
+                cur.close()
+            conn.close()
 
     @staticmethod
     def _short_column_type(info_schema_type: str) -> str:
@@ -358,6 +1806,84 @@ class HarlequinMySQLConnection(HarlequinConnection):
         return mapping.get(info_schema_type, "?")
 
 
+TItem = TypeVar("TItem")
+
+
+def _find_item(items_by_label: dict[str, TItem], label: str) -> TItem | None:
+    """
+    Finds a catalog item by label, falling back to a case-insensitive match,
+    since MySQL identifiers may not be case-sensitive.
+    """
+    if label in items_by_label:
+        return items_by_label[label]
+    folded = label.casefold()
+    for item_label, item in items_by_label.items():
+        if item_label.casefold() == folded:
+            return item
+    return None
+
+
+def _notify(message: str, severity: SeverityLevel = "warning") -> None:
+    """
+    Shows a notification in Harlequin. Adapters are only given a
+    HarlequinDriver in interactions, so this posts the driver's message to
+    the app through the Harlequin worker that is calling the adapter (e.g.,
+    to fetch results). Does nothing outside of a worker.
+    """
+    try:
+        worker = get_current_worker()
+    except NoActiveWorker:
+        return
+    worker.node.post_message(
+        HarlequinDriver.Notify(notify_message=message, severity=severity)
+    )
+
+
+def _pool_exhausted_error(e: Exception) -> HarlequinQueryError:
+    # Harlequin records this error against the query, and still fetches the
+    # results of the queries that ran before it.
+    return HarlequinQueryError(
+        title="Harlequin could not run your query.",
+        msg=(
+            f"{e}. Wait for other queries to finish, or restart Harlequin "
+            "with a larger --pool-max-size or --pool-timeout."
+        ),
+    )
+
+
+def _result_too_large_error(
+    stats: StreamStats, max_rows: int | None, max_bytes: int | None
+) -> HarlequinQueryError:
+    if stats.stopped_by == "rows":
+        assert max_rows is not None
+        limit = f"{max_rows:,} rows, the limit set by --max-result-rows"
+    else:
+        assert max_bytes is not None
+        limit = f"{format_bytes(max_bytes)}, the limit set by --max-result-bytes"
+    return HarlequinQueryError(
+        title="Your query returned too much data.",
+        msg=(
+            f"Your query returned more than {limit}, so Harlequin stopped "
+            "fetching it. Add a LIMIT or a more selective WHERE clause, or "
+            "aggregate the results."
+        ),
+    )
+
+
+def _min(*values: int | None) -> int | None:
+    """
+    The smallest value that is not None, or None.
+    """
+    present = [v for v in values if v is not None]
+    return min(present) if present else None
+
+
+def _parse_flag(value: str | bool | None) -> bool:
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes", "on")
+    return bool(value)
+
+
 class HarlequinMySQLAdapter(HarlequinAdapter):
     ADAPTER_OPTIONS = MYSQLADAPTER_OPTIONS
     IMPLEMENTS_CANCEL = True
@@ -380,7 +1906,28 @@ class HarlequinMySQLAdapter(HarlequinAdapter):
         ssl_key: str | None = None,
         openid_token_file: str | None = None,
         pool_size: str | int | None = 5,
+        pool_max_size: str | int | None = None,
+        pool_timeout: str | float | None = None,
+        pool_idle_timeout: str | float | None = None,
+        metadata_pool_size: str | int | None = None,
         enable_cleartext_plugin: str | bool | None = False,
+        limit_pushdown: str | None = "off",
+        explain: str | None = "off",
+        arrow_fetch: str | bool | None = False,
+        fetch_memory_budget: str | int | None = None,
+        max_execution_time: str | float | None = None,
+        max_result_rows: str | int | None = None,
+        max_result_bytes: str | int | None = None,
+        result_cache_size: str | int | None = None,
+        result_cache_ttl: str | float | None = None,
+        prepared_statements: str | bool | None = False,
+        raw_fetch: str | bool | None = False,
+        query_trace: str | None = None,
+        statement_stats: str | bool | None = False,
+        bulk_catalog: str | bool | None = False,
+        catalog_cache: str | bool | None = False,
+        schema_completions: str | bool | None = False,
+        schema_completions_limit: str | int | None = None,
         **_: Any,
     ) -> None:
         if conn_str:
@@ -410,6 +1957,66 @@ class HarlequinMySQLAdapter(HarlequinAdapter):
                 if enable_cleartext_plugin is not None
                 else False,
             }
+            # options used by the adapter, not passed to the connector.
+            self.adapter_options: dict[str, Any] = {
+                "limit_pushdown": limit_pushdown or "off",
+                "explain": explain or "off",
+                "arrow_fetch": _parse_flag(arrow_fetch),
+                "fetch_memory_budget": parse_bytes(fetch_memory_budget)
+                if fetch_memory_budget is not None
+                else None,
+                "max_execution_time": float(max_execution_time)
+                if max_execution_time is not None
+                else None,
+                "max_result_rows": int(max_result_rows)
+                if max_result_rows is not None
+                else None,
+                "max_result_bytes": parse_bytes(max_result_bytes)
+                if max_result_bytes is not None
+                else None,
+                "result_cache_size": parse_bytes(result_cache_size)
+                if result_cache_size is not None
+                else None,
+                "result_cache_ttl": float(result_cache_ttl)
+                if result_cache_ttl is not None
+                else DEFAULT_TTL_SECONDS,
+                "prepared_statements": _parse_flag(prepared_statements),
+                "raw_fetch": _parse_flag(raw_fetch),
+                "query_trace": make_trace_hook(query_trace) if query_trace else None,
+                "statement_stats": _parse_flag(statement_stats),
+                "bulk_catalog": _parse_flag(bulk_catalog),
+                "catalog_cache": _parse_flag(catalog_cache),
+                "pool_max_size": int(pool_max_size)
+                if pool_max_size is not None
+                else None,
+                "pool_timeout": float(pool_timeout)
+                if pool_timeout is not None
+                else DEFAULT_TIMEOUT_SECONDS,
+                "pool_idle_timeout": float(pool_idle_timeout)
+                if pool_idle_timeout is not None
+                else DEFAULT_IDLE_TIMEOUT_SECONDS,
+                "metadata_pool_size": int(metadata_pool_size)
+                if metadata_pool_size is not None
+                else DEFAULT_METADATA_POOL_SIZE,
+                "schema_completions": _parse_flag(schema_completions),
+                "schema_completions_limit": int(schema_completions_limit)
+                if schema_completions_limit is not None
+                else DEFAULT_MAX_COMPLETIONS,
+            }
+            if self.adapter_options["limit_pushdown"] not in LIMIT_PUSHDOWN_MODES:
+                raise ValueError(
+                    f"limit-pushdown must be one of {LIMIT_PUSHDOWN_MODES}, "
+                    f"got {limit_pushdown}"
+                )
+            if self.adapter_options["explain"] not in EXPLAIN_MODES:
+                raise ValueError(
+                    f"explain must be one of {EXPLAIN_MODES}, got {explain}"
+                )
+            if self.adapter_options["raw_fetch"] and not mysql.connector.HAVE_CEXT:
+                raise ValueError(
+                    "raw-fetch requires the C extension for mysql-connector-python, "
+                    "which is not installed"
+                )
         except (ValueError, TypeError) as e:
             raise HarlequinConfigError(
                 msg=f"MySQL adapter received bad config value: {e}",
@@ -427,6 +2034,22 @@ class HarlequinMySQLAdapter(HarlequinAdapter):
 
         return f"{host}{sock}:{port}/{database}"
 
+    @property
+    def catalog_cache_key(self) -> str:
+        """
+        Users can see different databases on the same server, so each user
+        has their own catalog cache.
+        """
+        user = self.options.get("user", "") or ""
+        return f"{user}@{self.connection_id}"
+
     def connect(self) -> HarlequinMySQLConnection:
-        conn = HarlequinMySQLConnection(conn_str=tuple(), options=self.options)
+        conn = HarlequinMySQLConnection(
+            conn_str=tuple(),
+            options=self.options,
+            adapter_options={
+                **self.adapter_options,
+                "catalog_cache_key": self.catalog_cache_key,
+            },
+        )
         return conn
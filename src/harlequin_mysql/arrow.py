@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+from typing import Any, Iterator, Sequence
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from mysql.connector import FieldType
+from mysql.connector.constants import FieldFlag
+from mysql.connector.conversion import MySQLConverter
+from mysql.connector.cursor import MySQLCursor
+
+# the id of the binary character set, which MySQL uses for BLOB
+# and BINARY columns.
+BINARY_CHARSET_ID = 63
+
+# the number of rows converted to an Arrow record batch at a time. Only
+# one batch of Python tuples is alive at once.
+DEFAULT_BATCH_SIZE = 10_000
+
+_INTEGER_TYPES = {
+    FieldType.TINY,
+    FieldType.SHORT,
+    FieldType.INT24,
+    FieldType.LONG,
+    FieldType.LONGLONG,
+    FieldType.YEAR,
+    FieldType.BIT,
+}
+
+_BLOB_TYPES = {
+    FieldType.TINY_BLOB,
+    FieldType.MEDIUM_BLOB,
+    FieldType.LONG_BLOB,
+    FieldType.BLOB,
+    FieldType.STRING,
+    FieldType.VAR_STRING,
+    FieldType.VARCHAR,
+}
+
+# raw values of these types can't be cast from text by Arrow, so they are
+# converted one at a time by the connector.
+_PYTHON_CONVERTED_TYPES = {FieldType.BIT, FieldType.TIME, FieldType.NULL}
+
+_DECIMAL_TYPES = {FieldType.DECIMAL, FieldType.NEWDECIMAL}
+
+_converter = MySQLConverter()
+
+
+def arrow_type(column: Sequence[Any]) -> pa.DataType | None:
+    """
+    Returns the Arrow type for a column, given its entry in a MySQL cursor's
+    description, or None if pyarrow should infer the type from the data.
+    """
+    type_code = column[1]
+    flags = column[7] if len(column) > 7 else 0
+    charset = column[8] if len(column) > 8 else None
+    if type_code in _INTEGER_TYPES:
+        return pa.uint64() if flags & FieldFlag.UNSIGNED else pa.int64()
+    elif type_code in (FieldType.FLOAT, FieldType.DOUBLE):
+        return pa.float64()
+    elif type_code in (FieldType.DATE, FieldType.NEWDATE):
+        return pa.date32()
+    elif type_code in (FieldType.DATETIME, FieldType.TIMESTAMP):
+        return pa.timestamp("us")
+    elif type_code == FieldType.TIME:
+        return pa.duration("us")
+    elif type_code in (FieldType.ENUM, FieldType.SET, FieldType.JSON):
+        return pa.string()
+    elif type_code in _BLOB_TYPES:
+        return pa.binary() if charset == BINARY_CHARSET_ID else pa.string()
+    elif type_code == FieldType.GEOMETRY:
+        return pa.binary()
+    elif type_code == FieldType.NULL:
+        return pa.null()
+    # DECIMAL columns don't have a precision in the cursor description,
+    # so we let pyarrow infer it from the values.
+    return None
+
+
+def arrow_schema(description: Sequence[Sequence[Any]]) -> pa.Schema:
+    """
+    Returns an Arrow schema for a cursor description. Columns whose type
+    must be inferred are typed as strings until we see data.
+    """
+    return pa.schema(
+        [pa.field(col[0], arrow_type(col) or pa.string()) for col in description]
+    )
+
+
+def _to_array(values: Sequence[Any], type_: pa.DataType | None) -> pa.Array:
+    try:
+        return pa.array(values, type=type_)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        pass
+    # the connector returns sets for SET columns, and may return
+    # str for binary columns (or bytes for text columns) depending on
+    # the connection's config.
+    if type_ is not None and (pa.types.is_string(type_) or type_ == pa.binary()):
+        normalized = [
+            ",".join(sorted(v))
+            if isinstance(v, set)
+            else v.decode(errors="replace")
+            if isinstance(v, (bytes, bytearray))
+            else v
+            for v in values
+        ]
+        try:
+            return pa.array(normalized, type=pa.string())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        # give up and show the values as text.
+        return pa.array([None if v is None else str(v) for v in values], pa.string())
+
+
+def _raw_to_array(values: Sequence[Any], column: Sequence[Any]) -> pa.Array:
+    """
+    Converts the raw (bytes) values of a column, as returned by a cursor
+    with raw=True, by casting the whole column from text at once.
+    """
+    type_ = arrow_type(column)
+    raw = pa.array(values, pa.binary())
+    if type_ == pa.binary():
+        return raw
+    if column[1] not in _PYTHON_CONVERTED_TYPES:
+        try:
+            text = raw.cast(pa.string())
+            if column[1] in _DECIMAL_TYPES:
+                return text.cast(_decimal_type(text))
+            return text if type_ is None or type_ == pa.string() else text.cast(type_)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            # e.g., zero dates, or text that isn't UTF-8.
+            pass
+    if type_ is not None and pa.types.is_string(type_):
+        return _to_array(values, type_)
+    return _to_array([_raw_to_python(column, v) for v in values], type_)
+
+
+def _raw_to_python(column: Sequence[Any], value: bytes | None) -> Any:
+    try:
+        return _converter.to_python(column, value)  # type: ignore[arg-type]
+    except (ValueError, TypeError, ArithmeticError):
+        return None if value is None else bytes(value).decode(errors="replace")
+
+
+def _decimal_type(text: pa.Array) -> pa.DataType:
+    """
+    The cursor description doesn't include a DECIMAL column's precision, but
+    the server sends every value with the column's scale.
+    """
+    values = text.drop_null()
+    first = values[0].as_py() if len(values) else None
+    scale = len(first) - first.index(".") - 1 if first and "." in first else 0
+    digits = pc.utf8_length(pc.replace_substring_regex(text, r"[-.]", ""))
+    precision = max(pc.max(digits).as_py() or 1, scale)
+    if precision <= 38:
+        return pa.decimal128(precision, scale)
+    return pa.decimal256(min(precision, 76), scale)
+
+
+def rows_to_record_batch(
+    rows: Sequence[Sequence[Any]],
+    description: Sequence[Sequence[Any]],
+    raw: bool = False,
+) -> pa.RecordBatch:
+    """
+    Converts a list of row tuples to an Arrow record batch, column by column,
+    using a typed builder for each column chosen from the cursor description.
+
+    If raw is True, the rows hold the undecoded bytes sent by the server, and
+    each column is converted with a single Arrow cast.
+    """
+    columns = list(zip(*rows, strict=True)) if rows else [() for _ in description]
+    arrays = [
+        _raw_to_array(values, col) if raw else _to_array(values, arrow_type(col))
+        for values, col in zip(columns, description, strict=True)
+    ]
+    names = [col[0] for col in description]
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def iter_record_batches(
+    cur: MySQLCursor,
+    description: Sequence[Sequence[Any]],
+    limit: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    raw: bool = False,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Reads rows from an unbuffered cursor, batch_size rows at a time, and
+    yields each batch as an Arrow record batch.
+    """
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        rows = cur.fetchmany(size)
+        if not rows:
+            return
+        yield rows_to_record_batch(rows, description, raw=raw)
+        if remaining is not None:
+            remaining -= len(rows)
+        if len(rows) < size:
+            return
+
+
+def fetch_arrow_table(
+    cur: MySQLCursor,
+    description: Sequence[Sequence[Any]],
+    limit: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    raw: bool = False,
+) -> pa.Table:
+    """
+    Fetches the rest of a cursor's result set (up to limit rows) as an
+    Arrow table. Pass raw=True if the cursor was opened with raw=True.
+    """
+    batches = list(iter_record_batches(cur, description, limit, batch_size, raw))
+    return batches_to_table(batches, description)
+
+
+def batches_to_table(
+    batches: Sequence[pa.RecordBatch], description: Sequence[Sequence[Any]]
+) -> pa.Table:
+    """
+    Combines record batches from rows_to_record_batch into a single table.
+    """
+    if not batches:
+        return arrow_schema(description).empty_table()
+    # inferred types (and fallbacks) can differ from batch to batch.
+    schema = batches[0].schema
+    if all(batch.schema == schema for batch in batches[1:]):
+        return pa.Table.from_batches(batches, schema=schema)
+    tables = [pa.Table.from_batches([batch]) for batch in batches]
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # the batches could not be unified (e.g., an int column that fell
+        # back to strings in one batch); show the whole column as text.
+        mixed = {
+            i
+            for t in tables[1:]
+            for i, (a, b) in enumerate(zip(t.schema.types, schema.types, strict=True))
+            if a != b
+        }
+        return pa.concat_tables([_cast_to_string(t, mixed) for t in tables])
+
+
+def _cast_to_string(table: pa.Table, indexes: set[int]) -> pa.Table:
+    arrays = [
+        col.cast(pa.string(), safe=False) if i in indexes else col
+        for i, col in enumerate(table.columns)
+    ]
+    return pa.Table.from_arrays(arrays, names=table.column_names)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Collection, Iterable, Sequence
 
-from harlequin.catalog import InteractiveCatalogItem
+from harlequin.catalog import CatalogItem, InteractiveCatalogItem
 
 from harlequin_mysql.interactions import (
     execute_drop_database_statement,
@@ -13,6 +13,13 @@ from harlequin_mysql.interactions import (
     insert_columns_at_cursor,
     show_select_star,
 )
+from harlequin_mysql.keys import (
+    ForeignKeyInfo,
+    IndexInfo,
+    RelationKeys,
+    group_key_rows,
+)
+from harlequin_mysql.streaming import format_bytes
 
 if TYPE_CHECKING:
     from harlequin_mysql.adapter import HarlequinMySQLConnection
@@ -21,6 +28,8 @@ if TYPE_CHECKING:
 @dataclass
 class ColumnCatalogItem(InteractiveCatalogItem["HarlequinMySQLConnection"]):
     parent: "RelationCatalogItem" | None = None
+    # the column's name; the label may also show a key marker.
+    name: str = ""
 
     @classmethod
     def from_parent(
@@ -39,6 +48,119 @@ class ColumnCatalogItem(InteractiveCatalogItem["HarlequinMySQLConnection"]):
             connection=parent.connection,
             parent=parent,
             loaded=True,
+            name=label,
+        )
+
+    def mark_key(self, marker: str | None) -> None:
+        """
+        Shows a key marker (e.g., "pk") after the column's name in the tree.
+        The type label and query name are left alone, since Harlequin also
+        inserts and shows them for completions.
+        """
+        self.label = self.name if marker is None else f"{self.name} ({marker})"
+
+
+@dataclass
+class IndexCatalogItem(InteractiveCatalogItem["HarlequinMySQLConnection"]):
+    parent: "KeyGroupCatalogItem" | None = None
+
+    @classmethod
+    def from_parent(
+        cls,
+        parent: "KeyGroupCatalogItem",
+        relation: "RelationCatalogItem",
+        index: IndexInfo,
+    ) -> "IndexCatalogItem":
+        if index.is_primary:
+            kind = "pk"
+        else:
+            kind = "uq" if index.unique else "idx"
+        type_label = f"{kind} ({', '.join(index.columns)})"
+        if index.cardinality is not None:
+            type_label = f"{type_label} ~{format_row_count(index.cardinality)}"
+        return cls(
+            qualified_identifier=f"{relation.qualified_identifier}.`{index.name}`",
+            query_name=", ".join(f"`{col}`" for col in index.columns),
+            label=index.name,
+            type_label=type_label,
+            connection=parent.connection,
+            parent=parent,
+            loaded=True,
+        )
+
+
+@dataclass
+class ForeignKeyCatalogItem(InteractiveCatalogItem["HarlequinMySQLConnection"]):
+    parent: "KeyGroupCatalogItem" | None = None
+
+    @classmethod
+    def from_parent(
+        cls,
+        parent: "KeyGroupCatalogItem",
+        relation: "RelationCatalogItem",
+        foreign_key: ForeignKeyInfo,
+    ) -> "ForeignKeyCatalogItem":
+        reference = (
+            f"{foreign_key.ref_database}.{foreign_key.ref_relation}"
+            f" ({', '.join(foreign_key.ref_columns)})"
+        )
+        return cls(
+            qualified_identifier=(
+                f"{relation.qualified_identifier}.`{foreign_key.name}`"
+            ),
+            query_name=", ".join(f"`{col}`" for col in foreign_key.columns),
+            label=foreign_key.name,
+            type_label=f"fk ({', '.join(foreign_key.columns)}) -> {reference}",
+            connection=parent.connection,
+            parent=parent,
+            loaded=True,
+        )
+
+
+@dataclass
+class KeyGroupCatalogItem(InteractiveCatalogItem["HarlequinMySQLConnection"]):
+    """
+    A relation's indexes or foreign keys, listed apart from its columns.
+    """
+
+    parent: "RelationCatalogItem" | None = None
+
+    @classmethod
+    def indexes(
+        cls, parent: "RelationCatalogItem", indexes: Sequence[IndexInfo]
+    ) -> "KeyGroupCatalogItem":
+        group = cls._from_parent(parent, label="Indexes", type_label="idx")
+        group.children = [
+            IndexCatalogItem.from_parent(parent=group, relation=parent, index=index)
+            for index in indexes
+        ]
+        return group
+
+    @classmethod
+    def foreign_keys(
+        cls, parent: "RelationCatalogItem", foreign_keys: Sequence[ForeignKeyInfo]
+    ) -> "KeyGroupCatalogItem":
+        group = cls._from_parent(parent, label="Foreign keys", type_label="fk")
+        group.children = [
+            ForeignKeyCatalogItem.from_parent(
+                parent=group, relation=parent, foreign_key=foreign_key
+            )
+            for foreign_key in foreign_keys
+        ]
+        return group
+
+    @classmethod
+    def _from_parent(
+        cls, parent: "RelationCatalogItem", label: str, type_label: str
+    ) -> "KeyGroupCatalogItem":
+        return cls(
+            qualified_identifier=f"{parent.qualified_identifier}.{label}",
+            query_name=parent.query_name,
+            label=label,
+            type_label=type_label,
+            connection=parent.connection,
+            parent=parent,
+            loaded=True,
         )
 
 
@@ -50,11 +172,11 @@ class RelationCatalogItem(InteractiveCatalogItem["HarlequinMySQLConnection"]):
     ]
     parent: "DatabaseCatalogItem" | None = None
 
-    def fetch_children(self) -> list[ColumnCatalogItem]:
+    def fetch_children(self) -> list[CatalogItem]:
         if self.parent is None or self.connection is None:
             return []
         result = self.connection._get_columns(self.parent.label, self.label)
-        return [
+        columns = [
             ColumnCatalogItem.from_parent(
                 parent=self,
                 label=column_name,
@@ -62,6 +184,44 @@ class RelationCatalogItem(InteractiveCatalogItem["HarlequinMySQLConnection"]):
             )
             for column_name, column_type in result
         ]
+        keys = self.parent.get_relation_keys(self.label)
+        return [*columns, *self.key_items(columns, keys)]
+
+    def column_items(self) -> list[ColumnCatalogItem]:
+        """
+        Returns this relation's columns, without its keys, loading them if
+        they have not been loaded.
+        """
+        children = self.children if self.loaded else self.fetch_children()
+        return [item for item in children if isinstance(item, ColumnCatalogItem)]
+
+    def key_items(
+        self, columns: Sequence[ColumnCatalogItem], keys: RelationKeys | None
+    ) -> list[CatalogItem]:
+        """
+        Marks the columns that are indexed, and returns a group item for the
+        relation's indexes, and another for its foreign keys, if it has any.
+        """
+        items: list[CatalogItem] = []
+        if keys is None:
+            return items
+        for column in columns:
+            column.mark_key(keys.column_marker(column.name))
+        if keys.indexes:
+            items.append(KeyGroupCatalogItem.indexes(self, keys.indexes))
+        if keys.foreign_keys:
+            items.append(KeyGroupCatalogItem.foreign_keys(self, keys.foreign_keys))
+        return items
+
+    def refresh(self) -> None:
+        """
+        Re-fetches this relation's columns and keys, if they have been loaded.
+        """
+        if self.loaded:
+            if self.parent is not None:
+                # keys are loaded for the whole database at once.
+                self.parent.keys = None
+            self.children = list(self.fetch_children())
 
 
 class ViewCatalogItem(RelationCatalogItem):
@@ -87,27 +247,71 @@ class ViewCatalogItem(RelationCatalogItem):
         )
 
 
+def format_row_count(n: int) -> str:
+    """
+    e.g., 999, 1.2k, 34.5M
+    """
+    size = float(n)
+    for unit in ("", "k", "M"):
+        if size < 1000:
+            return f"{size:.0f}" if not unit else f"{size:.1f}{unit}"
+        size /= 1000
+    return f"{size:.1f}B"
+
+
+@dataclass
 class TableCatalogItem(RelationCatalogItem):
     INTERACTIONS = RelationCatalogItem.INTERACTIONS + [
         ("Drop Table", execute_drop_table_statement),
     ]
+    # from information_schema.tables; estimates for InnoDB tables, and
+    # None if the server did not report them.
+    rows_estimate: int | None = None
+    data_bytes: int | None = None
+    index_bytes: int | None = None
 
     @classmethod
     def from_parent(
         cls,
         parent: "DatabaseCatalogItem",
         label: str,
+        rows_estimate: int | None = None,
+        data_bytes: int | None = None,
+        index_bytes: int | None = None,
     ) -> "TableCatalogItem":
         relation_query_name = f"`{parent.label}`.`{label}`"
         relation_qualified_identifier = f"{parent.qualified_identifier}.`{label}`"
-        return cls(
+        item = cls(
             qualified_identifier=relation_qualified_identifier,
             query_name=relation_query_name,
             label=label,
             type_label="t",
             connection=parent.connection,
             parent=parent,
+            rows_estimate=rows_estimate,
+            data_bytes=data_bytes,
+            index_bytes=index_bytes,
         )
+        item.type_label = item.stats_label()
+        return item
+
+    @property
+    def total_bytes(self) -> int | None:
+        if self.data_bytes is None and self.index_bytes is None:
+            return None
+        return (self.data_bytes or 0) + (self.index_bytes or 0)
+
+    def stats_label(self) -> str:
+        """
+        The type label, with the estimated row count and size on disk, e.g.,
+        "t ~1.2M 340.5 MB".
+        """
+        parts = ["t"]
+        if self.rows_estimate is not None:
+            parts.append(f"~{format_row_count(self.rows_estimate)}")
+        if self.total_bytes is not None:
+            parts.append(format_bytes(self.total_bytes))
+        return " ".join(parts)
 
 
 @dataclass
@@ -116,6 +320,9 @@ class DatabaseCatalogItem(InteractiveCatalogItem["HarlequinMySQLConnection"]):
         ("Set Editor Context (USE)", execute_use_statement),
         ("Drop Database", execute_drop_database_statement),
     ]
+    # the keys of each relation, by relation label, or None if they have
+    # not been loaded.
+    keys: dict[str, RelationKeys] | None = field(default=None, repr=False)
 
     @classmethod
     def from_label(
@@ -133,22 +340,130 @@ class DatabaseCatalogItem(InteractiveCatalogItem["HarlequinMySQLConnection"]):
     def fetch_children(self) -> list[RelationCatalogItem]:
         if self.connection is None:
             return []
-        children: list[RelationCatalogItem] = []
         result = self.connection._get_relations(self.label)
-        for table_label, table_type in result:
-            if table_type == "VIEW":
-                children.append(
-                    ViewCatalogItem.from_parent(
-                        parent=self,
-                        label=table_label,
-                    )
-                )
-            else:
-                children.append(
-                    TableCatalogItem.from_parent(
-                        parent=self,
-                        label=table_label,
-                    )
+        return [self.relation_from_row(*row) for row in result]
+
+    def get_relation_keys(self, label: str) -> RelationKeys | None:
+        """
+        Returns the indexes and foreign keys of one of this database's
+        relations. The first call loads the keys of every relation in the
+        database, in two queries.
+        """
+        if self.keys is None:
+            if self.connection is None:
+                return None
+            self.keys = self.connection._get_relation_keys(self.label)
+        return self.keys.get(label)
+
+    def refresh(self, changed_relations: Collection[str] = ()) -> None:
+        """
+        Re-fetches this database's relations, if they have been loaded. Loaded
+        relations that still exist keep their children, unless they are
+        in changed_relations.
+        """
+        if not self.loaded:
+            return
+        self.keys = None
+        existing = {
+            (item.label, type(item)): item
+            for item in self.children
+            if item.label not in changed_relations
+        }
+        children: list[CatalogItem] = []
+        for item in self.fetch_children():
+            kept = existing.get((item.label, type(item)))
+            if isinstance(kept, TableCatalogItem) and isinstance(
+                item, TableCatalogItem
+            ):
+                # keep the loaded columns, but show the fresh statistics.
+                kept.rows_estimate = item.rows_estimate
+                kept.data_bytes = item.data_bytes
+                kept.index_bytes = item.index_bytes
+                kept.type_label = kept.stats_label()
+            children.append(kept or item)
+        self.children = children
+
+    def relation_from_row(
+        self,
+        label: str,
+        table_type: str,
+        rows_estimate: int | None = None,
+        data_bytes: int | None = None,
+        index_bytes: int | None = None,
+    ) -> RelationCatalogItem:
+        if table_type == "VIEW":
+            return ViewCatalogItem.from_parent(parent=self, label=label)
+        else:
+            return TableCatalogItem.from_parent(
+                parent=self,
+                label=label,
+                rows_estimate=_int_or_none(rows_estimate),
+                data_bytes=_int_or_none(data_bytes),
+                index_bytes=_int_or_none(index_bytes),
+            )
+
+
+def _int_or_none(value: Any) -> int | None:
+    return None if value is None else int(value)
+
+
+def build_catalog_tree(
+    connection: "HarlequinMySQLConnection",
+    relations: Iterable[Sequence[Any]],
+    columns: Iterable[tuple[str, str, str, str]],
+    keys: Iterable[tuple[Any, ...]] | None = None,
+) -> list[DatabaseCatalogItem]:
+    """
+    Builds a fully-loaded catalog tree from rows of
+    (database, relation, relation type, rows, data bytes, index bytes), where
+    everything but the database is None for a database without relations,
+    and rows of (database, relation, column, column type). The statistics
+    may be omitted. If rows of keys (see group_key_rows) are passed, they
+    are added to each relation, and otherwise they are loaded when a
+    relation is expanded.
+    """
+    databases: dict[str, DatabaseCatalogItem] = {}
+    relations_by_name: dict[tuple[str, str], RelationCatalogItem] = {}
+    for db_name, rel_name, rel_type, *stats in relations:
+        db_item = databases.get(db_name)
+        if db_item is None:
+            db_item = DatabaseCatalogItem.from_label(
+                label=db_name, connection=connection
+            )
+            db_item.loaded = True
+            databases[db_name] = db_item
+        if rel_name is None or rel_type is None:
+            continue
+        rel_item = db_item.relation_from_row(rel_name, rel_type, *stats)
+        rel_item.loaded = True
+        db_item.children.append(rel_item)
+        relations_by_name[(db_name, rel_name)] = rel_item
+
+    for db_name, rel_name, col_name, col_type in columns:
+        parent = relations_by_name.get((db_name, rel_name))
+        if parent is None:
+            # the relation was created after we read the relations.
+            continue
+        parent.children.append(
+            ColumnCatalogItem.from_parent(
+                parent=parent,
+                label=col_name,
+                type_label=connection._short_column_type(col_type),
+            )
+        )
+
+    if keys is not None:
+        keys_by_database: dict[str, dict[str, RelationKeys]] = {
+            db_name: {} for db_name in databases
+        }
+        for (db_name, rel_name), rel_keys in group_key_rows(keys).items():
+            keys_by_database.setdefault(db_name, {})[rel_name] = rel_keys
+            parent = relations_by_name.get((db_name, rel_name))
+            if parent is not None:
+                parent.children.extend(
+                    parent.key_items(parent.column_items(), rel_keys)
                 )
+        for db_name, db_item in databases.items():
+            db_item.keys = keys_by_database[db_name]
 
-        return children
+    return list(databases.values())
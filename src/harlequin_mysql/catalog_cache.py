@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+from platformdirs import user_cache_dir
+
+# bump this whenever the shape of the cached rows changes; older caches
+# are ignored.
+CACHE_VERSION = 3
+
+
+def default_cache_dir() -> Path:
+    return Path(user_cache_dir(appname="harlequin-mysql")) / "catalog"
+
+
+@dataclass
+class SchemaSnapshot:
+    """
+    The cached catalog rows for one database, and the fingerprint of
+    information_schema they were read at.
+    """
+
+    fingerprint: list[str | None]
+    # rows from _stream_relation_rows, _stream_column_rows, and
+    # _stream_key_rows, without the leading database name.
+    relations: list[list[Any]] = field(default_factory=list)
+    columns: list[list[Any]] = field(default_factory=list)
+    keys: list[list[Any]] = field(default_factory=list)
+
+
+class CatalogCache:
+    """
+    A catalog tree, saved as rows in a JSON file in the user's cache directory,
+    keyed by the user and the adapter's connection_id.
+    """
+
+    def __init__(self, key: str, cache_dir: Path | None = None) -> None:
+        self.key = key
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        self.path = (cache_dir or default_cache_dir()) / f"{digest}.json"
+        self.schemas: dict[str, SchemaSnapshot] = {}
+
+    def load(self) -> bool:
+        """
+        Loads the cache from disk. Returns False if there is no usable cache.
+        """
+        try:
+            with self.path.open("r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != CACHE_VERSION or data.get("key") != self.key:
+            return False
+        self.schemas = {
+            db_name: SchemaSnapshot(**snapshot)
+            for db_name, snapshot in data["schemas"].items()
+        }
+        return True
+
+    def save(self) -> None:
+        """
+        Writes the cache to disk, atomically.
+        """
+        data = {
+            "version": CACHE_VERSION,
+            "key": self.key,
+            "schemas": {
+                db_name: {
+                    "fingerprint": snapshot.fingerprint,
+                    "relations": snapshot.relations,
+                    "columns": snapshot.columns,
+                    "keys": snapshot.keys,
+                }
+                for db_name, snapshot in self.schemas.items()
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, self.path)
+
+    def relation_rows(self) -> Iterator[tuple[Any, ...]]:
+        for db_name, snapshot in self.schemas.items():
+            if not snapshot.relations:
+                yield (db_name, None, None, None, None, None)
+            for row in snapshot.relations:
+                yield (db_name, *row)
+
+    def column_rows(self) -> Iterator[tuple[Any, ...]]:
+        for db_name, snapshot in self.schemas.items():
+            for row in snapshot.columns:
+                yield (db_name, *row)
+
+    def key_rows(self) -> Iterator[tuple[Any, ...]]:
+        for db_name, snapshot in self.schemas.items():
+            for row in snapshot.keys:
+                yield (db_name, *row)
+
+    def diff(
+        self, fingerprints: dict[str, list[str | None]]
+    ) -> tuple[list[str], list[str]]:
+        """
+        Compares fresh fingerprints to the cached ones, and returns the
+        databases that are new or changed, and the databases that no
+        longer exist.
+        """
+        changed = [
+            db_name
+            for db_name, fingerprint in fingerprints.items()
+            if db_name not in self.schemas
+            or self.schemas[db_name].fingerprint != fingerprint
+        ]
+        dropped = [db_name for db_name in self.schemas if db_name not in fingerprints]
+        return changed, dropped
+
+    def update(
+        self,
+        fingerprints: dict[str, list[str | None]],
+        db_names: Sequence[str],
+        relation_rows: Iterable[Sequence[Any]],
+        column_rows: Iterable[Sequence[Any]],
+        key_rows: Iterable[Sequence[Any]] = (),
+        dropped: Sequence[str] = (),
+    ) -> None:
+        """
+        Replaces the cached rows for db_names with fresh rows.
+        """
+        for db_name in dropped:
+            self.schemas.pop(db_name, None)
+        fresh = {
+            db_name: SchemaSnapshot(fingerprint=fingerprints.get(db_name, []))
+            for db_name in db_names
+        }
+        for db_name, *rel_row in relation_rows:
+            if db_name in fresh and rel_row[0] is not None:
+                fresh[db_name].relations.append(rel_row)
+        for db_name, *col_row in column_rows:
+            if db_name in fresh:
+                fresh[db_name].columns.append(col_row)
+        for db_name, *key_row in key_rows:
+            if db_name in fresh:
+                fresh[db_name].keys.append(key_row)
+        self.schemas.update(fresh)
+        self.schemas = dict(sorted(self.schemas.items()))
@@ -3,9 +3,12 @@ from __future__ import annotations
 from harlequin.options import (
     FlagOption,
     PathOption,
+    SelectOption,
     TextOption,
 )
 
+from harlequin_mysql.streaming import parse_bytes
+
 
 def _int_validator(s: str | None) -> tuple[bool, str]:
     if s is None:
@@ -18,6 +21,28 @@ def _int_validator(s: str | None) -> tuple[bool, str]:
         return True, ""
 
 
+def _float_validator(s: str | None) -> tuple[bool, str]:
+    if s is None:
+        return True, ""
+    try:
+        _ = float(s)
+    except ValueError:
+        return False, f"Cannot convert {s} to a number!"
+    else:
+        return True, ""
+
+
+def _bytes_validator(s: str | None) -> tuple[bool, str]:
+    if s is None:
+        return True, ""
+    try:
+        _ = parse_bytes(s)
+    except ValueError as e:
+        return False, str(e)
+    else:
+        return True, ""
+
+
 host = TextOption(
     name="host",
     description=("The host name or IP address of the MySQL server."),
@@ -132,12 +157,250 @@ pool_size = TextOption(
 )
 
 
+pool_max_size = TextOption(
+    name="pool-max-size",
+    description=(
+        "The maximum number of connections Harlequin will open. When all of the "
+        "--pool-size connections are busy, the pool grows up to this size, and "
+        "connections above --pool-size are closed after they sit idle. Must be "
+        "an integer. Defaults to twice --pool-size."
+    ),
+    validator=_int_validator,
+)
+
+
+pool_timeout = TextOption(
+    name="pool-timeout",
+    description=(
+        "How long (in seconds) a query waits for a connection when every "
+        "connection is busy, before Harlequin shows an error. Defaults to 10."
+    ),
+    validator=_float_validator,
+)
+
+
+metadata_pool_size = TextOption(
+    name="metadata-pool-size",
+    description=(
+        "The number of connections reserved for loading the Data Catalog and "
+        "completions, so they aren't blocked by long-running queries. Must be an "
+        "integer. Set to 0 to share the main pool. Defaults to 2."
+    ),
+    validator=_int_validator,
+)
+
+
+pool_idle_timeout = TextOption(
+    name="pool-idle-timeout",
+    description=(
+        "How long (in seconds) a connection above --pool-size can sit idle "
+        "before it is closed. Defaults to 300."
+    ),
+    validator=_float_validator,
+)
+
+
 enable_cleartext_plugin = FlagOption(
     name="enable-cleartext-plugin",
     description="Enable the cleartext authentication plugin for MySQL connections.",
 )
 
 
+LIMIT_PUSHDOWN_MODES = ["off", "kill", "close"]
+
+limit_pushdown = SelectOption(
+    name="limit-pushdown",
+    description=(
+        "Push Harlequin's row limit down to the server. When not off, plain "
+        "SELECT statements are rewritten with a LIMIT clause, and other result "
+        "sets that return more rows than the limit are stopped early, either "
+        "with KILL QUERY (kill) or by closing the connection (close), instead "
+        "of reading and discarding the remaining rows."
+    ),
+    choices=LIMIT_PUSHDOWN_MODES,
+    default="off",
+)
+
+
+EXPLAIN_MODES = ["off", "plan", "analyze"]
+
+explain = SelectOption(
+    name="explain",
+    description=(
+        "Profile statements instead of running them. With plan, each SELECT, "
+        "INSERT, UPDATE, DELETE, or REPLACE statement is sent as EXPLAIN "
+        "FORMAT=JSON, and its parsed plan (cost, rows, and access type for "
+        "each node) is shown as its result, with full scans and filesorts "
+        "flagged. With analyze, queries are run with EXPLAIN ANALYZE (MySQL "
+        "8.0.18+), which adds the measured rows and time for each node. Other "
+        "statements run as usual."
+    ),
+    choices=EXPLAIN_MODES,
+    default="off",
+)
+
+
+arrow_fetch = FlagOption(
+    name="arrow-fetch",
+    description=(
+        "Build query results as Arrow tables, one batch of rows at a time, "
+        "instead of lists of tuples. Uses less memory for large results."
+    ),
+)
+
+
+fetch_memory_budget = TextOption(
+    name="fetch-memory-budget",
+    description=(
+        "The maximum size of a single query result, e.g., 500MB. Results are "
+        "streamed in batches, and streaming stops before the budget is exceeded. "
+        "Harlequin's row limit still applies."
+    ),
+    validator=_bytes_validator,
+)
+
+
+max_execution_time = TextOption(
+    name="max-execution-time",
+    description=(
+        "The longest a SELECT statement may run on the server, in seconds. "
+        "Sent as a MAX_EXECUTION_TIME optimizer hint (or max_statement_time, "
+        "for MariaDB). Must be a number."
+    ),
+    validator=_float_validator,
+)
+
+
+max_result_rows = TextOption(
+    name="max-result-rows",
+    description=(
+        "The maximum number of rows a query may return. Queries that return more "
+        "are stopped, and show an error instead of their results. Must be an "
+        "integer."
+    ),
+    validator=_int_validator,
+)
+
+
+max_result_bytes = TextOption(
+    name="max-result-bytes",
+    description=(
+        "The maximum size of a query's result, e.g., 1GB. Queries that return "
+        "more are stopped, and show an error instead of their results."
+    ),
+    validator=_bytes_validator,
+)
+
+
+result_cache_size = TextOption(
+    name="result-cache-size",
+    description=(
+        "Cache the results of SELECT statements in memory, up to this size "
+        "(e.g., 256MB), and show the cached result when the same query is run "
+        "again against the same database. The least recently used results are "
+        "evicted first. The cache is cleared after any statement that could "
+        "change data or the schema. Off by default."
+    ),
+    validator=_bytes_validator,
+)
+
+
+result_cache_ttl = TextOption(
+    name="result-cache-ttl",
+    description=(
+        "How long a cached result is reused, in seconds, when using "
+        "--result-cache-size. Must be a number. Defaults to 300."
+    ),
+    validator=_float_validator,
+)
+
+
+prepared_statements = FlagOption(
+    name="prepared-statements",
+    description=(
+        "Run SELECT statements as prepared statements, so their results are sent "
+        "in MySQL's binary protocol, and numeric and temporal values are decoded "
+        "from binary instead of parsed from text. Statements that can't be "
+        "prepared are sent as text."
+    ),
+)
+
+
+raw_fetch = FlagOption(
+    name="raw-fetch",
+    description=(
+        "Use the connector's C extension, and fetch results as raw bytes. Values "
+        "are converted to Arrow one column at a time, only for the rows that are "
+        "shown, instead of to a Python object per value. Implies --arrow-fetch. "
+        "Requires the C extension."
+    ),
+)
+
+
+query_trace = TextOption(
+    name="query-trace",
+    description=(
+        "Record how long each phase of every query takes (pool checkout, "
+        "execute, time to first row, fetch, and release), and how many rows "
+        "and bytes it returns. Set to log to write each trace to the log, otel "
+        "to export them as OpenTelemetry spans (requires opentelemetry-api), "
+        "or a file path to append them as JSON lines. Off by default."
+    ),
+)
+
+
+statement_stats = FlagOption(
+    name="statement-stats",
+    description=(
+        "After each query, read the server's statistics for it (rows examined, "
+        "temporary tables, sort merge passes, lock time, and index use) from "
+        "performance_schema.events_statements_history, and keep a summary of "
+        "the session's queries. Requires performance_schema, and SELECT on it."
+    ),
+)
+
+
+bulk_catalog = FlagOption(
+    name="bulk-catalog",
+    description=(
+        "Load the entire catalog (databases, tables, views, and columns) at once, "
+        "using two queries against information_schema, instead of loading each "
+        "database and table as it is expanded. Faster for large catalogs on "
+        "high-latency connections."
+    ),
+)
+
+
+catalog_cache = FlagOption(
+    name="catalog-cache",
+    description=(
+        "Save the catalog to a local cache, and show the cached catalog immediately "
+        "on startup. The cache is revalidated in the background, and only "
+        "databases that changed are re-fetched. Implies --bulk-catalog."
+    ),
+)
+
+
+schema_completions = FlagOption(
+    name="schema-completions",
+    description=(
+        "Offer database, table, and column names as completions. The names are "
+        "loaded in the background after connecting, starting with the current "
+        "database, and updated after DDL statements."
+    ),
+)
+
+
+schema_completions_limit = TextOption(
+    name="schema-completions-limit",
+    description=(
+        "The maximum number of database, table, and column completions to load "
+        "when using --schema-completions. Must be an integer. Defaults to 50000."
+    ),
+    validator=_int_validator,
+)
+
+
 MYSQLADAPTER_OPTIONS = [
     host,
     port,
@@ -154,5 +417,26 @@ MYSQLADAPTER_OPTIONS = [
     ssl_key,
     openid_token_file,
     pool_size,
+    pool_max_size,
+    pool_timeout,
+    pool_idle_timeout,
+    metadata_pool_size,
     enable_cleartext_plugin,
+    limit_pushdown,
+    explain,
+    arrow_fetch,
+    fetch_memory_budget,
+    max_execution_time,
+    max_result_rows,
+    max_result_bytes,
+    result_cache_size,
+    result_cache_ttl,
+    prepared_statements,
+    raw_fetch,
+    query_trace,
+    statement_stats,
+    bulk_catalog,
+    catalog_cache,
+    schema_completions,
+    schema_completions_limit,
 ]
@@ -1,48 +1,170 @@
+"""
+Keyword and function completions.
+
+The completions are parsed from keywords.csv and functions.tsv ahead of
+time, and stored in _completions_data.py, which loads much faster than
+re-parsing the source files. After editing either source file, regenerate
+the data module with `make completions`.
+"""
+
 from __future__ import annotations
 
 import csv
+import json
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from harlequin import HarlequinCompletion
 
 WORD = re.compile(r"\w+")
 
+KEYWORDS_PATH = Path(__file__).parent / "keywords.csv"
+FUNCTIONS_PATH = Path(__file__).parent / "functions.tsv"
+DATA_PATH = Path(__file__).parent / "_completions_data.py"
+
+Version = tuple[int, ...]
+
+# (label, type_label, priority, since, until); the value is always the same as
+# the label. The completion is available in server versions since <= v < until.
+# until is None if the keyword or function has not been removed or deprecated,
+# and () if it has been deprecated in every version.
+CompletionRow = tuple[str, str, int, Version, Version | None]
+
+# keywords.csv only records whether a keyword was removed in MySQL 8.0.
+KEYWORDS_REMOVED_IN: Version = (8, 0, 0)
+
+
+def load_completions(version: Version | None = None) -> list[HarlequinCompletion]:
+    """
+    Returns the keyword and function completions available in a MySQL server
+    version, or, if version is None, the completions that have not been
+    removed or deprecated in any version. The completions for each version
+    are built once per process; each call returns a new list.
+    """
+    return list(_completions(version))
+
+
+@lru_cache(maxsize=None)
+def _completions(version: Version | None) -> tuple[HarlequinCompletion, ...]:
+    from harlequin_mysql._completions_data import UNVERSIONED, VERSIONED
+
+    # positional arguments are noticeably faster than keywords here.
+    completions = [
+        HarlequinCompletion(label, type_label, label, priority, None)
+        for type_label, priority, labels in UNVERSIONED
+        for label in labels.splitlines()
+    ]
+    completions.extend(
+        HarlequinCompletion(label, type_label, label, priority, None)
+        for label, type_label, priority, since, until in VERSIONED
+        if is_available(since, until, version)
+    )
+    return tuple(completions)
+
 
-def load_completions() -> list[HarlequinCompletion]:
-    completions: list[HarlequinCompletion] = []
+def is_available(
+    since: Version, until: Version | None, version: Version | None
+) -> bool:
+    if version is None:
+        return until is None
+    return since <= version and (until is None or version < until)
 
-    keywords_path = Path(__file__).parent / "keywords.csv"
-    with keywords_path.open("r") as f:
+
+def parse_version(version: str) -> Version:
+    """
+    Parses versions from functions.tsv, like "8.0.16". Returns () for "Yes",
+    which is used for functions deprecated in every version.
+    """
+    if not version[:1].isdigit():
+        return ()
+    return tuple(int(part) for part in version.split("."))
+
+
+def parse_completion_sources() -> list[CompletionRow]:
+    """
+    Parses keywords.csv and functions.tsv into completion rows.
+    """
+    rows: list[CompletionRow] = []
+
+    with KEYWORDS_PATH.open("r") as f:
         reader = csv.reader(f, dialect="unix")
         for name, reserved, removed in reader:
-            if removed == "False":
-                completions.append(
-                    HarlequinCompletion(
-                        label=name.lower(),
-                        type_label="kw",
-                        value=name.lower(),
-                        priority=100 if reserved else 1000,
-                        context=None,
-                    )
-                )
-
-    functions_path = Path(__file__).parent / "functions.tsv"
-    with functions_path.open("r") as f:
+            until = None if removed == "False" else KEYWORDS_REMOVED_IN
+            rows.append((name.lower(), "kw", 100 if reserved else 1000, (), until))
+
+    with FUNCTIONS_PATH.open("r") as f:
         reader = csv.reader(f, dialect="unix", delimiter="\t")
-        for name, _, _, deprecated in reader:
-            if deprecated:
+        for name, _, introduced, deprecated in reader:
+            if name == "Name":
+                # header row
                 continue
+            since = parse_version(introduced) if introduced else ()
+            until = parse_version(deprecated) if deprecated else None
             for alias in name.split(", "):
                 if WORD.match(alias):
-                    completions.append(
-                        HarlequinCompletion(
-                            label=alias.split("...")[0].split("(")[0].lower(),
-                            type_label="fn",
-                            value=alias.split("...")[0].split("(")[0].lower(),
-                            priority=1000,
-                            context=None,
-                        )
-                    )
-
-    return completions
+                    label = alias.split("...")[0].split("(")[0].lower()
+                    rows.append((label, "fn", 1000, since, until))
+
+    return rows
+
+
+def render_completion_data(rows: list[CompletionRow]) -> str:
+    """
+    Renders the data module. The labels of rows that are available in every
+    version are grouped by (type_label, priority) into one string each. The
+    compiler interns string constants that look like identifiers, and
+    interning a thousand labels while importing the module costs more than
+    parsing the source files, so they are kept in a few long strings that
+    are split when the completions are built.
+    """
+    groups: dict[tuple[str, int], list[str]] = {}
+    versioned: list[CompletionRow] = []
+    for label, type_label, priority, since, until in rows:
+        if since == () and until is None:
+            groups.setdefault((type_label, priority), []).append(label)
+        else:
+            versioned.append((label, type_label, priority, since, until))
+    lines = [
+        "# This file is generated from keywords.csv and functions.tsv by",
+        "# `make completions`. Do not edit it by hand.",
+        "",
+        "from __future__ import annotations",
+        "",
+        "# completions available in every server version, as",
+        "# (type_label, priority, labels), with one label per line.",
+        "UNVERSIONED: tuple[tuple[str, int, str], ...] = (",
+    ]
+    for (type_label, priority), labels in groups.items():
+        lines.extend(
+            [
+                "    (",
+                f"        {json.dumps(type_label)},",
+                f"        {priority},",
+                "        (",
+                *(f"            {json.dumps(label + chr(10))}" for label in labels),
+                "        ),",
+                "    ),",
+            ]
+        )
+    lines.extend(
+        [
+            ")",
+            "",
+            "# the other completions, as (label, type_label, priority, since, until).",
+            "VERSIONED: tuple[tuple[str, str, int, tuple[int, ...], "
+            "tuple[int, ...] | None], ...] = (",
+            *(
+                f"    ({json.dumps(label)}, {json.dumps(type_label)}, {priority}, "
+                f"{since!r}, {until!r}),"
+                for label, type_label, priority, since, until in versioned
+            ),
+            ")",
+            "",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def write_completion_data() -> None:
+    DATA_PATH.write_text(render_completion_data(parse_completion_sources()))
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from mysql.connector import Error, connect
+from mysql.connector.abstracts import MySQLConnectionAbstract
+from mysql.connector.constants import DEFAULT_CONFIGURATION
+
+# the longest we let a cancel take, including (re)connecting.
+DEFAULT_CANCEL_TIMEOUT_SECONDS = 5.0
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CancelStats:
+    """
+    How many times queries were cancelled, how many KILL QUERY statements
+    succeeded and failed, and how long each cancel took.
+    """
+
+    cancels: int = 0
+    kills: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seconds: float | None = None
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.cancels if self.cancels else 0.0
+
+
+class ControlConnection:
+    """
+    A dedicated connection, outside of the connection pools, used to send
+    KILL QUERY, so queries can be cancelled even when every pooled
+    connection is busy.
+
+    Every operation is bounded by timeout seconds: the connection is opened
+    with a connect timeout (and read and write timeouts, if the connector
+    supports them), and callers give up if another cancel holds the
+    connection for too long.
+    """
+
+    def __init__(
+        self, timeout: float = DEFAULT_CANCEL_TIMEOUT_SECONDS, **config: Any
+    ) -> None:
+        self.timeout = timeout
+        self.stats = CancelStats()
+        self._config = {
+            **config,
+            "autocommit": True,
+            "connection_timeout": min(
+                config.get("connection_timeout") or timeout, timeout
+            ),
+        }
+        for option in ("read_timeout", "write_timeout"):
+            if option in DEFAULT_CONFIGURATION:
+                self._config[option] = timeout
+        self._cnx: MySQLConnectionAbstract | None = None
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        """
+        Opens the connection ahead of time, so the first cancel doesn't pay
+        for connecting. Errors are logged, not raised.
+        """
+        if not self._lock.acquire(timeout=self.timeout):
+            return
+        try:
+            self._ensure_connected()
+        except Error as e:
+            logger.warning("Could not open the control connection: %s", e)
+        finally:
+            self._lock.release()
+
+    def kill_query(self, connection_id: int) -> bool:
+        """
+        Sends KILL QUERY for the query running on connection_id. Returns True
+        if the KILL was sent.
+        """
+        return self.kill_queries([connection_id]) == [connection_id]
+
+    def kill_queries(self, connection_ids: list[int]) -> list[int]:
+        """
+        Sends KILL QUERY for each connection id, and returns the ids that
+        were killed.
+        """
+        if not connection_ids:
+            return []
+        start = time.perf_counter()
+        if not self._lock.acquire(timeout=self.timeout):
+            self._record(start, killed=0, failed=len(connection_ids), timed_out=True)
+            return []
+        killed: list[int] = []
+        try:
+            cnx = self._ensure_connected()
+            cur = cnx.cursor()
+            try:
+                for connection_id in connection_ids:
+                    if time.perf_counter() - start > self.timeout:
+                        break
+                    try:
+                        cur.execute("KILL QUERY %s", (connection_id,))
+                    except Error as e:
+                        # the query (or connection) may have already finished.
+                        logger.debug("Could not kill %s: %s", connection_id, e)
+                    else:
+                        killed.append(connection_id)
+            finally:
+                cur.close()
+        except Error as e:
+            logger.warning("Could not cancel queries: %s", e)
+            self._disconnect()
+        finally:
+            self._record(
+                start,
+                killed=len(killed),
+                failed=len(connection_ids) - len(killed),
+                timed_out=False,
+            )
+            self._lock.release()
+        return killed
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _ensure_connected(self) -> MySQLConnectionAbstract:
+        # must be called with self._lock held.
+        if self._cnx is None or not self._cnx.is_connected():
+            self._disconnect()
+            self._cnx = connect(**self._config)  # type: ignore[assignment]
+        assert self._cnx is not None
+        return self._cnx
+
+    def _disconnect(self) -> None:
+        if self._cnx is not None:
+            try:
+                self._cnx.disconnect()
+            except Error:
+                pass
+            self._cnx = None
+
+    def _record(self, start: float, killed: int, failed: int, timed_out: bool) -> None:
+        elapsed = time.perf_counter() - start
+        stats = self.stats
+        stats.cancels += 1
+        stats.kills += killed
+        stats.failures += failed
+        if timed_out:
+            stats.timeouts += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        stats.last_seconds = elapsed
+        if elapsed > self.timeout:
+            logger.warning("Cancelling queries took %.2fs", elapsed)
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+# the columns of a parsed plan, as (name, Harlequin short type).
+PLAN_COLUMNS = [
+    ("node", "s"),
+    ("table", "s"),
+    ("access_type", "s"),
+    ("key", "s"),
+    ("rows", "#.#"),
+    ("cost", "#.#"),
+    ("actual_rows", "#.#"),
+    ("actual_ms", "#.#"),
+    ("loops", "##"),
+    ("flags", "s"),
+]
+
+# EXPLAIN ANALYZE requires MySQL 8.0.18.
+ANALYZE_MIN_VERSION = (8, 0, 18)
+
+FULL_SCAN = "full scan"
+FULL_INDEX_SCAN = "full index scan"
+FILESORT = "filesort"
+TEMPORARY = "temporary table"
+
+# EXPLAIN FORMAT=JSON (version 1) objects that become nodes, and their labels.
+_JSON_OPERATIONS = {
+    "query_block": "select",
+    "ordering_operation": "order",
+    "grouping_operation": "group",
+    "duplicates_removal": "distinct",
+    "windowing": "window",
+    "union_result": "union",
+    "materialized_from_subquery": "materialize",
+}
+
+# e.g., "-> Index lookup on t using idx (a=1)  (cost=0.35 rows=1)
+# (actual time=0.01..0.02 rows=1 loops=1)"
+_TREE_LINE_PROG = re.compile(
+    r"^(?P<indent> *)-> (?P<op>.*?)"
+    r"(?:  \(cost=(?:[\d.e+-]+\.\.)?(?P<cost>[\d.e+-]+) rows=(?P<rows>[\d.e+-]+)\))?"
+    r"(?: \(actual time=[\d.e+-]+\.\.(?P<ms>[\d.e+-]+) "
+    r"rows=(?P<arows>[\d.e+-]+) loops=(?P<loops>\d+)\)| \(never executed\))?$"
+)
+_TREE_TABLE_PROG = re.compile(r" on (`[^`]+`|\S+)(?: using (`[^`]+`|\S+))?")
+# tree operations, and the access types they correspond to.
+_TREE_ACCESS_TYPES = [
+    ("Table scan", "ALL"),
+    ("Covering index scan", "index"),
+    ("Index scan", "index"),
+    ("Index range scan", "range"),
+    ("Covering index range scan", "range"),
+    ("Single-row index lookup", "eq_ref"),
+    ("Single-row covering index lookup", "eq_ref"),
+    ("Covering index lookup", "ref"),
+    ("Index lookup", "ref"),
+    ("Constant row", "const"),
+]
+
+
+@dataclass
+class PlanNode:
+    """
+    One operation in a query plan, at a depth in the plan tree.
+    """
+
+    depth: int
+    operation: str
+    table: str | None = None
+    access_type: str | None = None
+    key: str | None = None
+    # the optimizer's estimates.
+    rows: float | None = None
+    cost: float | None = None
+    # measured by EXPLAIN ANALYZE.
+    actual_rows: float | None = None
+    actual_ms: float | None = None
+    loops: int | None = None
+    flags: tuple[str, ...] = ()
+
+    def as_row(self) -> tuple[Any, ...]:
+        return (
+            "  " * self.depth + self.operation,
+            self.table,
+            self.access_type,
+            self.key,
+            self.rows,
+            self.cost,
+            self.actual_rows,
+            self.actual_ms,
+            self.loops,
+            ", ".join(self.flags) or None,
+        )
+
+
+def _float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _access_flags(access_type: str | None) -> tuple[str, ...]:
+    if access_type == "ALL":
+        return (FULL_SCAN,)
+    elif access_type == "index":
+        return (FULL_INDEX_SCAN,)
+    return ()
+
+
+def parse_json_plan(plan: str | dict[str, Any]) -> list[PlanNode]:
+    """
+    Parses the output of EXPLAIN FORMAT=JSON, in MySQL's original format,
+    MySQL's version 2 format (explain_json_format_version=2), or MariaDB's
+    format, into a list of plan nodes, in tree order.
+    """
+    doc = json.loads(plan) if isinstance(plan, str) else plan
+    nodes: list[PlanNode] = []
+    if "operation" in doc:
+        _walk_v2(doc, 0, nodes)
+    else:
+        _walk_v1(doc, 0, nodes)
+    return nodes
+
+
+def _walk_v1(value: Any, depth: int, nodes: list[PlanNode]) -> None:
+    if isinstance(value, list):
+        for item in value:
+            _walk_v1(item, depth, nodes)
+        return
+    if not isinstance(value, dict):
+        return
+    for key, child in value.items():
+        if key == "table" and isinstance(child, dict):
+            nodes.append(_json_table_node(child, depth))
+            _walk_v1(child, depth + 1, nodes)
+        elif key in _JSON_OPERATIONS and isinstance(child, dict):
+            nodes.append(_json_operation_node(key, child, depth))
+            _walk_v1(child, depth + 1, nodes)
+        elif isinstance(child, (dict, list)):
+            _walk_v1(child, depth, nodes)
+
+
+def _json_operation_node(key: str, obj: dict[str, Any], depth: int) -> PlanNode:
+    cost_info = obj.get("cost_info") or {}
+    flags: list[str] = []
+    if obj.get("using_filesort") or obj.get("filesort"):
+        flags.append(FILESORT)
+    if obj.get("using_temporary_table") or obj.get("temporary_table"):
+        flags.append(TEMPORARY)
+    label = _JSON_OPERATIONS[key]
+    if key == "query_block" and obj.get("select_id") is not None:
+        label = f"{label} #{obj['select_id']}"
+    return PlanNode(
+        depth=depth,
+        operation=label,
+        cost=_float(cost_info.get("query_cost") or cost_info.get("sort_cost")),
+        flags=tuple(flags),
+    )
+
+
+def _json_table_node(obj: dict[str, Any], depth: int) -> PlanNode:
+    cost_info = obj.get("cost_info") or {}
+    access_type = obj.get("access_type")
+    flags = list(_access_flags(access_type))
+    if obj.get("using_join_buffer"):
+        flags.append("join buffer")
+    return PlanNode(
+        depth=depth,
+        operation="table",
+        table=obj.get("table_name"),
+        access_type=access_type,
+        key=obj.get("key"),
+        rows=_float(obj.get("rows_examined_per_scan", obj.get("rows"))),
+        cost=_float(cost_info.get("prefix_cost") or cost_info.get("read_cost")),
+        flags=tuple(flags),
+    )
+
+
+def _walk_v2(obj: dict[str, Any], depth: int, nodes: list[PlanNode]) -> None:
+    operation = str(obj.get("operation", ""))
+    access_type = _tree_access_type(operation)
+    flags = list(_access_flags(access_type))
+    if operation.startswith("Sort"):
+        flags.append(FILESORT)
+    if obj.get("access_type") == "materialize" or "temporary" in operation:
+        flags.append(TEMPORARY)
+    nodes.append(
+        PlanNode(
+            depth=depth,
+            operation=operation,
+            table=obj.get("table_name"),
+            access_type=access_type,
+            key=obj.get("index_name"),
+            rows=_float(obj.get("estimated_rows")),
+            cost=_float(obj.get("estimated_total_cost")),
+            actual_rows=_float(obj.get("actual_rows")),
+            actual_ms=_float(obj.get("actual_last_row_ms")),
+            loops=obj.get("actual_loops"),
+            flags=tuple(flags),
+        )
+    )
+    for child in obj.get("inputs", []):
+        _walk_v2(child, depth + 1, nodes)
+
+
+def _tree_access_type(operation: str) -> str | None:
+    return next(
+        (
+            access_type
+            for prefix, access_type in _TREE_ACCESS_TYPES
+            if operation.startswith(prefix)
+        ),
+        None,
+    )
+
+
+def parse_tree_plan(plan: str) -> list[PlanNode]:
+    """
+    Parses the output of EXPLAIN ANALYZE (or EXPLAIN FORMAT=TREE) into a list
+    of plan nodes, in tree order.
+    """
+    nodes: list[PlanNode] = []
+    for line in plan.splitlines():
+        match = _TREE_LINE_PROG.match(line)
+        if match is None:
+            # e.g., a condition that wrapped onto the next line.
+            continue
+        operation = match.group("op")
+        access_type = _tree_access_type(operation)
+        flags = list(_access_flags(access_type))
+        if operation.startswith("Sort"):
+            flags.append(FILESORT)
+        if "temporary" in operation:
+            flags.append(TEMPORARY)
+        table = key = None
+        if access_type is not None and (
+            table_match := _TREE_TABLE_PROG.search(operation)
+        ):
+            table, key = table_match.groups()
+        loops = match.group("loops")
+        nodes.append(
+            PlanNode(
+                depth=len(match.group("indent")) // 4,
+                operation=operation,
+                table=table,
+                access_type=access_type,
+                key=key,
+                rows=_float(match.group("rows")),
+                cost=_float(match.group("cost")),
+                actual_rows=_float(match.group("arows")),
+                actual_ms=_float(match.group("ms")),
+                loops=int(loops) if loops is not None else None,
+                flags=tuple(flags),
+            )
+        )
+    return nodes
+
+
+def flagged_nodes(nodes: Sequence[PlanNode]) -> list[PlanNode]:
+    """
+    The nodes that scan a whole table or index, or sort with filesort.
+    """
+    return [
+        node
+        for node in nodes
+        if any(flag in (FULL_SCAN, FULL_INDEX_SCAN, FILESORT) for flag in node.flags)
+    ]
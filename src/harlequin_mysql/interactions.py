@@ -1,16 +1,15 @@
 from __future__ import annotations
 
 from textwrap import dedent
-from typing import TYPE_CHECKING, Literal, Sequence
+from typing import TYPE_CHECKING, Literal
 
-from harlequin.catalog import CatalogItem
-from harlequin.exception import HarlequinQueryError
+from harlequin.exception import HarlequinConnectionError, HarlequinQueryError
+from mysql.connector.errors import Error as MySQLError
 
 if TYPE_CHECKING:
     from harlequin.driver import HarlequinDriver
 
     from harlequin_mysql.catalog import (
-        ColumnCatalogItem,
         DatabaseCatalogItem,
         RelationCatalogItem,
     )
@@ -91,23 +90,25 @@ def show_select_star(
     item: "RelationCatalogItem",
     driver: "HarlequinDriver",
 ) -> None:
-    driver.insert_text_in_new_buffer(
-        dedent(
-            f"""
-            select *
-            from {item.qualified_identifier}
-            limit 100
-            """.strip("\n")
-        )
+    text = dedent(
+        f"""
+        select *
+        from {item.qualified_identifier}
+        limit 100
+        """.strip("\n")
     )
+    if item.connection is not None:
+        try:
+            text = item.connection.preview_query(item)
+        except (HarlequinConnectionError, HarlequinQueryError, MySQLError):
+            # fall back to the plain query if the primary key can't be read.
+            pass
+    driver.insert_text_in_new_buffer(text)
 
 
 def insert_columns_at_cursor(
     item: "RelationCatalogItem",
     driver: "HarlequinDriver",
 ) -> None:
-    if item.loaded:
-        cols: Sequence["CatalogItem" | "ColumnCatalogItem"] = item.children
-    else:
-        cols = item.fetch_children()
+    cols = item.column_items()
     driver.insert_text_at_selection(text=",\n".join(c.query_name for c in cols))
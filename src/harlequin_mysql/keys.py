@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+PRIMARY = "PRIMARY"
+# information_schema.statistics has no column name for functional indexes.
+EXPRESSION = "(expression)"
+
+
+@dataclass
+class IndexInfo:
+    name: str
+    unique: bool
+    columns: list[str] = field(default_factory=list)
+    # the server's estimate of the number of distinct values in the index.
+    cardinality: int | None = None
+
+    @property
+    def is_primary(self) -> bool:
+        return self.name == PRIMARY
+
+
+@dataclass
+class ForeignKeyInfo:
+    name: str
+    ref_database: str
+    ref_relation: str
+    columns: list[str] = field(default_factory=list)
+    ref_columns: list[str] = field(default_factory=list)
+
+
+@dataclass
+class RelationKeys:
+    """
+    The indexes (including the primary key) and foreign keys of a relation.
+    """
+
+    indexes: list[IndexInfo] = field(default_factory=list)
+    foreign_keys: list[ForeignKeyInfo] = field(default_factory=list)
+
+    @property
+    def primary_key(self) -> IndexInfo | None:
+        return next((index for index in self.indexes if index.is_primary), None)
+
+    def column_marker(self, column: str) -> str | None:
+        """
+        "pk" if the column is part of the primary key, "idx" if it is part
+        of any other index, or None.
+        """
+        if (pk := self.primary_key) is not None and column in pk.columns:
+            return "pk"
+        if any(column in index.columns for index in self.indexes):
+            return "idx"
+        return None
+
+
+def group_key_rows(
+    rows: Iterable[tuple[Any, ...]],
+) -> dict[tuple[str, str], RelationKeys]:
+    """
+    Groups rows from _stream_key_rows by (database, relation). Rows are
+    (database, relation, key name, non unique, position, column, cardinality,
+    referenced database, referenced relation, referenced column); the
+    referenced fields are None for indexes, and set for foreign keys. Rows
+    must be ordered by position within each key.
+    """
+    keys: dict[tuple[str, str], RelationKeys] = {}
+    indexes: dict[tuple[str, str, str], IndexInfo] = {}
+    foreign_keys: dict[tuple[str, str, str], ForeignKeyInfo] = {}
+    for (
+        db_name,
+        rel_name,
+        key_name,
+        non_unique,
+        _,
+        column,
+        cardinality,
+        ref_db_name,
+        ref_rel_name,
+        ref_column,
+    ) in rows:
+        relation_keys = keys.setdefault((db_name, rel_name), RelationKeys())
+        if ref_rel_name is None:
+            index = indexes.get((db_name, rel_name, key_name))
+            if index is None:
+                index = IndexInfo(name=key_name, unique=not int(non_unique or 0))
+                indexes[(db_name, rel_name, key_name)] = index
+                relation_keys.indexes.append(index)
+            index.columns.append(EXPRESSION if column is None else column)
+            if cardinality is not None:
+                # the cardinality of the last column is the index's.
+                index.cardinality = int(cardinality)
+        else:
+            foreign_key = foreign_keys.get((db_name, rel_name, key_name))
+            if foreign_key is None:
+                foreign_key = ForeignKeyInfo(
+                    name=key_name, ref_database=ref_db_name, ref_relation=ref_rel_name
+                )
+                foreign_keys[(db_name, rel_name, key_name)] = foreign_key
+                relation_keys.foreign_keys.append(foreign_key)
+            foreign_key.columns.append(column)
+            foreign_key.ref_columns.append(ref_column)
+    return keys
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from mysql.connector import Error, connect
+from mysql.connector.abstracts import MySQLConnectionAbstract
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import (
+    CONNECTION_POOL_LOCK,
+    MySQLConnectionPool,
+    PooledMySQLConnection,
+)
+
+# the most connections we open at once while warming up the pool.
+MAX_WARM_UP_WORKERS = 8
+
+# how long get_connection() waits for a connection, by default.
+DEFAULT_TIMEOUT_SECONDS = 10.0
+
+# how long a connection above the pool's minimum size can sit idle before
+# it is closed, by default.
+DEFAULT_IDLE_TIMEOUT_SECONDS = 300.0
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmUpStats:
+    """
+    How long it took to open the pool's connections.
+    """
+
+    first_connection_seconds: float | None = None
+    total_seconds: float | None = None
+    connections: int = 0
+    failures: int = 0
+
+
+@dataclass
+class PoolStats:
+    """
+    A snapshot of the pool's size and utilization, and how long callers of
+    get_connection() have waited for a connection.
+    """
+
+    min_size: int
+    max_size: int
+    open: int
+    in_use: int
+    peak_in_use: int
+    checkouts: int
+    waits: int
+    timeouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+    grown: int
+    shrunk: int
+
+    @property
+    def idle(self) -> int:
+        return self.open - self.in_use
+
+    @property
+    def utilization(self) -> float:
+        return self.in_use / self.max_size
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.waits if self.waits else 0.0
+
+
+class HarlequinConnectionPool(MySQLConnectionPool):
+    """
+    An elastic MySQLConnectionPool.
+
+    The pool opens pool_size connections concurrently: the first before
+    warm_up() returns, so connection errors are raised immediately, and the
+    rest in the background. When every connection is in use, the pool grows,
+    up to max_size connections; after that, get_connection() waits up to
+    timeout seconds for a connection to be returned, and then raises a
+    PoolError. Connections above pool_size that sit idle for idle_timeout
+    seconds are closed.
+    """
+
+    def __init__(
+        self,
+        pool_size: int,
+        pool_name: str,
+        max_size: int | None = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        **config: Any,
+    ) -> None:
+        # without any config, MySQLConnectionPool doesn't open connections.
+        super().__init__(
+            pool_size=pool_size, pool_name=pool_name, pool_reset_session=False
+        )
+        self.max_size = max(max_size or pool_size, pool_size)
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        # LIFO, so busy periods reuse the same connections, and the extra
+        # connections at the bottom of the stack go idle and can be closed.
+        self._cnx_queue: queue.Queue[MySQLConnectionAbstract] = queue.LifoQueue(
+            self.max_size
+        )
+        self.set_config(**config)
+        self.warm_up_stats = WarmUpStats()
+        # the version string the server sent on the first warm-up connection.
+        self.server_info: str | None = None
+        self._cond = threading.Condition()
+        self._closed = False
+        self._executor: ThreadPoolExecutor | None = None
+        # everything below is guarded by self._cond. _open counts
+        # connections that are open or being opened.
+        self._open = 0
+        self._warm_up_pending = 0
+        self._checked_out: set[int] = set()
+        self._idle_since: dict[int, float] = {}
+        self._peak_in_use = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._grown = 0
+        self._shrunk = 0
+
+    @property
+    def config(self) -> dict[str, Any]:
+        return dict(self._cnx_config)
+
+    def set_config(self, **kwargs: Any) -> None:
+        """
+        Updates the connection config. Unlike MySQLConnectionPool, kwargs are
+        merged into the existing config, so new connections can still be
+        opened after changing one option (like the database).
+        """
+        super().set_config(**{**self._cnx_config, **kwargs})
+
+    def warm_up(self, max_workers: int = MAX_WARM_UP_WORKERS) -> None:
+        """
+        Opens the first connection (and records the server's version from
+        it), then starts opening the rest of the pool's connections in the
+        background.
+        """
+        start = time.perf_counter()
+        self._reserve()
+        cnx = self._connect_reserved()
+        self.server_info = cnx.server_info
+        self.add_connection(cnx)
+        self.warm_up_stats.first_connection_seconds = time.perf_counter() - start
+        self.warm_up_stats.connections = 1
+        self._start_reaper()
+        remaining = self.pool_size - 1
+        if remaining <= 0:
+            self.warm_up_stats.total_seconds = (
+                self.warm_up_stats.first_connection_seconds
+            )
+            return
+        with self._cond:
+            self._open += remaining
+            self._warm_up_pending = remaining
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, remaining),
+            thread_name_prefix="harlequin-mysql-pool",
+        )
+        for _ in range(remaining):
+            self._executor.submit(self._warm_up_one, start)
+        self._executor.shutdown(wait=False)
+
+    def get_connection(self, timeout: float | None = None) -> PooledMySQLConnection:
+        """
+        Returns an idle connection, opens a new one if the pool is below its
+        max size, or waits for one to be returned. Raises a PoolError if no
+        connection is available after timeout seconds (or the pool's
+        timeout, if it is None).
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        waited = False
+        while True:
+            try:
+                pooled = super().get_connection()
+            except PoolError:
+                pass
+            else:
+                self._check_out(pooled._cnx, time.monotonic() - start, waited)
+                return pooled
+
+            with self._cond:
+                if self._closed:
+                    raise PoolError("Failed getting connection; pool is closed")
+                if not self._cnx_queue.empty():
+                    # a connection was returned before we took the lock.
+                    continue
+                if self._open >= self.max_size:
+                    remaining = start + timeout - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolError(
+                            f"Failed getting connection; all {self.max_size} "
+                            f"connections were in use for {timeout:g} seconds"
+                        )
+                    waited = True
+                    self._cond.wait(timeout=remaining)
+                    continue
+                self._open += 1
+
+            cnx = self._connect_reserved()
+            with self._cond:
+                self._grown += 1
+            self._check_out(cnx, time.monotonic() - start, waited)
+            return PooledMySQLConnection(self, cnx)
+
+    def add_connection(self, cnx: MySQLConnectionAbstract | None = None) -> None:
+        """
+        Opens a new connection and adds it to the pool, or returns a
+        checked-out connection to the pool.
+        """
+        if cnx is None:
+            self._reserve()
+            cnx = self._connect_reserved()
+        super().add_connection(cnx)
+        with self._cond:
+            self._checked_out.discard(id(cnx))
+            self._idle_since[id(cnx)] = time.monotonic()
+            self._cond.notify_all()
+
+    def discard(self, cnx: MySQLConnectionAbstract) -> None:
+        """
+        Forgets a checked-out connection that was closed instead of being
+        returned to the pool, so the pool can open another in its place.
+        """
+        with self._cond:
+            if id(cnx) in self._checked_out:
+                self._checked_out.discard(id(cnx))
+                self._open -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> PoolStats:
+        with self._cond:
+            return PoolStats(
+                min_size=self.pool_size,
+                max_size=self.max_size,
+                open=self._open,
+                in_use=len(self._checked_out),
+                peak_in_use=self._peak_in_use,
+                checkouts=self._checkouts,
+                waits=self._waits,
+                timeouts=self._timeouts,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+                grown=self._grown,
+                shrunk=self._shrunk,
+            )
+
+    def close(self) -> int:
+        """
+        Stops the warm-up and closes every idle connection in the pool.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.debug("Closing connection pool: %s", self.stats())
+        return self._remove_connections()
+
+    def shrink(self) -> int:
+        """
+        Closes connections that have been idle for longer than idle_timeout,
+        while the pool is larger than pool_size. Returns the number of
+        connections closed.
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        stale: list[MySQLConnectionAbstract] = []
+        with CONNECTION_POOL_LOCK, self._cond:
+            keep: list[MySQLConnectionAbstract] = []
+            while True:
+                try:
+                    cnx = self._cnx_queue.get(block=False)
+                except queue.Empty:
+                    break
+                if (
+                    self._open - len(stale) > self.pool_size
+                    and self._idle_since.get(id(cnx), cutoff) <= cutoff
+                ):
+                    stale.append(cnx)
+                    self._idle_since.pop(id(cnx), None)
+                else:
+                    keep.append(cnx)
+            # get() pops from the top of the stack, so put the bottom back first.
+            for cnx in reversed(keep):
+                self._cnx_queue.put(cnx, block=False)
+            self._open -= len(stale)
+            self._shrunk += len(stale)
+        for cnx in stale:
+            try:
+                cnx.disconnect()
+            except Error:
+                pass
+        return len(stale)
+
+    def _check_out(
+        self, cnx: MySQLConnectionAbstract, wait_seconds: float, waited: bool
+    ) -> None:
+        with self._cond:
+            self._checked_out.add(id(cnx))
+            self._idle_since.pop(id(cnx), None)
+            self._checkouts += 1
+            self._peak_in_use = max(self._peak_in_use, len(self._checked_out))
+            if waited:
+                self._waits += 1
+                self._total_wait += wait_seconds
+                self._max_wait = max(self._max_wait, wait_seconds)
+
+    def _connect(self) -> MySQLConnectionAbstract:
+        config_version = self._config_version
+        cnx: MySQLConnectionAbstract = connect(**self._cnx_config)  # type: ignore[assignment]
+        # if the config changes while we are connecting, get_connection()
+        # will reconnect with the new config.
+        cnx.pool_config_version = config_version
+        return cnx
+
+    def _reserve(self) -> None:
+        """
+        Counts a connection that is about to be opened in self._open, or
+        raises a PoolError if the pool is already at its max size.
+        """
+        with self._cond:
+            if self._open >= self.max_size:
+                raise PoolError("Failed adding connection; queue is full")
+            self._open += 1
+
+    def _connect_reserved(self) -> MySQLConnectionAbstract:
+        """
+        Opens a connection that has already been counted in self._open, and
+        un-counts it if the connection fails.
+        """
+        try:
+            return self._connect()
+        except BaseException:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify_all()
+            raise
+
+    def _warm_up_one(self, start: float) -> None:
+        try:
+            cnx = self._connect_reserved()
+        except Error as e:
+            logger.warning("Could not open a pooled connection: %s", e)
+            with self._cond:
+                self.warm_up_stats.failures += 1
+                self._finish_warm_up_one(start)
+            return
+        if self._closed:
+            cnx.disconnect()
+            with self._cond:
+                self._open -= 1
+                self._finish_warm_up_one(start)
+            return
+        super().add_connection(cnx)
+        with self._cond:
+            self._idle_since[id(cnx)] = time.monotonic()
+            self.warm_up_stats.connections += 1
+            self._finish_warm_up_one(start)
+
+    def _finish_warm_up_one(self, start: float) -> None:
+        # must be called with self._cond held.
+        self._warm_up_pending -= 1
+        if self._warm_up_pending == 0:
+            self.warm_up_stats.total_seconds = time.perf_counter() - start
+            logger.debug("Connection pool warmed up: %s", self.warm_up_stats)
+        self._cond.notify_all()
+
+    def _start_reaper(self) -> None:
+        if self.idle_timeout <= 0 or self.max_size == self.pool_size:
+            return
+
+        def _reap() -> None:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: self._closed, timeout=self.idle_timeout / 2
+                    )
+                    if self._closed:
+                        return
+                self.shrink()
+
+        threading.Thread(
+            target=_reap, name="harlequin-mysql-pool-reaper", daemon=True
+        ).start()
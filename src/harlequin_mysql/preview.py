@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from harlequin_mysql.statements import add_max_execution_time
+
+PREVIEW_LIMIT = 100
+# tables estimated to have more rows than this are previewed from a random
+# point in their primary key, instead of from its start.
+SAMPLE_MIN_ROWS = 1_000_000
+# views can be arbitrarily expensive, so their preview is capped on the
+# server, in seconds.
+VIEW_PREVIEW_SECONDS = 5.0
+# the Data Catalog's type labels for integer columns, which support the
+# arithmetic used for sampling.
+_SAMPLEABLE_KEY_TYPES = {"#", "##", "###"}
+
+
+def quote_identifier(name: str) -> str:
+    return f"`{name.replace('`', '``')}`"
+
+
+def preview_query(
+    relation: str,
+    primary_key: Sequence[tuple[str, str]] = (),
+    rows_estimate: int | None = None,
+    is_view: bool = False,
+    limit: int = PREVIEW_LIMIT,
+    mariadb: bool = False,
+) -> str:
+    """
+    Returns a query that previews the first rows of a relation cheaply.
+    relation is the quoted, qualified name of the relation, and primary_key
+    is its (column, type label) pairs, in key order, where the type labels
+    are the ones shown in the Data Catalog.
+
+    - Views are read with a cap on their execution time.
+    - Tables with a primary key are read in key order, which is a short
+      range read of the clustered index.
+    - Tables with more than SAMPLE_MIN_ROWS rows and a single integer key are
+      read from a random point in the key, so the preview is a sample of
+      the table instead of its oldest rows.
+    - Other tables are read in whatever order the server returns them.
+    """
+    if is_view:
+        query = f"select *\nfrom {relation}\nlimit {limit}"
+        return (
+            add_max_execution_time(query, VIEW_PREVIEW_SECONDS, mariadb=mariadb)
+            or query
+        )
+    if (
+        len(primary_key) == 1
+        and primary_key[0][1] in _SAMPLEABLE_KEY_TYPES
+        and rows_estimate is not None
+        and rows_estimate > SAMPLE_MIN_ROWS
+    ):
+        key = quote_identifier(primary_key[0][0])
+        # min() and max() of the key are read from the ends of the index.
+        return (
+            f"select t.*\n"
+            f"from {relation} as t\n"
+            f"join (\n"
+            f"    select min({key}) + floor(rand() * (max({key}) - min({key})))"
+            f" as start\n"
+            f"    from {relation}\n"
+            f") as s\n"
+            f"where t.{key} >= s.start\n"
+            f"order by t.{key}\n"
+            f"limit {limit}"
+        )
+    if primary_key:
+        order_by = ", ".join(quote_identifier(col) for col, _ in primary_key)
+        return f"select *\nfrom {relation}\norder by {order_by}\nlimit {limit}"
+    return f"select *\nfrom {relation}\nlimit {limit}"
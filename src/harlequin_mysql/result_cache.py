@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import pyarrow as pa
+
+# how long a cached result is reused, by default.
+DEFAULT_TTL_SECONDS = 300.0
+
+# quoted strings and identifiers are kept as-is; runs of whitespace outside
+# of them are collapsed to a single space.
+_NORMALIZE_PROG = re.compile(
+    r"('(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"|`(?:[^`]|``)*`)|\s+",
+    flags=re.S,
+)
+
+
+def normalize_sql(query: str) -> str:
+    """
+    Returns the query without leading or trailing whitespace or semicolons,
+    and with whitespace collapsed, so trivially different copies of the same
+    query share a cache entry.
+    """
+    stripped = query.strip().rstrip(";").rstrip()
+    return _NORMALIZE_PROG.sub(lambda m: m.group(1) or " ", stripped)
+
+
+def result_nbytes(result: Any) -> int:
+    """
+    The approximate size of a fetched result: exact for Arrow tables, and
+    estimated from the Python objects for lists of rows.
+    """
+    if isinstance(result, pa.Table):
+        return int(result.nbytes)
+    return sys.getsizeof(result) + sum(
+        sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row) for row in result
+    )
+
+
+ResultKey = tuple[str | None, str, int | None]
+
+
+@dataclass
+class CachedResult:
+    """
+    A fetched result, and the cursor description needed to show it.
+    """
+
+    description: list[Any]
+    data: Any
+    nbytes: int
+    expires_at: float
+
+
+@dataclass
+class ResultCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """
+    An in-memory LRU cache of query results, keyed by (current database,
+    normalized SQL, row limit). Entries expire after ttl seconds, and the
+    least recently used entries are evicted to keep the cache under
+    max_bytes. Results larger than max_bytes are never cached.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float = DEFAULT_TTL_SECONDS) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = ResultCacheStats()
+        self._entries: OrderedDict[ResultKey, CachedResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(database: str | None, query: str, limit: int | None) -> ResultKey:
+        return (database, normalize_sql(query), limit)
+
+    def get(self, key: ResultKey) -> CachedResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def put(self, key: ResultKey, description: Sequence[Any], data: Any) -> bool:
+        """
+        Caches a result, evicting the least recently used results to make
+        room. Returns False if the result is too large to cache.
+        """
+        nbytes = result_nbytes(data)
+        if nbytes > self.max_bytes:
+            return False
+        entry = CachedResult(
+            description=list(description),
+            data=data,
+            nbytes=nbytes,
+            expires_at=time.monotonic() + self.ttl,
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and self.stats.bytes + nbytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+            self._entries[key] = entry
+            self.stats.entries += 1
+            self.stats.bytes += nbytes
+        return True
+
+    def clear(self) -> None:
+        """
+        Drops every cached result, e.g., after DML or DDL that may have
+        changed them.
+        """
+        with self._lock:
+            if self._entries:
+                self.stats.invalidations += 1
+            self._entries.clear()
+            self.stats.entries = 0
+            self.stats.bytes = 0
+
+    def _remove(self, key: ResultKey) -> None:
+        # must be called with self._lock held.
+        entry = self._entries.pop(key)
+        self.stats.entries -= 1
+        self.stats.bytes -= entry.nbytes
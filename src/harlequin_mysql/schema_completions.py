@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import threading
+from typing import Iterable
+
+from harlequin import HarlequinCompletion
+
+# the default maximum number of database, relation, and column completions.
+DEFAULT_MAX_COMPLETIONS = 50_000
+
+# Harlequin gives catalog items a priority of 500 + their depth in the tree;
+# we do the same, but rank the current database's relations with databases.
+DATABASE_PRIORITY = 500
+CURRENT_RELATION_PRIORITY = 500
+RELATION_PRIORITY = 501
+COLUMN_PRIORITY = 502
+
+
+def relation_type_label(table_type: str | None) -> str:
+    return "v" if table_type == "VIEW" else "t"
+
+
+class SchemaCompletionIndex:
+    """
+    Database, relation, and column names, used to build completions.
+
+    The index is filled (and updated) from background threads, and can be
+    read while it is being filled, so every method is thread-safe. Columns
+    are only kept until the index holds max_completions names; callers
+    should add the columns they care about most (e.g., the current
+    database's) first.
+    """
+
+    def __init__(self, max_completions: int = DEFAULT_MAX_COMPLETIONS) -> None:
+        self.max_completions = max_completions
+        # set by the loader once the current database's names are in the
+        # index (or loading stopped).
+        self.ready = threading.Event()
+        self._lock = threading.Lock()
+        # database -> relation -> relation type label
+        self._relations: dict[str, dict[str, str]] = {}
+        # (database, relation) -> [(column, column type label)]
+        self._columns: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def is_full(self) -> bool:
+        return self._size >= self.max_completions
+
+    def set_relations(
+        self, db_name: str, relation_rows: Iterable[tuple[str | None, str | None]]
+    ) -> None:
+        """
+        Replaces a database's relations (and drops the columns of relations
+        that no longer exist). relation_rows are (relation, table type);
+        relation is None for a database without relations.
+        """
+        relations = {
+            name: relation_type_label(table_type)
+            for name, table_type in relation_rows
+            if name is not None
+        }
+        with self._lock:
+            self._drop(db_name, keep=relations)
+            self._relations[db_name] = relations
+            self._size += len(relations)
+
+    def set_columns(
+        self,
+        db_name: str,
+        rel_name: str,
+        column_rows: Iterable[tuple[str, str]],
+    ) -> None:
+        """
+        Replaces a relation's columns. column_rows are (column, type label).
+        """
+        columns = list(column_rows)
+        with self._lock:
+            old = self._columns.get((db_name, rel_name), [])
+            self._columns[(db_name, rel_name)] = columns
+            self._size += len(columns) - len(old)
+
+    def add_columns(self, column_rows: Iterable[tuple[str, str, str, str]]) -> bool:
+        """
+        Adds (database, relation, column, type label) rows to the index, until
+        it is full. Returns False if the index filled up before all of the
+        rows were added.
+        """
+        for db_name, rel_name, col_name, type_label in column_rows:
+            if self.is_full:
+                return False
+            with self._lock:
+                self._columns.setdefault((db_name, rel_name), []).append(
+                    (col_name, type_label)
+                )
+                self._size += 1
+        return True
+
+    def drop_database(self, db_name: str) -> None:
+        with self._lock:
+            self._drop(db_name)
+
+    def completions(self, current_database: str | None) -> list[HarlequinCompletion]:
+        """
+        Returns completions for every name in the index, up to
+        max_completions: databases, then the current database's relations and
+        columns, then other relations and columns.
+        """
+        with self._lock:
+            relations = {db: dict(rels) for db, rels in self._relations.items()}
+            columns = {key: list(cols) for key, cols in self._columns.items()}
+
+        completions: list[HarlequinCompletion] = []
+
+        def _add(
+            label: str, type_label: str, priority: int, context: str | None
+        ) -> bool:
+            if len(completions) >= self.max_completions:
+                return False
+            completions.append(
+                HarlequinCompletion(label, type_label, label, priority, context)
+            )
+            return True
+
+        db_names = sorted(relations, key=lambda db: (db != current_database, db))
+        for db_name in db_names:
+            _add(db_name, "db", DATABASE_PRIORITY, None)
+        for db_name in db_names:
+            for rel_name, type_label in relations[db_name].items():
+                if db_name == current_database:
+                    _add(rel_name, type_label, CURRENT_RELATION_PRIORITY, None)
+                _add(rel_name, type_label, RELATION_PRIORITY, db_name)
+            for rel_name in relations[db_name]:
+                for col_name, type_label in columns.get((db_name, rel_name), []):
+                    if not _add(col_name, type_label, COLUMN_PRIORITY, rel_name):
+                        return completions
+        return completions
+
+    def _drop(self, db_name: str, keep: Iterable[str] = ()) -> None:
+        """
+        Removes a database's relations, and the columns of its relations that
+        are not in keep. Must be called with the lock held.
+        """
+        keep = set(keep)
+        self._size -= len(self._relations.pop(db_name, {}))
+        for key in [k for k in self._columns if k[0] == db_name and k[1] not in keep]:
+            self._size -= len(self._columns.pop(key))
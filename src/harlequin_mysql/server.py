@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Literal
+
+VERSION_PROG = re.compile(r"(\d+)\.(\d+)(?:\.(\d+))?")
+
+# MariaDB servers before 11.0 prefix their version with this, for
+# compatibility with old MySQL clients.
+MARIADB_VERSION_PREFIX = "5.5.5-"
+
+
+@dataclass(frozen=True)
+class ServerInfo:
+    """
+    The flavor and version of the server we are connected to.
+    """
+
+    flavor: Literal["mysql", "mariadb"]
+    version: tuple[int, int, int]
+
+    @property
+    def is_mariadb(self) -> bool:
+        return self.flavor == "mariadb"
+
+
+def parse_server_info(server_info: str) -> ServerInfo | None:
+    """
+    Parses the version string sent by the server in its handshake (e.g.,
+    "8.0.36", "8.4.0-commercial", or "5.5.5-10.11.6-MariaDB-1:10.11.6+maria~ubu2204"),
+    or returns None if it can't be parsed.
+    """
+    flavor: Literal["mysql", "mariadb"] = (
+        "mariadb" if "mariadb" in server_info.lower() else "mysql"
+    )
+    if flavor == "mariadb" and server_info.startswith(MARIADB_VERSION_PREFIX):
+        server_info = server_info[len(MARIADB_VERSION_PREFIX) :]
+    match = VERSION_PROG.match(server_info.strip())
+    if match is None:
+        return None
+    major, minor, patch = match.groups()
+    return ServerInfo(flavor=flavor, version=(int(major), int(minor), int(patch or 0)))
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+# performance_schema timers are in picoseconds.
+PICOSECONDS = 1e12
+
+# the most recent statement completed by a connection's thread. The
+# connection must not run another statement until this has been read. The
+# connector closes and resets prepared statements with separate commands,
+# which are recorded as statements of their own, so they are skipped.
+STATEMENT_STATS_QUERY = """
+    select
+        h.event_id,
+        h.digest,
+        h.digest_text,
+        h.timer_wait,
+        h.lock_time,
+        h.rows_sent,
+        h.rows_examined,
+        h.rows_affected,
+        h.created_tmp_tables,
+        h.created_tmp_disk_tables,
+        h.sort_merge_passes,
+        h.sort_rows,
+        h.select_scan,
+        h.select_full_join,
+        h.no_index_used,
+        h.errors,
+        h.warnings
+    from performance_schema.events_statements_history as h
+    join performance_schema.threads as t on t.thread_id = h.thread_id
+    where t.processlist_id = {connection_id}
+    and h.end_event_id is not null
+    and h.event_name not in ('statement/com/Close stmt', 'statement/com/Reset stmt')
+    order by h.event_id desc
+    limit 1
+"""
+
+
+def statement_stats_query(connection_id: int) -> str:
+    return STATEMENT_STATS_QUERY.format(connection_id=int(connection_id))
+
+
+@dataclass
+class StatementStats:
+    """
+    The server's statistics for one statement, from
+    performance_schema.events_statements_history.
+    """
+
+    digest: str | None
+    digest_text: str | None
+    seconds: float
+    lock_seconds: float
+    rows_sent: int
+    rows_examined: int
+    rows_affected: int
+    tmp_tables: int
+    tmp_disk_tables: int
+    sort_merge_passes: int
+    sort_rows: int
+    full_scans: int
+    full_joins: int
+    no_index_used: bool
+    errors: int
+    warnings: int
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "StatementStats":
+        (
+            _,
+            digest,
+            digest_text,
+            timer_wait,
+            lock_time,
+            rows_sent,
+            rows_examined,
+            rows_affected,
+            tmp_tables,
+            tmp_disk_tables,
+            sort_merge_passes,
+            sort_rows,
+            select_scan,
+            select_full_join,
+            no_index_used,
+            errors,
+            warnings,
+        ) = row
+        return cls(
+            digest=digest,
+            digest_text=digest_text,
+            seconds=int(timer_wait or 0) / PICOSECONDS,
+            lock_seconds=int(lock_time or 0) / PICOSECONDS,
+            rows_sent=int(rows_sent or 0),
+            rows_examined=int(rows_examined or 0),
+            rows_affected=int(rows_affected or 0),
+            tmp_tables=int(tmp_tables or 0),
+            tmp_disk_tables=int(tmp_disk_tables or 0),
+            sort_merge_passes=int(sort_merge_passes or 0),
+            sort_rows=int(sort_rows or 0),
+            full_scans=int(select_scan or 0),
+            full_joins=int(select_full_join or 0),
+            no_index_used=bool(no_index_used),
+            errors=int(errors or 0),
+            warnings=int(warnings or 0),
+        )
+
+    @property
+    def compact(self) -> str:
+        """
+        A one-line summary, e.g., "12.3ms, 10 sent / 1,000 examined, 1 tmp
+        table (1 on disk), no index used".
+        """
+        parts = [
+            f"{self.seconds * 1000:.1f}ms",
+            f"{self.rows_sent:,} sent / {self.rows_examined:,} examined",
+        ]
+        if self.rows_affected:
+            parts.append(f"{self.rows_affected:,} affected")
+        if self.lock_seconds >= 0.001:
+            parts.append(f"{self.lock_seconds * 1000:.1f}ms locked")
+        if self.tmp_tables:
+            parts.append(
+                f"{self.tmp_tables} tmp table{'s' if self.tmp_tables > 1 else ''} "
+                f"({self.tmp_disk_tables} on disk)"
+            )
+        if self.sort_merge_passes:
+            parts.append(f"{self.sort_merge_passes} sort merge passes")
+        if self.full_joins:
+            parts.append(f"{self.full_joins} full joins")
+        if self.no_index_used:
+            parts.append("no index used")
+        return ", ".join(parts)
+
+
+@dataclass
+class DigestSummary:
+    """
+    Totals for every statement in the session with the same digest (i.e.,
+    the same query, ignoring literal values).
+    """
+
+    digest_text: str | None
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    lock_seconds: float = 0.0
+    rows_sent: int = 0
+    rows_examined: int = 0
+    tmp_disk_tables: int = 0
+    sort_merge_passes: int = 0
+    no_index_used: int = 0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def add(self, stats: StatementStats) -> None:
+        self.count += 1
+        self.total_seconds += stats.seconds
+        self.max_seconds = max(self.max_seconds, stats.seconds)
+        self.lock_seconds += stats.lock_seconds
+        self.rows_sent += stats.rows_sent
+        self.rows_examined += stats.rows_examined
+        self.tmp_disk_tables += stats.tmp_disk_tables
+        self.sort_merge_passes += stats.sort_merge_passes
+        self.no_index_used += stats.no_index_used
+
+
+class StatementStatsLog:
+    """
+    Collects the StatementStats of every query in a session, grouped by
+    digest.
+    """
+
+    def __init__(self) -> None:
+        self._digests: dict[str, DigestSummary] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stats: StatementStats) -> None:
+        key = stats.digest or stats.digest_text or ""
+        with self._lock:
+            summary = self._digests.setdefault(key, DigestSummary(stats.digest_text))
+            summary.add(stats)
+
+    def summary(self, limit: int | None = None) -> list[DigestSummary]:
+        """
+        The session's statements, slowest (by total time) first.
+        """
+        with self._lock:
+            summaries = sorted(
+                self._digests.values(), key=lambda s: s.total_seconds, reverse=True
+            )
+        return summaries[:limit] if limit is not None else summaries
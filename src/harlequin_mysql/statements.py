@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Literal
+
+# leading whitespace and comments are allowed before the first keyword.
+_LEADING_COMMENTS = r"^\s*(?:(?:--|#)[^\n]*\n\s*|/\*.*?\*/\s*)*"
+
+SELECT_PROG = re.compile(rf"{_LEADING_COMMENTS}select\b", flags=re.IGNORECASE | re.S)
+
+EXPLAINABLE_PROG = re.compile(
+    rf"{_LEADING_COMMENTS}(?:select|with|table|insert|update|delete|replace)\b",
+    flags=re.IGNORECASE | re.S,
+)
+
+# EXPLAIN ANALYZE runs the statement, so we only use it for queries (and
+# not, e.g., WITH ... UPDATE).
+ANALYZABLE_PROG = re.compile(
+    rf"{_LEADING_COMMENTS}(?:select|with|table)\b", flags=re.IGNORECASE | re.S
+)
+WRITE_PROG = re.compile(
+    r"\b(?:insert|update|delete|replace|into)\b", flags=re.IGNORECASE
+)
+
+# clauses that make it unsafe (or pointless) to append our own LIMIT
+LIMIT_UNSAFE_PROG = re.compile(
+    r"\b(?:limit|into|procedure|for\s+update|for\s+share|lock\s+in\s+share\s+mode)\b",
+    flags=re.IGNORECASE,
+)
+
+
+# statements that don't change data, the schema, or session state (other
+# than the current database).
+READ_ONLY_PROG = re.compile(
+    rf"{_LEADING_COMMENTS}(?:select|show|describe|desc|explain|use|help)\b",
+    flags=re.IGNORECASE | re.S,
+)
+
+# clauses, variables, and functions that make a SELECT's result (or its
+# side effects) differ from one execution to the next.
+UNCACHEABLE_PROG = re.compile(
+    r"@|\b(?:into|procedure|for\s+update|for\s+share|lock\s+in\s+share\s+mode|"
+    r"rand|uuid|uuid_short|now|sysdate|curdate|curtime|current_date|current_time|"
+    r"current_timestamp|current_user|user|localtime|localtimestamp|unix_timestamp|"
+    r"utc_date|utc_time|utc_timestamp|sleep|benchmark|connection_id|"
+    r"last_insert_id|found_rows|row_count|get_lock|release_lock|is_free_lock|"
+    r"is_used_lock)\b",
+    flags=re.IGNORECASE,
+)
+
+
+def is_select(query: str) -> bool:
+    return SELECT_PROG.match(query) is not None
+
+
+def is_read_only(query: str) -> bool:
+    return READ_ONLY_PROG.match(query) is not None
+
+
+def is_explainable(query: str) -> bool:
+    return EXPLAINABLE_PROG.match(query) is not None
+
+
+def is_analyzable(query: str) -> bool:
+    return ANALYZABLE_PROG.match(query) is not None and WRITE_PROG.search(query) is None
+
+
+def can_prepare(query: str) -> bool:
+    """
+    Returns True if the query is a single SELECT statement that can be sent
+    as a prepared statement without parameters.
+
+    The connector rewrites %s to a ? placeholder before preparing, and a
+    statement with placeholders is never executed without parameters, so
+    queries that contain either are sent as text.
+    """
+    if not is_select(query):
+        return False
+    stripped = query.rstrip().rstrip(";")
+    return not any(token in stripped for token in (";", "%s", "?"))
+
+
+def is_cacheable(query: str) -> bool:
+    """
+    Returns True if the query is a single SELECT statement whose result only
+    depends on the data it reads.
+
+    Like add_limit, this is deliberately conservative, and matches keywords
+    anywhere in the query, including in string literals.
+    """
+    if not is_select(query):
+        return False
+    stripped = query.rstrip().rstrip(";")
+    return ";" not in stripped and UNCACHEABLE_PROG.search(stripped) is None
+
+
+def add_limit(query: str, limit: int) -> str | None:
+    """
+    Returns the query with a server-side LIMIT clause appended, or None if
+    the query is not a plain, single SELECT statement that can be rewritten
+    safely.
+
+    This is deliberately conservative: any query that mentions LIMIT, INTO,
+    or a locking clause anywhere (including in subqueries or string literals)
+    is left alone.
+    """
+    if not is_select(query):
+        return None
+    stripped = query.rstrip().rstrip(";").rstrip()
+    if ";" in stripped or LIMIT_UNSAFE_PROG.search(stripped):
+        return None
+    # start a new line in case the query ends with a -- or # comment.
+    return f"{stripped}\nlimit {int(limit)}"
+
+
+# a statement that already caps its own execution time.
+EXECUTION_TIME_PROG = re.compile(
+    r"\b(?:max_execution_time|max_statement_time)\b", flags=re.IGNORECASE
+)
+# an optimizer hint comment right after the SELECT keyword. The server only
+# reads the first one, so our hint has to go inside it.
+HINT_COMMENT_PROG = re.compile(r"\s*/\*\+.*?(?=\*/)", flags=re.S)
+
+
+def add_max_execution_time(
+    query: str, seconds: float, mariadb: bool = False
+) -> str | None:
+    """
+    Returns the query with a server-side cap on its execution time: a
+    MAX_EXECUTION_TIME optimizer hint for MySQL, or SET STATEMENT
+    max_statement_time for MariaDB. Returns None if the query is not a
+    SELECT statement (MySQL only enforces the hint for SELECTs), or if it
+    already sets its own cap.
+    """
+    match = SELECT_PROG.match(query)
+    if match is None or EXECUTION_TIME_PROG.search(query):
+        return None
+    if mariadb:
+        return f"SET STATEMENT max_statement_time={seconds:.3f} FOR {query}"
+    # the hint must immediately follow the SELECT keyword.
+    milliseconds = max(int(seconds * 1000), 1)
+    hint = f"MAX_EXECUTION_TIME({milliseconds})"
+    end = match.end()
+    existing = HINT_COMMENT_PROG.match(query, end)
+    if existing is not None:
+        end = existing.end()
+        return f"{query[:end].rstrip()} {hint} {query[end:]}"
+    return f"{query[:end]} /*+ {hint} */{query[end:]}"
+
+
+# a possibly-qualified, possibly-quoted identifier, like foo, `foo`.bar,
+# or db . `my table`
+_IDENT = r"(?:`(?:[^`]|``)+`|[\w$]+)"
+_QNAME = rf"{_IDENT}(?:\s*\.\s*{_IDENT})?"
+QNAME_PROG = re.compile(rf"(?:({_IDENT})\s*\.\s*)?({_IDENT})")
+
+DATABASE_DDL_PROG = re.compile(
+    rf"{_LEADING_COMMENTS}(?:create|drop)\s+(?:database|schema)\s+"
+    rf"(?:if\s+(?:not\s+)?exists\s+)?({_IDENT})",
+    flags=re.IGNORECASE | re.S,
+)
+CREATE_RELATION_PROG = re.compile(
+    rf"{_LEADING_COMMENTS}create\s+(?:or\s+replace\s+)?(?:temporary\s+)?"
+    r"(?:algorithm\s*=\s*\w+\s+)?(?:definer\s*=\s*\S+\s+)?"
+    r"(?:sql\s+security\s+\w+\s+)?"
+    rf"(?:table|view)\s+(?:if\s+not\s+exists\s+)?({_QNAME})",
+    flags=re.IGNORECASE | re.S,
+)
+DROP_RELATION_PROG = re.compile(
+    rf"{_LEADING_COMMENTS}drop\s+(?:temporary\s+)?(?:table|view)s?\s+"
+    rf"(?:if\s+exists\s+)?({_QNAME}(?:\s*,\s*{_QNAME})*)",
+    flags=re.IGNORECASE | re.S,
+)
+ALTER_RELATION_PROG = re.compile(
+    rf"{_LEADING_COMMENTS}alter\s+(?:online\s+)?(?:ignore\s+)?"
+    r"(?:algorithm\s*=\s*\w+\s+)?(?:definer\s*=\s*\S+\s+)?"
+    r"(?:sql\s+security\s+\w+\s+)?"
+    rf"(?:table|view)\s+({_QNAME})",
+    flags=re.IGNORECASE | re.S,
+)
+ALTER_RENAME_PROG = re.compile(
+    rf"\brename\s+(?!(?:column|index|key)\b)(?:to\s+|as\s+)?({_QNAME})",
+    flags=re.IGNORECASE | re.S,
+)
+RENAME_RELATION_PROG = re.compile(
+    rf"{_LEADING_COMMENTS}rename\s+tables?\s+"
+    rf"({_QNAME}\s+to\s+{_QNAME}(?:\s*,\s*{_QNAME}\s+to\s+{_QNAME})*)",
+    flags=re.IGNORECASE | re.S,
+)
+INDEX_DDL_PROG = re.compile(
+    rf"{_LEADING_COMMENTS}(?:create\s+(?:unique\s+|fulltext\s+|spatial\s+)?index|"
+    rf"drop\s+index)\s+{_IDENT}\s+(?:using\s+\w+\s+)?on\s+({_QNAME})",
+    flags=re.IGNORECASE | re.S,
+)
+
+
+@dataclass(frozen=True)
+class CatalogChange:
+    """
+    A change to the catalog made by a DDL statement.
+
+    kind is "databases" if a database was created or dropped, "relations"
+    if a relation in database was created, dropped, or renamed, and
+    "columns" if the relation was altered. database is None if the
+    statement used the connection's current database.
+    """
+
+    kind: Literal["databases", "relations", "columns"]
+    database: str | None = None
+    relation: str | None = None
+
+
+def unquote_identifier(ident: str) -> str:
+    if ident.startswith("`") and ident.endswith("`"):
+        return ident[1:-1].replace("``", "`")
+    return ident
+
+
+def split_qualified_name(qname: str) -> tuple[str | None, str]:
+    """
+    Splits db.relation into (db, relation), or relation into (None, relation),
+    removing quotes.
+    """
+    match = QNAME_PROG.match(qname.strip())
+    assert match is not None
+    db, name = match.groups()
+    return (unquote_identifier(db) if db else None), unquote_identifier(name)
+
+
+def _relation_changes(
+    qnames: list[str], kind: Literal["relations", "columns"]
+) -> list[CatalogChange]:
+    return [
+        CatalogChange(kind, *split_qualified_name(qname))
+        for qname in qnames
+        if qname.strip()
+    ]
+
+
+def parse_catalog_changes(query: str) -> list[CatalogChange]:
+    """
+    Returns the changes a CREATE, ALTER, DROP, or RENAME statement makes to
+    the catalog, or an empty list if the statement is not DDL (or is DDL
+    that doesn't change the catalog tree).
+    """
+    if match := DATABASE_DDL_PROG.match(query):
+        return [CatalogChange("databases", unquote_identifier(match.group(1)))]
+    if match := CREATE_RELATION_PROG.match(query):
+        return _relation_changes([match.group(1)], "relations")
+    if match := DROP_RELATION_PROG.match(query):
+        return _relation_changes(
+            re.findall(_QNAME, match.group(1), flags=re.S), "relations"
+        )
+    if match := RENAME_RELATION_PROG.match(query):
+        names = re.split(r"\s+to\s+|\s*,\s*", match.group(1), flags=re.IGNORECASE)
+        return _relation_changes(names, "relations")
+    if match := ALTER_RELATION_PROG.match(query):
+        if rename := ALTER_RENAME_PROG.search(query, match.end()):
+            return _relation_changes([match.group(1), rename.group(1)], "relations")
+        return _relation_changes([match.group(1)], "columns")
+    if match := INDEX_DDL_PROG.match(query):
+        return _relation_changes([match.group(1)], "columns")
+    return []
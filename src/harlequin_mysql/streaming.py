@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Iterator, Literal, Sequence
+
+import pyarrow as pa
+from mysql.connector.cursor import MySQLCursor
+from mysql.connector.errors import Error
+from mysql.connector.pooling import PooledMySQLConnection
+
+from harlequin_mysql.arrow import rows_to_record_batch
+
+# the first batch is small, since we don't know how wide the rows are.
+# After that, batches grow by BATCH_GROWTH, up to about TARGET_BATCH_BYTES.
+INITIAL_BATCH_SIZE = 64
+BATCH_GROWTH = 4
+MAX_BATCH_SIZE = 100_000
+TARGET_BATCH_BYTES = 16 * 1024 * 1024
+
+_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+
+
+def parse_bytes(value: str | int) -> int:
+    """
+    Parses a byte size like 1048576, "512KB", or "1.5 GB".
+    """
+    if isinstance(value, int):
+        return value
+    text = value.strip().upper()
+    number = text.rstrip("KMGB").strip()
+    unit = text[len(number) :].strip()
+    if unit not in _UNITS:
+        raise ValueError(f"Cannot convert {value} to a number of bytes!")
+    return int(float(number) * _UNITS[unit])
+
+
+def format_bytes(n: int) -> str:
+    size = float(n)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@dataclass
+class StreamStats:
+    """
+    A record of how much of a result set was streamed, and why streaming
+    stopped.
+    """
+
+    rows: int = 0
+    bytes: int = 0
+    batches: int = 0
+    stopped_by: Literal["rows", "bytes"] | None = None
+    # None if streaming stopped early and the rest was never read.
+    unfetched_rows: int | None = 0
+    unfetched_bytes: int | None = 0
+
+    @property
+    def truncated(self) -> bool:
+        return self.stopped_by is not None and self.unfetched_rows != 0
+
+    @property
+    def message(self) -> str:
+        fetched = f"Fetched {self.rows:,} rows ({format_bytes(self.bytes)})"
+        if not self.truncated:
+            return f"{fetched}."
+        budget = "row" if self.stopped_by == "rows" else "memory"
+        if self.unfetched_rows is None:
+            rest = "more rows were not fetched"
+        else:
+            assert self.unfetched_bytes is not None
+            rest = (
+                f"{self.unfetched_rows:,} more rows "
+                f"({format_bytes(self.unfetched_bytes)}) were not fetched"
+            )
+        return f"{fetched} before reaching the {budget} budget; {rest}."
+
+
+def stream_record_batches(
+    cur: MySQLCursor,
+    description: Sequence[Sequence[Any]],
+    stats: StreamStats,
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
+    batch_size: int | None = None,
+    raw: bool = False,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Reads rows from an unbuffered cursor and yields them as Arrow record
+    batches, until the result set is exhausted or the next batch would exceed
+    max_rows or max_bytes. Updates stats as it goes.
+
+    If batch_size is None, batches start small and grow geometrically, up to
+    about TARGET_BATCH_BYTES each, which bounds memory use for results with
+    very wide rows (e.g., many LONGTEXT or JSON columns). With max_bytes, no
+    batch is much larger than the rest of the budget, based on the size of
+    the rows read so far, so little is read past the budget.
+
+    Pass raw=True if the cursor was opened with raw=True.
+    """
+    size = batch_size or INITIAL_BATCH_SIZE
+    target = min(TARGET_BATCH_BYTES, max_bytes) if max_bytes else TARGET_BATCH_BYTES
+    while True:
+        fetch_size = size
+        if max_rows is not None:
+            if stats.rows >= max_rows:
+                stats.stopped_by = "rows"
+                return
+            fetch_size = min(fetch_size, max_rows - stats.rows)
+        if max_bytes is not None and stats.rows:
+            bytes_per_row = max(stats.bytes // stats.rows, 1)
+            # at least one row, to find out if the result is over budget.
+            fetch_size = max(
+                1, min(fetch_size, (max_bytes - stats.bytes) // bytes_per_row)
+            )
+        rows = cur.fetchmany(fetch_size)
+        if not rows:
+            return
+        batch = rows_to_record_batch(rows, description, raw=raw)
+        del rows
+        if max_bytes is not None and stats.bytes + batch.nbytes > max_bytes:
+            stats.stopped_by = "bytes"
+            bytes_per_row = max(batch.nbytes // batch.num_rows, 1)
+            keep = (max_bytes - stats.bytes) // bytes_per_row
+            # count the rows we read but won't return as unfetched.
+            stats.unfetched_rows = batch.num_rows - keep
+            stats.unfetched_bytes = batch.nbytes - keep * bytes_per_row
+            batch = batch.slice(0, keep)
+            if keep == 0:
+                return
+        stats.rows += batch.num_rows
+        stats.bytes += batch.nbytes
+        stats.batches += 1
+        yield batch
+        if stats.stopped_by is not None:
+            return
+        if batch_size is None:
+            bytes_per_row = max(batch.nbytes // max(batch.num_rows, 1), 1)
+            size = max(
+                1, min(size * BATCH_GROWTH, MAX_BATCH_SIZE, target // bytes_per_row)
+            )
+
+
+def count_unread_rows(
+    conn: PooledMySQLConnection, columns: Sequence[Any] | None = None
+) -> tuple[int, int]:
+    """
+    Reads the rest of a result set without converting it to Python objects,
+    and returns the number of rows and their size on the wire.
+
+    Pass the result's columns if it was returned by a prepared statement.
+    Binary rows are always decoded, so their size is estimated from the
+    decoded values.
+    """
+    rows = nbytes = 0
+    with suppress(Error):
+        while conn.unread_result:
+            if columns is not None:
+                raw_rows, _ = conn.get_rows(
+                    count=MAX_BATCH_SIZE, binary=True, columns=list(columns)
+                )
+            else:
+                raw_rows, _ = conn.get_rows(count=MAX_BATCH_SIZE, raw=True)
+            rows += len(raw_rows)
+            nbytes += sum(
+                len(v) if isinstance(v, (bytes, bytearray, str)) else 8
+                for row in raw_rows
+                for v in row
+                if v is not None
+            )
+    return rows, nbytes
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from mysql.connector.cursor import MySQLCursor
+
+logger = logging.getLogger(__name__)
+
+# the phases of a query, in the order they happen. first_row overlaps the
+# start of fetch.
+PHASES = ("checkout", "execute", "first_row", "fetch", "release")
+
+
+@dataclass
+class Span:
+    name: str
+    # seconds after the query started.
+    start: float
+    seconds: float
+
+
+@dataclass
+class QueryTrace:
+    """
+    How long each phase of a query took, and how much it returned. Traces
+    are passed to the connection's trace hooks once the query's connection
+    is returned to the pool.
+    """
+
+    query: str
+    connection_id: int | None = None
+    spans: list[Span] = field(default_factory=list)
+    rows: int | None = None
+    bytes: int | None = None
+    error: str | None = None
+    # the wall-clock time the query started, as a UNIX timestamp.
+    started_at: float = field(default_factory=time.time)
+    _t0: float = field(default_factory=time.perf_counter, repr=False)
+    # set (once) by FirstRowTimer.
+    first_row_at: float | None = field(default=None, repr=False)
+
+    def add_span(self, name: str, start: float, end: float | None = None) -> None:
+        """
+        Records a phase that started (and ended) at the given
+        time.perf_counter() values. end defaults to now.
+        """
+        end = time.perf_counter() if end is None else end
+        self.spans.append(Span(name=name, start=start - self._t0, seconds=end - start))
+
+    @property
+    def total_seconds(self) -> float:
+        return max((s.start + s.seconds for s in self.spans), default=0.0)
+
+    def phase_seconds(self, name: str) -> float | None:
+        return next((s.seconds for s in self.spans if s.name == name), None)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "query": self.query,
+            "connection_id": self.connection_id,
+            "started_at": self.started_at,
+            "total_seconds": self.total_seconds,
+            "spans": [asdict(s) for s in self.spans],
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "error": self.error,
+        }
+
+
+TraceHook = Callable[[QueryTrace], None]
+
+
+class FirstRowTimer:
+    """
+    Wraps a cursor, and records on a trace when the cursor first returns
+    rows.
+    """
+
+    def __init__(self, cur: MySQLCursor, trace: QueryTrace) -> None:
+        self._cur = cur
+        self._trace = trace
+
+    def _mark(self, rows: Any) -> None:
+        if rows and self._trace.first_row_at is None:
+            self._trace.first_row_at = time.perf_counter()
+
+    def fetchone(self) -> Any:
+        row = self._cur.fetchone()
+        self._mark(row is not None)
+        return row
+
+    def fetchmany(self, size: int = 1) -> list[Any]:
+        rows = self._cur.fetchmany(size)
+        self._mark(rows)
+        return rows
+
+    def fetchall(self) -> list[Any]:
+        rows = self._cur.fetchall()
+        self._mark(rows)
+        return rows
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cur, name)
+
+
+class LoggingTraceHook:
+    """
+    Logs a line per query, with the time spent in each phase.
+    """
+
+    def __init__(self, level: int = logging.INFO) -> None:
+        self.level = level
+
+    def __call__(self, trace: QueryTrace) -> None:
+        phases = " ".join(f"{s.name}={s.seconds * 1000:.1f}ms" for s in trace.spans)
+        logger.log(
+            self.level,
+            "Query on connection %s took %.1fms (%s), returned %s rows "
+            "(%s bytes)%s: %s",
+            trace.connection_id,
+            trace.total_seconds * 1000,
+            phases,
+            trace.rows,
+            trace.bytes,
+            f", failed with {trace.error}" if trace.error else "",
+            trace.query,
+        )
+
+
+class JsonLinesTraceHook:
+    """
+    Appends each trace to a file, as a line of JSON.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+
+    def __call__(self, trace: QueryTrace) -> None:
+        line = json.dumps(trace.to_dict())
+        with self._lock, self.path.open("a") as f:
+            f.write(line + "\n")
+
+
+class OpenTelemetryTraceHook:
+    """
+    Exports each trace as an OpenTelemetry span, with a child span for each
+    phase, using the globally configured tracer provider. Requires
+    opentelemetry-api.
+    """
+
+    def __init__(self, tracer: Any | None = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ValueError(
+                "query-trace otel requires the opentelemetry-api package"
+            ) from e
+        self._otel = trace
+        self.tracer = tracer or trace.get_tracer("harlequin_mysql")
+
+    def __call__(self, trace: QueryTrace) -> None:
+        start_ns = int(trace.started_at * 1e9)
+        attributes = {
+            "db.system": "mysql",
+            "db.statement": trace.query,
+            "db.mysql.connection_id": trace.connection_id or 0,
+            "db.response.returned_rows": trace.rows or 0,
+            "db.response.bytes": trace.bytes or 0,
+        }
+        root = self.tracer.start_span(
+            "harlequin_mysql.query", start_time=start_ns, attributes=attributes
+        )
+        context = self._otel.set_span_in_context(root)
+        for span in trace.spans:
+            child_start = start_ns + int(span.start * 1e9)
+            child = self.tracer.start_span(
+                span.name, context=context, start_time=child_start
+            )
+            child.end(end_time=child_start + int(span.seconds * 1e9))
+        if trace.error:
+            root.set_attribute("error.message", trace.error)
+        root.end(end_time=start_ns + int(trace.total_seconds * 1e9))
+
+
+def make_trace_hook(value: str) -> TraceHook:
+    """
+    Returns a trace hook for the --query-trace option: "log", "otel", or
+    the path of a JSON lines file.
+    """
+    if value == "log":
+        return LoggingTraceHook()
+    elif value == "otel":
+        return OpenTelemetryTraceHook()
+    return JsonLinesTraceHook(value)
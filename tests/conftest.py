@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Generator
+from typing import Any, Callable, Generator
 
 import pytest
 from mysql.connector import connect
@@ -35,9 +35,38 @@ def connection() -> Generator[HarlequinMySQLConnection, None, None]:
         database="test",
     ).connect()
     yield conn
+    conn.close()
     cur = mysqlconn.cursor()
     cur.execute("drop database if exists test;")
     cur.execute("drop database if exists one;")
     cur.execute("drop database if exists two;")
     cur.execute("drop database if exists three;")
     cur.close()
+    mysqlconn.close()
+
+
+@pytest.fixture
+def make_connection(
+    connection: HarlequinMySQLConnection,
+) -> Generator[Callable[..., HarlequinMySQLConnection], None, None]:
+    """
+    Connects to the test database with extra adapter options. The
+    connections are closed after the test.
+    """
+    conns: list[HarlequinMySQLConnection] = []
+
+    def _connect(**options: Any) -> HarlequinMySQLConnection:
+        conn = HarlequinMySQLAdapter(
+            conn_str=tuple(),
+            host="localhost",
+            user="root",
+            password="example",
+            database="test",
+            **options,
+        ).connect()
+        conns.append(conn)
+        return conn
+
+    yield _connect
+    for conn in conns:
+        conn.close()
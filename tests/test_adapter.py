@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import threading
+import time
+from datetime import datetime
+from decimal import Decimal
 from importlib.metadata import entry_points
+from typing import Any, Callable, Iterator, Sequence, cast
 
+import mysql.connector
+import pyarrow as pa
 import pytest
 from harlequin import (
     HarlequinAdapter,
@@ -10,15 +17,41 @@ from harlequin import (
     HarlequinCursor,
 )
 from harlequin.catalog import Catalog, CatalogItem
-from harlequin.exception import HarlequinConnectionError, HarlequinQueryError
+from harlequin.driver import HarlequinDriver
+from harlequin.exception import (
+    HarlequinConfigError,
+    HarlequinConnectionError,
+    HarlequinQueryError,
+)
+from mysql.connector import FieldType, MySQLConnection
 from mysql.connector.cursor import MySQLCursor
+from mysql.connector.errors import ProgrammingError
 from mysql.connector.pooling import PooledMySQLConnection
+from textual.message import Message
+from textual.worker import Worker, active_worker
 from textual_fastdatatable.backend import create_backend
 
 from harlequin_mysql.adapter import (
     HarlequinMySQLAdapter,
+    HarlequinMySQLCachedCursor,
     HarlequinMySQLConnection,
+    HarlequinMySQLCursor,
+    HarlequinMySQLPlanCursor,
+    _notify,
 )
+from harlequin_mysql.pool import HarlequinConnectionPool
+from harlequin_mysql.tracing import QueryTrace
+
+MakeConnection = Callable[..., HarlequinMySQLConnection]
+
+
+class FakeMySQLConnection(MySQLConnection):
+    # never connects; good enough to fill the pools of an adapter under test.
+    def is_connected(self) -> bool:
+        return True
+
+    def disconnect(self) -> None:
+        pass
 
 
 def test_plugin_discovery() -> None:
@@ -72,6 +105,35 @@ def test_enable_cleartext_plugin_string_true() -> None:
     assert adapter.options["allow_local_infile"] == "true"
 
 
+def test_limit_pushdown_default() -> None:
+    adapter = HarlequinMySQLAdapter(conn_str=tuple(), user="root", password="example")
+    assert adapter.adapter_options["limit_pushdown"] == "off"
+    assert "limit_pushdown" not in adapter.options
+
+
+def test_limit_pushdown_raises_config_error() -> None:
+    with pytest.raises(HarlequinConfigError):
+        _ = HarlequinMySQLAdapter(conn_str=tuple(), limit_pushdown="foo")
+
+
+def test_fetch_memory_budget_raises_config_error() -> None:
+    with pytest.raises(HarlequinConfigError):
+        _ = HarlequinMySQLAdapter(conn_str=tuple(), fetch_memory_budget="lots")
+
+
+def test_explain_raises_config_error() -> None:
+    with pytest.raises(HarlequinConfigError):
+        _ = HarlequinMySQLAdapter(conn_str=tuple(), explain="profile")
+
+
+@pytest.mark.parametrize(
+    "option", ["max_execution_time", "max_result_rows", "max_result_bytes"]
+)
+def test_governor_raises_config_error(option: str) -> None:
+    with pytest.raises(HarlequinConfigError):
+        _ = HarlequinMySQLAdapter(conn_str=tuple(), **{option: "lots"})
+
+
 def test_connect_raises_connection_error() -> None:
     with pytest.raises(HarlequinConnectionError):
         _ = HarlequinMySQLAdapter(conn_str=("foo",)).connect()
@@ -95,6 +157,76 @@ def test_connection_id(options: dict[str, str | int | None], expected: str) -> N
     assert adapter.connection_id == expected
 
 
+def test_catalog_cache_key() -> None:
+    foo = HarlequinMySQLAdapter(conn_str=tuple(), user="foo")
+    bar = HarlequinMySQLAdapter(conn_str=tuple(), user="bar")
+    assert foo.connection_id == bar.connection_id
+    assert foo.catalog_cache_key == "foo@127.0.0.1:3306/"
+    assert foo.catalog_cache_key != bar.catalog_cache_key
+
+
+@pytest.mark.skipif(not mysql.connector.HAVE_CEXT, reason="needs the C extension")
+@pytest.mark.parametrize("limit_pushdown", ["close", "kill"])
+def test_stop_early_abandons_c_connection(limit_pushdown: str) -> None:
+    from mysql.connector.connection_cext import CMySQLConnection
+
+    class UnreadCMySQLConnection(CMySQLConnection):
+        # a C connection in the middle of reading a result set; unlike the
+        # pure-Python connection, unread_result has no setter.
+        connection_id = 7
+        disconnected = False
+
+        @property  # type: ignore[misc]
+        def unread_result(self) -> bool:
+            return not self.disconnected
+
+        def disconnect(self) -> None:
+            self.disconnected = True
+            super().disconnect()
+
+    class FakeCursor:
+        description = [("a", FieldType.LONG, None, None, None, None, 1, 0, 63)]
+
+        def fetchone(self) -> tuple[int]:
+            return (1,)
+
+        def close(self) -> None:
+            raise AssertionError("an abandoned cursor must not be read")
+
+    class FakeConnection:
+        def __init__(self) -> None:
+            self.limit_pushdown = limit_pushdown
+            self.kills: list[int] = []
+            self._in_use_connections = {7}
+
+        def cancel_connection(self, connection_id: int) -> bool:
+            self.kills.append(connection_id)
+            # the kill fails, so both modes fall back to closing.
+            return False
+
+        def _collect_statement_stats(self, connection_id: int) -> None:
+            raise AssertionError("an abandoned connection must not be queried")
+
+    pool = HarlequinConnectionPool(pool_size=1, pool_name="test")
+    cnx = UnreadCMySQLConnection()
+    pool._open = 1
+    pool._check_out(cnx, 0.0, False)
+    harlequin_conn = FakeConnection()
+    cur = HarlequinMySQLCursor(
+        cast(MySQLCursor, FakeCursor()),
+        PooledMySQLConnection(pool, cnx),
+        cast(HarlequinMySQLConnection, harlequin_conn),
+    )
+
+    assert cur._stop_early(kill=limit_pushdown == "kill")
+    assert harlequin_conn.kills == [7]
+    assert cnx.disconnected
+    cur._release()
+    stats = pool.stats()
+    assert (stats.open, stats.in_use) == (0, 0)
+    assert not harlequin_conn._in_use_connections
+
+
 def test_get_catalog(connection: HarlequinMySQLConnection) -> None:
     catalog = connection.get_catalog()
     assert isinstance(catalog, Catalog)
@@ -114,6 +246,110 @@ def test_get_completions(connection: HarlequinMySQLConnection) -> None:
     assert len(filtered) == len(expected)
 
 
+def test_server_info(connection: HarlequinMySQLConnection) -> None:
+    server_info = connection.server_info
+    assert server_info is not None
+    assert server_info.version >= (5, 7, 0)
+    assert connection.server_info is server_info
+
+
+def test_schema_completions(
+    connection: HarlequinMySQLConnection, make_connection: MakeConnection
+) -> None:
+    connection.execute("create table foo (a int, b text)")
+    conn = make_connection(schema_completions=True)
+    # get_completions() waits for the current database's names.
+    completions = conn.get_completions()
+    labels = {(c.label, c.type_label, c.context) for c in completions}
+    assert ("test", "db", None) in labels
+    assert ("foo", "t", None) in labels
+    assert ("foo", "t", "test") in labels
+    assert ("b", "s", "foo") in labels
+
+    # after DDL, reading the catalog updates the list Harlequin was given.
+    assert conn._schema_completions_thread is not None
+    conn._schema_completions_thread.join()
+    conn.execute("alter table foo add column c int")
+    conn.get_catalog()
+    assert ("c", "##", "foo") in {
+        (c.label, c.type_label, c.context) for c in completions
+    }
+
+
+def test_schema_completions_wait_and_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    relations = {"test": [("foo", "BASE TABLE")], "other": [("bar", "VIEW")]}
+    columns = {"test": [("foo", "a", "int")], "other": [("bar", "b", "text")]}
+    others_loaded = threading.Event()
+
+    def _relation_rows(
+        self: HarlequinMySQLConnection, db_names: Sequence[str] | None = None
+    ) -> Iterator[tuple[Any, ...]]:
+        if db_names is None:
+            # every other database loads slowly.
+            others_loaded.wait(5)
+        for db_name in db_names or list(relations):
+            for rel_name, table_type in relations[db_name]:
+                yield db_name, rel_name, table_type, None, None, None
+
+    def _column_rows(
+        self: HarlequinMySQLConnection, db_names: Sequence[str] | None = None
+    ) -> Iterator[tuple[str, str, str, str]]:
+        for db_name in db_names or list(columns):
+            for rel_name, col_name, data_type in columns[db_name]:
+                yield db_name, rel_name, col_name, data_type
+
+    monkeypatch.setattr(
+        "harlequin_mysql.pool.connect", lambda **_: FakeMySQLConnection()
+    )
+    monkeypatch.setattr(
+        "harlequin_mysql.control.connect", lambda **_: FakeMySQLConnection()
+    )
+    monkeypatch.setattr(
+        HarlequinMySQLConnection, "_stream_relation_rows", _relation_rows
+    )
+    monkeypatch.setattr(HarlequinMySQLConnection, "_stream_column_rows", _column_rows)
+    monkeypatch.setattr(HarlequinMySQLConnection, "server_info", None)
+    conn = HarlequinMySQLAdapter(
+        conn_str=tuple(), database="test", schema_completions=True
+    ).connect()
+    # get_completions() waits for the current database's names only.
+    completions = conn.get_completions()
+    labels = {(c.label, c.context) for c in completions}
+    assert ("foo", "test") in labels
+    assert ("a", "foo") in labels
+    assert ("bar", "other") not in labels
+
+    # the rest are added to the same list once they load.
+    others_loaded.set()
+    assert conn._schema_completions_thread is not None
+    conn._schema_completions_thread.join()
+    labels = {(c.label, c.context) for c in completions}
+    assert ("bar", "other") in labels
+    assert ("b", "bar") in labels
+    conn.close()
+
+
+def test_cancel_connection(connection: HarlequinMySQLConnection) -> None:
+    results: list[HarlequinCursor | None] = []
+    worker = threading.Thread(
+        target=lambda: results.append(connection.execute("select sleep(30)"))
+    )
+    start = time.monotonic()
+    worker.start()
+    while not connection._in_use_connections:
+        assert time.monotonic() - start < 5
+        time.sleep(0.01)
+    [connection_id] = connection._in_use_connections
+    assert connection.cancel_connection(connection_id)
+    worker.join(timeout=10)
+    assert not worker.is_alive()
+    assert time.monotonic() - start < 10
+    stats = connection.cancel_stats
+    assert stats.kills == 1
+    assert stats.last_seconds is not None
+    assert stats.last_seconds < 5
+
+
 def test_execute_ddl(connection: HarlequinMySQLConnection) -> None:
     cur = connection.execute("create table foo (a int)")
     assert cur is None
@@ -129,6 +365,271 @@ def test_execute_select(connection: HarlequinMySQLConnection) -> None:
     assert backend.row_count == 1
 
 
+def test_execute_select_arrow(make_connection: MakeConnection) -> None:
+    conn = make_connection(arrow_fetch=True)
+    cur = conn.execute("select 1 as a, 'foo' as b, now() as c, 1.5 as d")
+    assert isinstance(cur, HarlequinCursor)
+    data = cur.fetchall()
+    assert isinstance(data, pa.Table)
+    backend = create_backend(data)
+    assert backend.column_count == 4
+    assert backend.row_count == 1
+
+
+def test_iter_batches(connection: HarlequinMySQLConnection) -> None:
+    cur = connection.execute("select * from information_schema.columns")
+    assert isinstance(cur, HarlequinMySQLCursor)
+    batches = list(cur.iter_batches(max_rows=10, batch_size=3))
+    assert [b.num_rows for b in batches] == [3, 3, 3, 1]
+    assert cur.stream_stats is not None
+    assert cur.stream_stats.rows == 10
+    assert cur.stream_stats.truncated
+    # the rest of the result is counted as it is read off the connection.
+    assert cur.stream_stats.unfetched_rows
+    assert "more rows" in cur.stream_stats.message
+
+
+def test_notify() -> None:
+    posted: list[Message] = []
+
+    class FakeApp:
+        def post_message(self, message: Message) -> bool:
+            posted.append(message)
+            return True
+
+    class FakeWorker:
+        node = FakeApp()
+
+    # outside of a Harlequin worker, there is no one to notify.
+    _notify("Fetched 10 rows.")
+    assert not posted
+    token = active_worker.set(cast(Worker[Any], FakeWorker()))
+    try:
+        _notify("Fetched 10 rows.")
+    finally:
+        active_worker.reset(token)
+    [message] = posted
+    assert isinstance(message, HarlequinDriver.Notify)
+    assert message.notify_message == "Fetched 10 rows."
+    assert message.severity == "warning"
+
+
+def test_fetch_memory_budget(make_connection: MakeConnection) -> None:
+    conn = make_connection(fetch_memory_budget="1KB")
+    cur = conn.execute("select * from information_schema.columns")
+    assert isinstance(cur, HarlequinMySQLCursor)
+    data = cur.fetchall()
+    assert isinstance(data, pa.Table)
+    assert data.nbytes <= 1024
+    assert cur.stream_stats is not None
+    assert cur.stream_stats.stopped_by == "bytes"
+
+
+def test_max_result_rows(make_connection: MakeConnection) -> None:
+    conn = make_connection(max_result_rows=10)
+    cur = conn.execute("select * from information_schema.columns")
+    assert isinstance(cur, HarlequinMySQLCursor)
+    with pytest.raises(HarlequinQueryError, match="--max-result-rows"):
+        cur.fetchall()
+    # results that fit are returned as usual.
+    cur = conn.execute("select 1 as a")
+    assert isinstance(cur, HarlequinMySQLCursor)
+    data = cur.fetchall()
+    assert isinstance(data, pa.Table)
+    assert data.num_rows == 1
+
+
+def test_max_execution_time(make_connection: MakeConnection) -> None:
+    conn = make_connection(max_execution_time=0.1)
+    with pytest.raises(HarlequinQueryError, match="--max-execution-time"):
+        cur = conn.execute(
+            "select count(*) from information_schema.columns as a, "
+            "information_schema.columns as b, information_schema.columns as c"
+        )
+        assert cur is not None
+        cur.fetchall()
+
+
+def test_result_cache(make_connection: MakeConnection) -> None:
+    conn = make_connection(result_cache_size="1MB")
+    conn.execute("create table cached (a int)")
+    conn.execute("insert into cached values (1)")
+
+    for _ in range(2):
+        cur = conn.execute("select a from cached")
+        assert cur is not None
+        assert cur.set_limit(100).fetchall() == [(1,)]
+    assert isinstance(
+        conn.execute("select   a from cached;"), HarlequinMySQLCachedCursor
+    )
+    stats = conn.result_cache_stats
+    assert stats is not None
+    assert (stats.hits, stats.misses) == (2, 1)
+
+    # DML clears the cache.
+    conn.execute("insert into cached values (2)")
+    cur = conn.execute("select a from cached")
+    assert isinstance(cur, HarlequinMySQLCursor)
+    assert sorted(cur.set_limit(100).fetchall()) == [(1,), (2,)]
+    assert stats.invalidations == 1
+
+
+def test_prepared_statements(make_connection: MakeConnection) -> None:
+    conn = make_connection(prepared_statements=True)
+    cur = conn.execute("select 1 as a, 1.5 as b, date('2024-01-02') as c, 'foo' as d")
+    assert isinstance(cur, HarlequinMySQLCursor)
+    assert cur._binary
+    assert cur.columns() == [("a", "##"), ("b", "#.#"), ("c", "d"), ("d", "s")]
+    [row] = cur.fetchall()
+    assert row[0] == 1
+    assert str(row[2]) == "2024-01-02"
+
+    # a large result can be stopped early, and its connection reused.
+    cur = conn.execute("select * from information_schema.columns")
+    assert isinstance(cur, HarlequinMySQLCursor)
+    assert len(cur.set_limit(10).fetchall()) == 10
+    cur = conn.execute("select 1 as a")
+    assert cur is not None
+    assert cur.fetchall() == [(1,)]
+
+
+def test_raw_fetch(make_connection: MakeConnection) -> None:
+    conn = make_connection(raw_fetch=True)
+    cur = conn.execute(
+        "select 1 as a, 1.50 as b, timestamp('2024-01-02 03:04:05') as c, 'foo' as d"
+    )
+    assert isinstance(cur, HarlequinMySQLCursor)
+    assert cur._raw
+    data = cur.fetchall()
+    assert isinstance(data, pa.Table)
+    assert data.to_pylist() == [
+        {"a": 1, "b": Decimal("1.50"), "c": datetime(2024, 1, 2, 3, 4, 5), "d": "foo"}
+    ]
+
+
+def test_query_trace(make_connection: MakeConnection) -> None:
+    conn = make_connection()
+    traces: list[QueryTrace] = []
+    conn.add_trace_hook(traces.append)
+    cur = conn.execute("select 1 as a union all select 2")
+    assert cur is not None
+    cur.fetchall()
+    assert conn.execute("set @foo = 1") is None
+    with pytest.raises(HarlequinQueryError):
+        conn.execute("select * from no_such_table")
+    select, set_, error = traces
+    assert [s.name for s in select.spans] == [
+        "checkout",
+        "execute",
+        "first_row",
+        "fetch",
+        "release",
+    ]
+    assert select.rows == 2
+    assert select.bytes
+    assert select.connection_id
+    assert [s.name for s in set_.spans] == ["checkout", "execute", "release"]
+    assert error.error
+
+
+def test_statement_stats(make_connection: MakeConnection) -> None:
+    conn = make_connection(statement_stats=True)
+    for _ in range(2):
+        cur = conn.execute("select * from information_schema.character_sets")
+        assert isinstance(cur, HarlequinMySQLCursor)
+        cur.fetchall()
+        assert cur.statement_stats is not None
+        assert cur.statement_stats.rows_sent > 0
+    summary = conn.statement_stats_summary
+    assert summary is not None
+    assert summary[0].count == 2
+
+    # prepared statements are closed after they run, which doesn't count.
+    conn = make_connection(statement_stats=True, prepared_statements=True)
+    cur = conn.execute("select * from information_schema.character_sets")
+    assert isinstance(cur, HarlequinMySQLCursor)
+    cur.fetchall()
+    assert cur.statement_stats is not None
+    assert cur.statement_stats.rows_sent > 0
+
+
+def test_statement_stats_skipped_when_metadata_pool_busy(
+    make_connection: MakeConnection,
+) -> None:
+    conn = make_connection(statement_stats=True)
+    assert conn._metadata_pool is not None
+    busy = [
+        conn._metadata_pool.get_connection()
+        for _ in range(conn._metadata_pool.max_size)
+    ]
+    start = time.monotonic()
+    cur = conn.execute("select 1")
+    assert isinstance(cur, HarlequinMySQLCursor)
+    cur.fetchall()
+    assert time.monotonic() - start < conn._metadata_pool.timeout
+    assert cur.statement_stats is None
+    for busy_conn in busy:
+        busy_conn.close()
+
+
+def test_statement_stats_error_releases_metadata_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class FailingCursor:
+        def execute(self, query: str, params: Any = None) -> None:
+            raise ProgrammingError("performance_schema is not enabled")
+
+        def close(self) -> None:
+            pass
+
+    class FailingConnection(FakeMySQLConnection):
+        def cursor(self, *args: Any, **kwargs: Any) -> Any:
+            return FailingCursor()
+
+    monkeypatch.setattr("harlequin_mysql.pool.connect", lambda **_: FailingConnection())
+    monkeypatch.setattr(
+        "harlequin_mysql.control.connect", lambda **_: FailingConnection()
+    )
+    conn = HarlequinMySQLAdapter(conn_str=tuple(), statement_stats=True).connect()
+    assert conn._metadata_pool is not None
+    assert conn._collect_statement_stats(7) is None
+    assert not conn._statement_stats_available
+    assert conn._metadata_pool.stats().in_use == 0
+    conn.close()
+
+
+@pytest.mark.parametrize("mode", ["plan", "analyze"])
+def test_explain(mode: str, make_connection: MakeConnection) -> None:
+    conn = make_connection(explain=mode)
+    conn.execute("create database if not exists explain_test")
+    conn.execute("use explain_test")
+    conn.execute("create table if not exists foo (a int, b int)")
+    cur = conn.execute("select * from foo order by b")
+    assert isinstance(cur, HarlequinMySQLPlanCursor)
+    assert [name for name, _ in cur.columns()][:3] == ["node", "table", "access_type"]
+    assert any(node.table == "foo" and node.flags for node in cur.nodes)
+    assert cur.fetchall()
+    conn.execute("drop database explain_test")
+
+
+def test_explain_analyze_can_be_cancelled(make_connection: MakeConnection) -> None:
+    conn = make_connection(explain="analyze")
+    results: list[HarlequinCursor | None] = []
+    worker = threading.Thread(
+        target=lambda: results.append(conn.execute("select sleep(30)"))
+    )
+    start = time.monotonic()
+    worker.start()
+    # EXPLAIN ANALYZE runs the query on a connection that cancel() can kill.
+    while not conn._in_use_connections:
+        assert time.monotonic() - start < 5
+        time.sleep(0.01)
+    conn.cancel()
+    worker.join(timeout=10)
+    assert not worker.is_alive()
+    assert results == [None]
+
+
 def test_execute_select_no_records(connection: HarlequinMySQLConnection) -> None:
     cur = connection.execute("select 1 as a where false")
     assert isinstance(cur, HarlequinCursor)
@@ -159,6 +660,33 @@ def test_set_limit(connection: HarlequinMySQLConnection) -> None:
     assert backend.row_count == 2
 
 
+@pytest.mark.parametrize("mode", ["kill", "close"])
+def test_limit_pushdown(mode: str, make_connection: MakeConnection) -> None:
+    conn = make_connection(limit_pushdown=mode)
+    query = "select * from information_schema.columns"
+    # the first query learns the limit and stops early.
+    cur = conn.execute(query)
+    assert isinstance(cur, HarlequinCursor)
+    data = cur.set_limit(2).fetchall()
+    assert create_backend(data).row_count == 2
+    # the second query is rewritten with a server-side limit.
+    cur = conn.execute(query)
+    assert isinstance(cur, HarlequinMySQLCursor)
+    assert cur._server_limit == 2
+    data = cur.set_limit(2).fetchall()
+    assert create_backend(data).row_count == 2
+    # raising the limit re-runs the query with the new limit.
+    cur = conn.execute(query)
+    assert isinstance(cur, HarlequinMySQLCursor)
+    data = cur.set_limit(5).fetchall()
+    assert create_backend(data).row_count == 5
+    # the connections that were stopped early are still usable.
+    for _ in range(conn._pool.pool_size):
+        cur = conn.execute("select 1")
+        assert isinstance(cur, HarlequinCursor)
+        assert cur.fetchall() == [(1,)]
+
+
 def test_execute_raises_query_error(connection: HarlequinMySQLConnection) -> None:
     with pytest.raises(HarlequinQueryError):
         _ = connection.execute("selec;")
@@ -184,16 +712,46 @@ def test_can_execute_pool_size_ddl(connection: HarlequinMySQLConnection) -> None
     assert len(cursors) == pool_size
 
 
-def test_execute_more_than_pool_size_queries_does_not_raise(
+def test_execute_more_than_pool_size_queries_grows_pool(
     connection: HarlequinMySQLConnection,
 ) -> None:
     pool_size = connection._pool.pool_size
+    max_size = connection._pool.max_size
+    assert max_size > pool_size
+    connection._pool.timeout = 0.1
     cursors: list[HarlequinCursor] = []
-    for _ in range(pool_size * 2):
+    for _ in range(max_size):
         cur = connection.execute("select 1")
-        if cur is not None:
-            cursors.append(cur)
-    assert len(cursors) == pool_size
+        assert cur is not None
+        cursors.append(cur)
+    stats = connection.pool_stats
+    assert stats.open == max_size
+    assert stats.in_use == max_size
+    assert stats.grown == max_size - pool_size
+
+    with pytest.raises(HarlequinQueryError):
+        connection.execute("select 1")
+    assert connection.pool_stats.timeouts == 1
+
+    # fetching a result returns its connection to the pool.
+    assert cursors[0].fetchall() == [(1,)]
+    cur = connection.execute("select 1")
+    assert cur is not None
+
+
+def test_catalog_uses_metadata_pool(connection: HarlequinMySQLConnection) -> None:
+    connection._pool.timeout = 0.1
+    cursors: list[HarlequinCursor] = []
+    for _ in range(connection._pool.max_size):
+        cur = connection.execute("select 1")
+        assert cur is not None
+        cursors.append(cur)
+    # the main pool is exhausted, but the catalog can still be loaded.
+    catalog = connection.get_catalog()
+    assert catalog.items
+    assert connection.metadata_pool_stats is not None
+    assert connection.metadata_pool_stats.checkouts > 0
+    assert connection.metadata_pool_stats.in_use == 0
 
 
 def test_execute_more_than_pool_size_ddl_does_not_raise(
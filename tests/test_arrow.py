@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, cast
+
+import pyarrow as pa
+from mysql.connector import FieldType
+from mysql.connector.constants import FieldFlag
+from mysql.connector.cursor import MySQLCursor
+
+from harlequin_mysql.arrow import (
+    BINARY_CHARSET_ID,
+    fetch_arrow_table,
+    rows_to_record_batch,
+)
+
+UTF8MB4_CHARSET_ID = 255
+
+
+def _col(name: str, type_code: int, flags: int = 0, charset: int = 255) -> tuple:
+    return (name, type_code, None, None, None, None, True, flags, charset)
+
+
+DESCRIPTION = [
+    _col("i", FieldType.LONGLONG),
+    _col("u", FieldType.LONGLONG, flags=FieldFlag.UNSIGNED),
+    _col("f", FieldType.DOUBLE),
+    _col("d", FieldType.NEWDECIMAL),
+    _col("dt", FieldType.DATETIME),
+    _col("da", FieldType.DATE),
+    _col("t", FieldType.TIME),
+    _col("s", FieldType.VAR_STRING, charset=UTF8MB4_CHARSET_ID),
+    _col("b", FieldType.BLOB, charset=BINARY_CHARSET_ID),
+    _col("set", FieldType.SET),
+]
+
+ROWS = [
+    (
+        1,
+        2**64 - 1,
+        1.5,
+        Decimal("1.10"),
+        datetime(2024, 1, 1, 12),
+        date(2024, 1, 1),
+        timedelta(hours=1),
+        "foo",
+        b"\x00",
+        {"b", "a"},
+    ),
+    (None, None, None, None, None, None, None, None, None, None),
+]
+
+
+class FakeCursor:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self.rows = rows
+
+    def fetchmany(self, size: int) -> list[tuple[Any, ...]]:
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+def _cursor(fake: FakeCursor) -> MySQLCursor:
+    return cast(MySQLCursor, fake)
+
+
+def test_rows_to_record_batch() -> None:
+    batch = rows_to_record_batch(ROWS, DESCRIPTION)
+    assert batch.num_rows == 2
+    assert batch.schema.names == [col[0] for col in DESCRIPTION]
+    assert batch.schema.types == [
+        pa.int64(),
+        pa.uint64(),
+        pa.float64(),
+        pa.decimal128(3, 2),
+        pa.timestamp("us"),
+        pa.date32(),
+        pa.duration("us"),
+        pa.string(),
+        pa.binary(),
+        pa.string(),
+    ]
+    assert batch.column(9).to_pylist() == ["a,b", None]
+
+
+def test_rows_to_record_batch_no_rows() -> None:
+    batch = rows_to_record_batch([], DESCRIPTION)
+    assert batch.num_rows == 0
+    assert batch.num_columns == len(DESCRIPTION)
+
+
+def test_rows_to_record_batch_dupe_cols() -> None:
+    description = [_col("a", FieldType.LONG)] * 3
+    batch = rows_to_record_batch([(1, 2, 3)], description)
+    assert batch.schema.names == ["a", "a", "a"]
+
+
+def test_fetch_arrow_table() -> None:
+    cur = FakeCursor(ROWS * 5)
+    table = fetch_arrow_table(_cursor(cur), DESCRIPTION, batch_size=3)
+    assert table.num_rows == 10
+    assert table.num_columns == len(DESCRIPTION)
+
+
+def test_fetch_arrow_table_limit() -> None:
+    cur = FakeCursor(ROWS * 5)
+    table = fetch_arrow_table(_cursor(cur), DESCRIPTION, limit=4, batch_size=3)
+    assert table.num_rows == 4
+    assert cur.rows
+
+
+def test_fetch_arrow_table_no_rows() -> None:
+    table = fetch_arrow_table(_cursor(FakeCursor([])), DESCRIPTION)
+    assert table.num_rows == 0
+    assert table.num_columns == len(DESCRIPTION)
+
+
+def test_fetch_arrow_table_mixed_batches() -> None:
+    description = [_col("d", FieldType.NEWDECIMAL)]
+    rows: list[tuple[Any, ...]] = [(None,), (Decimal("1.5"),), ("foo",)]
+    table = fetch_arrow_table(_cursor(FakeCursor(rows)), description, batch_size=1)
+    assert table.num_rows == 3
+
+
+RAW_ROWS = [
+    (
+        b"1",
+        b"18446744073709551615",
+        b"1.5",
+        b"1.10",
+        b"2024-01-01 12:00:00",
+        b"2024-01-01",
+        b"01:00:00",
+        b"foo",
+        b"\x00",
+        b"a,b",
+    ),
+    (None, None, None, None, None, None, None, None, None, None),
+]
+
+
+def test_rows_to_record_batch_raw() -> None:
+    batch = rows_to_record_batch(RAW_ROWS, DESCRIPTION, raw=True)
+    assert batch.equals(rows_to_record_batch(ROWS, DESCRIPTION))
+
+
+def test_rows_to_record_batch_raw_fallbacks() -> None:
+    description = [
+        _col("bit", FieldType.BIT, charset=BINARY_CHARSET_ID),
+        _col("zero", FieldType.DATETIME),
+        _col("latin1", FieldType.VAR_STRING, charset=8),
+    ]
+    rows = [(b"\x01\x02", b"0000-00-00 00:00:00", bytearray(b"caf\xe9"))]
+    batch = rows_to_record_batch(rows, description, raw=True)
+    assert batch.to_pylist() == [{"bit": 258, "zero": None, "latin1": "caf�"}]
@@ -1,13 +1,34 @@
+from pathlib import Path
+
 import pytest
 
 from harlequin_mysql.adapter import HarlequinMySQLConnection
 from harlequin_mysql.catalog import (
     ColumnCatalogItem,
     DatabaseCatalogItem,
+    ForeignKeyCatalogItem,
+    IndexCatalogItem,
+    KeyGroupCatalogItem,
     RelationCatalogItem,
     TableCatalogItem,
     ViewCatalogItem,
 )
+from harlequin_mysql.catalog_cache import CatalogCache
+
+
+def test_table_stats_label() -> None:
+    parent = DatabaseCatalogItem(
+        qualified_identifier="`one`", query_name="`one`", label="one", type_label="db"
+    )
+    item = parent.relation_from_row("foo", "BASE TABLE", 1_234_567, 2048, 1024)
+    assert isinstance(item, TableCatalogItem)
+    assert item.rows_estimate == 1_234_567
+    assert item.total_bytes == 3072
+    assert item.type_label == "t ~1.2M 3.0 KB"
+    view = parent.relation_from_row("bar", "VIEW", None, None, None)
+    assert isinstance(view, ViewCatalogItem)
+    assert view.type_label == "v"
+    assert parent.relation_from_row("baz", "BASE TABLE").type_label == "t"
 
 
 @pytest.fixture
@@ -73,6 +94,7 @@ def test_catalog(connection_with_objects: HarlequinMySQLConnection) -> None:
     ]
 
     # ensure calling fetch_children on cols doesn't raise
+    assert isinstance(foo_column_items[0], ColumnCatalogItem)
     children_items = foo_column_items[0].fetch_children()
     assert not children_items
 
@@ -83,3 +105,161 @@ def test_catalog(connection_with_objects: HarlequinMySQLConnection) -> None:
 
     three_children = database_three_item.fetch_children()
     assert not three_children
+
+
+def test_bulk_catalog(connection_with_objects: HarlequinMySQLConnection) -> None:
+    conn = connection_with_objects
+    conn.bulk_catalog = True
+
+    catalog = conn.get_catalog()
+
+    assert len(catalog.items) == 5
+    assert all(isinstance(item, DatabaseCatalogItem) for item in catalog.items)
+    assert all(item.loaded for item in catalog.items)  # type: ignore[attr-defined]
+
+    [database_one_item] = filter(lambda item: item.label == "one", catalog.items)
+    assert [item.label for item in database_one_item.children] == ["bar", "baz", "foo"]
+    [foo_item] = filter(lambda item: item.label == "foo", database_one_item.children)
+    assert isinstance(foo_item, TableCatalogItem)
+    assert foo_item.loaded
+    assert foo_item.data_bytes is not None
+    assert foo_item.type_label.startswith("t ")
+    assert [item.label for item in foo_item.children] == ["a", "b"]
+    assert all(isinstance(item, ColumnCatalogItem) for item in foo_item.children)
+
+    [database_two_item] = filter(lambda item: item.label == "two", catalog.items)
+    [qux_item] = database_two_item.children
+    assert isinstance(qux_item, ViewCatalogItem)
+    assert [item.label for item in qux_item.children] == ["a", "b"]
+
+    [database_three_item] = filter(lambda item: item.label == "three", catalog.items)
+    assert not database_three_item.children
+
+
+def test_bulk_catalog_subset(connection_with_objects: HarlequinMySQLConnection) -> None:
+    items = connection_with_objects._get_catalog_tree(["one", "three"])
+    assert [item.label for item in items] == ["one", "three"]
+    assert connection_with_objects._get_catalog_tree([]) == []
+
+
+def test_catalog_cache(
+    connection_with_objects: HarlequinMySQLConnection, tmp_path: Path
+) -> None:
+    conn = connection_with_objects
+    conn.catalog_cache = CatalogCache(key="test", cache_dir=tmp_path)
+
+    # no cache on disk, so the catalog is loaded and saved.
+    catalog = conn.get_catalog()
+    assert len(catalog.items) == 5
+    assert conn.catalog_cache.path.exists()
+
+    # a new connection checks the cached catalog before showing it, loads
+    # changed databases lazily, and refreshes the cache in the background.
+    conn.execute("drop database three")
+    conn.execute("create table two.quux as select 1 as c")
+    conn.catalog_cache = CatalogCache(key="test", cache_dir=tmp_path)
+    conn._catalog_cache_started = False
+    catalog = conn.get_catalog()
+    assert len(catalog.items) == 4
+    [two] = [item for item in catalog.items if item.label == "two"]
+    assert isinstance(two, DatabaseCatalogItem)
+    assert not two.loaded
+    assert "quux" in [child.label for child in two.fetch_children()]
+    assert conn._catalog_cache_thread is not None
+    conn._catalog_cache_thread.join()
+    catalog = conn.get_catalog()
+    assert len(catalog.items) == 4
+
+
+def test_incremental_refresh(connection_with_objects: HarlequinMySQLConnection) -> None:
+    conn = connection_with_objects
+    conn.bulk_catalog = True
+    catalog = conn.get_catalog()
+    [one, two, three] = [
+        next(item for item in catalog.items if item.label == label)
+        for label in ("one", "two", "three")
+    ]
+
+    conn.execute("create table one.quux as select 1 as c")
+    conn.execute("alter table two.qux rename to two.qux2")
+    conn.execute("create database four")
+    catalog = conn.get_catalog()
+
+    assert len(catalog.items) == 6
+    # untouched items are reused, with their children.
+    assert next(item for item in catalog.items if item.label == "three") is three
+    assert next(item for item in catalog.items if item.label == "one") is one
+    assert [item.label for item in one.children] == ["bar", "baz", "foo", "quux"]
+    assert all(item.loaded for item in one.children if item.label != "quux")  # type: ignore[attr-defined]
+    assert [item.label for item in two.children] == ["qux2"]
+
+
+def test_preview(connection_with_objects: HarlequinMySQLConnection) -> None:
+    conn = connection_with_objects
+    conn.execute("create table one.keyed (id int primary key, b int)")
+    conn.execute("insert into one.keyed values (2, 20), (1, 10)")
+    [database_one_item] = filter(
+        lambda item: item.label == "one", conn.get_catalog().items
+    )
+    assert isinstance(database_one_item, DatabaseCatalogItem)
+    relations = {item.label: item for item in database_one_item.fetch_children()}
+
+    assert "order by `id`" in conn.preview_query(relations["keyed"])
+    cur = conn.preview(relations["keyed"])
+    assert cur is not None
+    assert cur.fetchall() == [(1, 10), (2, 20)]
+
+    assert "order by" not in conn.preview_query(relations["foo"])
+
+    [database_two_item] = filter(
+        lambda item: item.label == "two", conn.get_catalog().items
+    )
+    assert isinstance(database_two_item, DatabaseCatalogItem)
+    [qux_item] = database_two_item.fetch_children()
+    assert "MAX_EXECUTION_TIME" in conn.preview_query(qux_item)
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_keys(connection_with_objects: HarlequinMySQLConnection, bulk: bool) -> None:
+    conn = connection_with_objects
+    conn.execute("create table one.parent (id int primary key, name varchar(10))")
+    conn.execute(
+        "create table one.child (id int primary key, parent_id int, b int, "
+        "index idx_parent_b (parent_id, b), "
+        "constraint fk_parent foreign key (parent_id) references one.parent (id))"
+    )
+    conn.bulk_catalog = bulk
+    [database_one_item] = filter(
+        lambda item: item.label == "one", conn.get_catalog().items
+    )
+    assert isinstance(database_one_item, DatabaseCatalogItem)
+    relations = {
+        item.label: item
+        for item in (
+            database_one_item.children if bulk else database_one_item.fetch_children()
+        )
+    }
+    child = relations["child"]
+    assert isinstance(child, RelationCatalogItem)
+    children = child.children if bulk else child.fetch_children()
+
+    columns = {
+        c.label: c.type_label for c in children if isinstance(c, ColumnCatalogItem)
+    }
+    # indexed columns are marked in their labels, not their type labels.
+    assert columns == {"id (pk)": "##", "parent_id (idx)": "##", "b (idx)": "##"}
+    groups = {c.label: c for c in children if isinstance(c, KeyGroupCatalogItem)}
+    assert set(groups) == {"Indexes", "Foreign keys"}
+    indexes = {
+        c.label: c
+        for c in groups["Indexes"].children
+        if isinstance(c, IndexCatalogItem)
+    }
+    assert indexes["PRIMARY"].type_label.startswith("pk (id)")
+    assert indexes["PRIMARY"].qualified_identifier == "`one`.`child`.`PRIMARY`"
+    assert indexes["idx_parent_b"].query_name == "`parent_id`, `b`"
+    [fk] = groups["Foreign keys"].children
+    assert isinstance(fk, ForeignKeyCatalogItem)
+    assert fk.label == "fk_parent"
+    assert fk.type_label == "fk (parent_id) -> one.parent (id)"
+    assert [c.name for c in child.column_items()] == ["id", "parent_id", "b"]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from harlequin_mysql.catalog_cache import CatalogCache
+
+
+def _populated_cache(tmp_path: Path) -> CatalogCache:
+    cache = CatalogCache(key="localhost:3306/", cache_dir=tmp_path)
+    cache.update(
+        fingerprints={"one": ["3", "2024-01-01"], "two": ["0", None]},
+        db_names=["one", "two"],
+        relation_rows=[
+            ("one", "bar", "BASE TABLE", 10, 16384, 0),
+            ("one", "foo", "VIEW", None, None, None),
+            ("two", None, None, None, None, None),
+        ],
+        column_rows=[
+            ("one", "bar", "a", "int"),
+            ("one", "foo", "a", "int"),
+            ("one", "foo", "b", "varchar"),
+        ],
+        key_rows=[
+            ("one", "bar", "PRIMARY", 0, 1, "a", 10, None, None, None),
+        ],
+    )
+    return cache
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    cache = _populated_cache(tmp_path)
+    cache.save()
+
+    loaded = CatalogCache(key="localhost:3306/", cache_dir=tmp_path)
+    assert loaded.load()
+    assert list(loaded.relation_rows()) == [
+        ("one", "bar", "BASE TABLE", 10, 16384, 0),
+        ("one", "foo", "VIEW", None, None, None),
+        ("two", None, None, None, None, None),
+    ]
+    assert list(loaded.column_rows()) == list(cache.column_rows())
+    assert list(loaded.key_rows()) == [
+        ("one", "bar", "PRIMARY", 0, 1, "a", 10, None, None, None),
+    ]
+
+
+def test_load_missing_or_other_key(tmp_path: Path) -> None:
+    assert not CatalogCache(key="foo", cache_dir=tmp_path).load()
+    _populated_cache(tmp_path).save()
+    assert not CatalogCache(key="bar", cache_dir=tmp_path).load()
+
+
+def test_diff_and_update(tmp_path: Path) -> None:
+    cache = _populated_cache(tmp_path)
+    fingerprints: dict[str, list[str | None]] = {
+        "one": ["4", "2024-01-02"],
+        "three": ["0", None],
+    }
+    changed, dropped = cache.diff(fingerprints)
+    assert changed == ["one", "three"]
+    assert dropped == ["two"]
+
+    cache.update(
+        fingerprints,
+        changed,
+        relation_rows=[
+            ("one", "bar", "BASE TABLE", 10, 16384, 0),
+            ("three", None, None, None, None, None),
+        ],
+        column_rows=[("one", "bar", "a", "int")],
+        dropped=dropped,
+    )
+    assert cache.diff(fingerprints) == ([], [])
+    assert list(cache.relation_rows()) == [
+        ("one", "bar", "BASE TABLE", 10, 16384, 0),
+        ("three", None, None, None, None, None),
+    ]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+from harlequin_mysql.completions import (
+    DATA_PATH,
+    load_completions,
+    parse_completion_sources,
+    render_completion_data,
+)
+from harlequin_mysql.server import ServerInfo, parse_server_info
+
+
+def test_completion_data_is_up_to_date() -> None:
+    # if this fails, run `make completions`.
+    rows = parse_completion_sources()
+    assert DATA_PATH.read_text() == render_completion_data(rows)
+
+
+def test_load_completions_matches_sources() -> None:
+    expected = sorted(
+        (label, type_label, priority)
+        for label, type_label, priority, _, until in parse_completion_sources()
+        if until is None
+    )
+    completions = load_completions()
+    assert sorted((c.label, c.type_label, c.priority) for c in completions) == expected
+
+
+def test_load_completions_is_memoized() -> None:
+    first = load_completions()
+    second = load_completions()
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert first == load_completions(None)
+    assert load_completions((8, 0, 36)) is not load_completions((8, 0, 36))
+
+
+@pytest.mark.parametrize(
+    "version,label,expected",
+    [
+        (None, "format_bytes", True),
+        ((5, 7, 44), "format_bytes", False),
+        ((8, 0, 15), "format_bytes", False),
+        ((8, 0, 16), "format_bytes", True),
+        (None, "master_pos_wait", False),
+        ((8, 0, 25), "master_pos_wait", True),
+        ((8, 0, 26), "master_pos_wait", False),
+        ((5, 7, 44), "json_merge", False),
+    ],
+)
+def test_load_function_completions_for_version(
+    version: tuple[int, int, int] | None, label: str, expected: bool
+) -> None:
+    labels = {c.label for c in load_completions(version) if c.type_label == "fn"}
+    assert (label in labels) == expected
+
+
+@pytest.mark.parametrize(
+    "version,expected", [(None, False), ((5, 7, 44), True), ((8, 0, 36), False)]
+)
+def test_load_removed_keywords_for_version(
+    version: tuple[int, int, int] | None, expected: bool
+) -> None:
+    labels = {c.label for c in load_completions(version) if c.type_label == "kw"}
+    assert ("analyse" in labels) == expected
+
+
+@pytest.mark.parametrize(
+    "server_info,expected",
+    [
+        ("8.0.36", ServerInfo("mysql", (8, 0, 36))),
+        ("8.4.0-commercial", ServerInfo("mysql", (8, 4, 0))),
+        ("5.7.44-log", ServerInfo("mysql", (5, 7, 44))),
+        (
+            "5.5.5-10.11.6-MariaDB-1:10.11.6+maria~ubu2204",
+            ServerInfo("mariadb", (10, 11, 6)),
+        ),
+        ("11.4.2-MariaDB", ServerInfo("mariadb", (11, 4, 2))),
+        ("garbage", None),
+    ],
+)
+def test_parse_server_info(server_info: str, expected: ServerInfo | None) -> None:
+    assert parse_server_info(server_info) == expected
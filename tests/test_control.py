@@ -0,0 +1,60 @@
+from typing import Any
+
+import pytest
+from mysql.connector import MySQLConnection
+from mysql.connector.errors import DatabaseError
+
+from harlequin_mysql import control
+from harlequin_mysql.control import ControlConnection
+
+
+class FakeCursor:
+    def __init__(self, executed: list[tuple[str, Any]]) -> None:
+        self.executed = executed
+
+    def execute(self, query: str, params: Any) -> None:
+        if params == (2,):
+            raise DatabaseError("Unknown thread id: 2")
+        self.executed.append((query, params))
+
+    def close(self) -> None:
+        pass
+
+
+class FakeConnection(MySQLConnection):
+    executed: list[tuple[str, Any]] = []
+
+    def is_connected(self) -> bool:
+        return True
+
+    def cursor(self, *_: Any, **__: Any) -> Any:
+        return FakeCursor(self.executed)
+
+    def disconnect(self) -> None:
+        pass
+
+
+@pytest.fixture
+def control_connection(monkeypatch: pytest.MonkeyPatch) -> ControlConnection:
+    FakeConnection.executed = []
+    monkeypatch.setattr(control, "connect", lambda **_: FakeConnection())
+    return ControlConnection(timeout=0.1, user="root", connection_timeout=30)
+
+
+def test_kill_queries(control_connection: ControlConnection) -> None:
+    assert control_connection._config["connection_timeout"] == 0.1
+    assert control_connection.kill_queries([1, 2, 3]) == [1, 3]
+    assert FakeConnection.executed == [("KILL QUERY %s", (1,)), ("KILL QUERY %s", (3,))]
+    assert control_connection.kill_query(4)
+    assert not control_connection.kill_query(2)
+    stats = control_connection.stats
+    assert (stats.cancels, stats.kills, stats.failures) == (3, 3, 2)
+    assert stats.max_seconds >= stats.mean_seconds > 0
+
+
+def test_kill_query_is_bounded(control_connection: ControlConnection) -> None:
+    # another cancel is holding the connection.
+    control_connection._lock.acquire()
+    assert not control_connection.kill_query(1)
+    assert control_connection.stats.timeouts == 1
+    assert FakeConnection.executed == []
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Any
+
+from harlequin_mysql.explain import (
+    FILESORT,
+    FULL_INDEX_SCAN,
+    FULL_SCAN,
+    TEMPORARY,
+    flagged_nodes,
+    parse_json_plan,
+    parse_tree_plan,
+)
+
+JSON_PLAN = """
+{
+  "query_block": {
+    "select_id": 1,
+    "cost_info": {"query_cost": "1210.35"},
+    "ordering_operation": {
+      "using_temporary_table": true,
+      "using_filesort": true,
+      "nested_loop": [
+        {
+          "table": {
+            "table_name": "o",
+            "access_type": "ALL",
+            "rows_examined_per_scan": 1000,
+            "filtered": "100.00",
+            "cost_info": {"read_cost": "1.25", "prefix_cost": "101.25"}
+          }
+        },
+        {
+          "table": {
+            "table_name": "c",
+            "access_type": "eq_ref",
+            "key": "PRIMARY",
+            "rows_examined_per_scan": 1,
+            "cost_info": {"prefix_cost": "1210.35"}
+          }
+        }
+      ]
+    }
+  }
+}
+"""
+
+TREE_PLAN = """\
+-> Sort: o.created_at  (actual time=5.1..5.2 rows=1000 loops=1)
+    -> Nested loop inner join  (cost=451.25 rows=1000) (actual time=0.1..4.3 rows=1000 loops=1)
+        -> Table scan on o  (cost=101.25 rows=1000) (actual time=0.05..0.8 rows=1000 loops=1)
+        -> Single-row index lookup on c using PRIMARY (id=o.customer_id)  (cost=0.25 rows=1) (actual time=0.002..0.002 rows=1 loops=1000)
+    -> Covering index scan on t using idx  (cost=1.5 rows=10) (never executed)
+"""  # noqa: E501
+
+
+def test_parse_json_plan() -> None:
+    select, order, orders, customers = parse_json_plan(JSON_PLAN)
+    assert (select.depth, select.operation, select.cost) == (0, "select #1", 1210.35)
+    assert order.depth == 1
+    assert order.flags == (FILESORT, TEMPORARY)
+    assert (orders.depth, orders.table, orders.access_type) == (2, "o", "ALL")
+    assert (orders.rows, orders.cost) == (1000, 101.25)
+    assert orders.flags == (FULL_SCAN,)
+    assert (customers.table, customers.key, customers.flags) == ("c", "PRIMARY", ())
+    assert flagged_nodes([select, order, orders, customers]) == [order, orders]
+
+
+def test_parse_json_plan_v2() -> None:
+    plan: dict[str, Any] = {
+        "operation": "Sort: t.a",
+        "estimated_rows": 10.0,
+        "estimated_total_cost": 2.5,
+        "inputs": [
+            {
+                "operation": "Table scan on t",
+                "table_name": "t",
+                "access_type": "table",
+                "estimated_rows": 10.0,
+                "estimated_total_cost": 1.25,
+            }
+        ],
+    }
+    sort, scan = parse_json_plan(plan)
+    assert sort.flags == (FILESORT,)
+    assert (scan.depth, scan.table, scan.access_type) == (1, "t", "ALL")
+    assert scan.flags == (FULL_SCAN,)
+
+
+def test_parse_tree_plan() -> None:
+    sort, join, orders, customers, index_scan = parse_tree_plan(TREE_PLAN)
+    assert sort.flags == (FILESORT,)
+    assert (sort.cost, sort.actual_rows, sort.actual_ms) == (None, 1000, 5.2)
+    assert (join.depth, join.cost, join.rows, join.loops) == (1, 451.25, 1000, 1)
+    assert (orders.depth, orders.table, orders.access_type) == (2, "o", "ALL")
+    assert orders.flags == (FULL_SCAN,)
+    assert (customers.table, customers.key, customers.access_type) == (
+        "c",
+        "PRIMARY",
+        "eq_ref",
+    )
+    assert customers.loops == 1000
+    assert index_scan.flags == (FULL_INDEX_SCAN,)
+    assert index_scan.actual_rows is None
+    assert index_scan.as_row()[0] == "  Covering index scan on t using idx"
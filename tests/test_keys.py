@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from harlequin_mysql.catalog import (
+    ColumnCatalogItem,
+    DatabaseCatalogItem,
+    KeyGroupCatalogItem,
+)
+from harlequin_mysql.keys import EXPRESSION, group_key_rows
+
+KEY_ROWS = [
+    ("db", "orders", "PRIMARY", 0, 1, "id", 1000, None, None, None),
+    ("db", "orders", "idx_customer", 1, 1, "customer_id", 50, None, None, None),
+    ("db", "orders", "idx_customer", 1, 2, "created_at", 900, None, None, None),
+    ("db", "orders", "uq_ref", 0, 1, None, None, None, None, None),
+    ("db", "customers", "PRIMARY", 0, 1, "id", 50, None, None, None),
+    (
+        "db",
+        "orders",
+        "fk_customer",
+        None,
+        1,
+        "customer_id",
+        None,
+        "db",
+        "customers",
+        "id",
+    ),
+]
+
+
+def test_group_key_rows() -> None:
+    keys = group_key_rows(KEY_ROWS)
+    assert set(keys) == {("db", "orders"), ("db", "customers")}
+
+    orders = keys[("db", "orders")]
+    assert [index.name for index in orders.indexes] == [
+        "PRIMARY",
+        "idx_customer",
+        "uq_ref",
+    ]
+    primary_key = orders.primary_key
+    assert primary_key is not None
+    assert primary_key.columns == ["id"]
+    assert primary_key.unique
+
+    [_, idx_customer, uq_ref] = orders.indexes
+    assert idx_customer.columns == ["customer_id", "created_at"]
+    assert idx_customer.cardinality == 900
+    assert not idx_customer.unique
+    assert uq_ref.columns == [EXPRESSION]
+    assert uq_ref.unique
+    assert uq_ref.cardinality is None
+
+    [fk] = orders.foreign_keys
+    assert fk.name == "fk_customer"
+    assert (fk.ref_database, fk.ref_relation) == ("db", "customers")
+    assert fk.columns == ["customer_id"]
+    assert fk.ref_columns == ["id"]
+
+    assert not keys[("db", "customers")].foreign_keys
+
+
+def test_column_marker() -> None:
+    orders = group_key_rows(KEY_ROWS)[("db", "orders")]
+    assert orders.column_marker("id") == "pk"
+    assert orders.column_marker("created_at") == "idx"
+    assert orders.column_marker("total") is None
+
+
+def test_key_items() -> None:
+    parent = DatabaseCatalogItem(
+        qualified_identifier="`db`", query_name="`db`", label="db", type_label="db"
+    )
+    orders = parent.relation_from_row("orders", "BASE TABLE")
+    keys = group_key_rows(KEY_ROWS)[("db", "orders")]
+    columns = [
+        ColumnCatalogItem.from_parent(orders, label=name, type_label="##")
+        for name in ("id", "created_at", "total")
+    ]
+    indexes, foreign_keys = orders.key_items(columns, keys)
+    # indexed columns are marked in the tree only.
+    assert [(c.label, c.type_label, c.query_name) for c in columns] == [
+        ("id (pk)", "##", "`id`"),
+        ("created_at (idx)", "##", "`created_at`"),
+        ("total", "##", "`total`"),
+    ]
+    # keys are grouped apart from columns, so they aren't member completions
+    # of the relation.
+    assert isinstance(indexes, KeyGroupCatalogItem)
+    assert [(c.label, c.type_label) for c in indexes.children] == [
+        ("PRIMARY", "pk (id) ~1.0k"),
+        ("idx_customer", "idx (customer_id, created_at) ~900"),
+        ("uq_ref", "uq ((expression))"),
+    ]
+    assert isinstance(foreign_keys, KeyGroupCatalogItem)
+    [fk] = foreign_keys.children
+    assert fk.qualified_identifier == "`db`.`orders`.`fk_customer`"
+    assert fk.type_label == "fk (customer_id) -> db.customers (id)"
+    assert orders.key_items(columns, None) == []
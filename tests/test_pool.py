@@ -0,0 +1,114 @@
+import threading
+import time
+from typing import Any
+
+import pytest
+from mysql.connector import MySQLConnection
+from mysql.connector.errors import PoolError
+
+from harlequin_mysql import pool
+from harlequin_mysql.pool import HarlequinConnectionPool
+
+CONNECT_SECONDS = 0.2
+
+
+@pytest.fixture
+def slow_connect(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    calls: list[dict[str, Any]] = []
+
+    def _connect(**config: Any) -> MySQLConnection:
+        calls.append(config)
+        time.sleep(CONNECT_SECONDS)
+        # an unconnected connection; good enough to put in the pool.
+        return MySQLConnection()
+
+    monkeypatch.setattr(pool, "connect", _connect)
+    return calls
+
+
+def test_warm_up_is_concurrent(slow_connect: list[dict[str, Any]]) -> None:
+    cnx_pool = HarlequinConnectionPool(
+        pool_size=5, pool_name="test", user="root", database="foo"
+    )
+    start = time.perf_counter()
+    cnx_pool.warm_up()
+    assert time.perf_counter() - start < CONNECT_SECONDS * 2
+    assert cnx_pool.warm_up_stats.first_connection_seconds is not None
+
+    # config changes are merged, so new connections get the whole config.
+    cnx_pool.set_config(database="bar")
+    assert cnx_pool._cnx_config == {"user": "root", "database": "bar"}
+
+    deadline = time.monotonic() + 5
+    while cnx_pool.warm_up_stats.total_seconds is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert cnx_pool._cnx_queue.qsize() == 5
+    assert cnx_pool.warm_up_stats.connections == 5
+    # the four background connections were opened at the same time.
+    assert cnx_pool.warm_up_stats.total_seconds < CONNECT_SECONDS * 3
+    assert len(slow_connect) == 5
+    cnx_pool.close()
+
+
+class FakeConnection(MySQLConnection):
+    @property
+    def server_info(self) -> str | None:
+        return "8.0.36"
+
+    def is_connected(self) -> bool:
+        return True
+
+    def disconnect(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_connect(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pool, "connect", lambda **_: FakeConnection())
+
+
+def test_warm_up_records_server_info(fake_connect: None) -> None:
+    cnx_pool = HarlequinConnectionPool(pool_size=1, pool_name="test", user="root")
+    assert cnx_pool.server_info is None
+    cnx_pool.warm_up()
+    assert cnx_pool.server_info == "8.0.36"
+    assert cnx_pool.stats().open == 1
+    cnx_pool.close()
+
+
+def test_pool_grows_waits_and_shrinks(fake_connect: None) -> None:
+    cnx_pool = HarlequinConnectionPool(
+        pool_size=2, pool_name="test", max_size=3, timeout=0.05, user="root"
+    )
+    cnx_pool.warm_up()
+    deadline = time.monotonic() + 5
+    while cnx_pool.warm_up_stats.total_seconds is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    conns = [cnx_pool.get_connection() for _ in range(3)]
+    stats = cnx_pool.stats()
+    assert (stats.open, stats.in_use, stats.grown) == (3, 3, 1)
+    assert stats.utilization == 1
+
+    with pytest.raises(PoolError):
+        cnx_pool.get_connection()
+    assert cnx_pool.stats().timeouts == 1
+
+    # a waiting caller gets the next connection that is returned.
+    threading.Timer(0.05, conns.pop().close).start()
+    conns.append(cnx_pool.get_connection(timeout=5))
+    stats = cnx_pool.stats()
+    assert stats.waits == 1
+    assert stats.max_wait_seconds > 0
+
+    for conn in conns:
+        conn.close()
+    assert cnx_pool.stats().in_use == 0
+    assert cnx_pool.shrink() == 0
+    cnx_pool.idle_timeout = 0
+    assert cnx_pool.shrink() == 1
+    stats = cnx_pool.stats()
+    assert (stats.open, stats.shrunk) == (2, 1)
+    cnx_pool.close()
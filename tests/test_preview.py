@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from harlequin_mysql.preview import SAMPLE_MIN_ROWS, preview_query
+
+
+def test_preview_table_without_key() -> None:
+    assert preview_query("`db`.`foo`") == "select *\nfrom `db`.`foo`\nlimit 100"
+
+
+def test_preview_table_with_key() -> None:
+    query = preview_query(
+        "`db`.`foo`",
+        primary_key=[("a", "##"), ("b`c", "s")],
+        rows_estimate=SAMPLE_MIN_ROWS * 10,
+    )
+    assert query == "select *\nfrom `db`.`foo`\norder by `a`, `b``c`\nlimit 100"
+
+
+def test_preview_large_table_is_sampled() -> None:
+    small = preview_query("`db`.`foo`", primary_key=[("id", "###")], rows_estimate=10)
+    assert "rand()" not in small
+    assert "order by `id`" in small
+
+    large = preview_query(
+        "`db`.`foo`",
+        primary_key=[("id", "###")],
+        rows_estimate=SAMPLE_MIN_ROWS + 1,
+        limit=10,
+    )
+    assert "rand()" in large
+    assert "where t.`id` >= s.start" in large
+    assert large.endswith("order by t.`id`\nlimit 10")
+
+    # keys without integer arithmetic are read in key order instead.
+    uuid_key = preview_query(
+        "`db`.`foo`", primary_key=[("id", "c")], rows_estimate=SAMPLE_MIN_ROWS * 2
+    )
+    assert "rand()" not in uuid_key
+
+
+def test_preview_view() -> None:
+    assert preview_query("`db`.`v`", is_view=True) == (
+        "select /*+ MAX_EXECUTION_TIME(5000) */ *\nfrom `db`.`v`\nlimit 100"
+    )
+    assert preview_query("`db`.`v`", is_view=True, mariadb=True).startswith(
+        "SET STATEMENT max_statement_time=5.000 FOR select *"
+    )
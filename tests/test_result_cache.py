@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pyarrow as pa
+
+from harlequin_mysql.result_cache import ResultCache, normalize_sql
+
+
+def test_normalize_sql() -> None:
+    assert normalize_sql("  select   a,\n\tb from foo ;") == "select a, b from foo"
+    # whitespace in strings and quoted identifiers is kept.
+    assert (
+        normalize_sql("select 'a  b' as `c  d`  from foo")
+        == "select 'a  b' as `c  d` from foo"
+    )
+    assert ResultCache.key("db", "select 1;", 10) == ("db", "select 1", 10)
+
+
+def test_get_and_put() -> None:
+    cache = ResultCache(max_bytes=1024 * 1024)
+    key = ResultCache.key("db", "select 1", 100)
+    assert cache.get(key) is None
+    assert cache.put(key, [("a", 3)], [(1,)])
+    entry = cache.get(key)
+    assert entry is not None
+    assert entry.data == [(1,)]
+    assert entry.description == [("a", 3)]
+    # a different database or limit is a different result.
+    assert cache.get(ResultCache.key("other", "select 1", 100)) is None
+    assert cache.get(ResultCache.key("db", "select 1", 10)) is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+    assert cache.stats.entries == 1
+    assert cache.stats.bytes == entry.nbytes
+
+
+def test_lru_eviction() -> None:
+    table = pa.table({"a": list(range(1000))})
+    cache = ResultCache(max_bytes=table.nbytes * 2)
+    keys = [ResultCache.key(None, f"select {i}", None) for i in range(3)]
+    cache.put(keys[0], [], table)
+    cache.put(keys[1], [], table)
+    # reading the first result makes the second the least recently used.
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], [], table)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+    assert cache.stats.evictions == 1
+    assert cache.stats.bytes == table.nbytes * 2
+
+    # results larger than the cache are not cached.
+    assert not cache.put(keys[1], [], pa.table({"a": list(range(10_000))}))
+
+
+def test_ttl_and_clear() -> None:
+    cache = ResultCache(max_bytes=1024 * 1024, ttl=0)
+    key = ResultCache.key(None, "select 1", None)
+    cache.put(key, [], [(1,)])
+    assert cache.get(key) is None
+    assert cache.stats.expirations == 1
+
+    cache.ttl = 60
+    cache.put(key, [], [(1,)])
+    cache.clear()
+    assert cache.get(key) is None
+    assert cache.stats.invalidations == 1
+    assert (cache.stats.entries, cache.stats.bytes) == (0, 0)
@@ -0,0 +1,58 @@
+from harlequin_mysql.schema_completions import SchemaCompletionIndex
+
+
+def _index(max_completions: int = 100) -> SchemaCompletionIndex:
+    index = SchemaCompletionIndex(max_completions=max_completions)
+    index.set_relations("one", [("foo", "BASE TABLE"), ("bar", "VIEW")])
+    index.set_relations("two", [("baz", "BASE TABLE")])
+    index.set_relations("three", [(None, None)])
+    index.add_columns(
+        [
+            ("two", "baz", "c", "##"),
+            ("one", "foo", "a", "##"),
+            ("one", "foo", "b", "s"),
+        ]
+    )
+    return index
+
+
+def test_completions() -> None:
+    index = _index()
+    assert len(index) == 6
+    completions = index.completions(current_database="two")
+    assert [(c.label, c.type_label, c.priority, c.context) for c in completions] == [
+        ("two", "db", 500, None),
+        ("one", "db", 500, None),
+        ("three", "db", 500, None),
+        ("baz", "t", 500, None),
+        ("baz", "t", 501, "two"),
+        ("c", "##", 502, "baz"),
+        ("foo", "t", 501, "one"),
+        ("bar", "v", 501, "one"),
+        ("a", "##", 502, "foo"),
+        ("b", "s", 502, "foo"),
+    ]
+
+
+def test_size_cap() -> None:
+    index = SchemaCompletionIndex(max_completions=4)
+    index.set_relations("one", [("foo", "BASE TABLE"), ("bar", "VIEW")])
+    assert index.add_columns([("one", "foo", "a", "##")])
+    assert not index.add_columns([("one", "foo", "b", "##"), ("one", "bar", "c", "##")])
+    assert len(index) == 4
+    assert len(index.completions(current_database=None)) == 4
+
+
+def test_incremental_updates() -> None:
+    index = _index()
+    index.set_relations("one", [("foo", "BASE TABLE"), ("qux", "BASE TABLE")])
+    index.set_columns("one", "qux", [("d", "dt")])
+    index.drop_database("two")
+    assert len(index) == 5
+    labels = {(c.label, c.context) for c in index.completions(current_database=None)}
+    assert ("bar", "one") not in labels
+    assert ("qux", "one") in labels
+    assert ("d", "qux") in labels
+    assert ("a", "foo") in labels
+    assert ("two", None) not in labels
+    assert ("c", "baz") not in labels
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any
+
+from harlequin_mysql.statement_stats import (
+    StatementStats,
+    StatementStatsLog,
+    statement_stats_query,
+)
+
+
+def _row(
+    digest: str = "abc", timer_wait: int = 12_300_000_000, **overrides: Any
+) -> tuple[Any, ...]:
+    values = {
+        "lock_time": 2_000_000_000,
+        "rows_sent": 10,
+        "rows_examined": 1_000,
+        "rows_affected": 0,
+        "created_tmp_tables": 1,
+        "created_tmp_disk_tables": 1,
+        "sort_merge_passes": 0,
+        "sort_rows": 10,
+        "select_scan": 1,
+        "select_full_join": 0,
+        "no_index_used": 1,
+        **overrides,
+    }
+    return (
+        42,
+        digest,
+        "SELECT * FROM `t` WHERE `a` = ?",
+        timer_wait,
+        *values.values(),
+        0,
+        0,
+    )
+
+
+def test_statement_stats_query() -> None:
+    query = statement_stats_query(12)
+    assert "t.processlist_id = 12" in query
+    assert "'statement/com/Close stmt'" in query
+
+
+def test_from_row() -> None:
+    stats = StatementStats.from_row(_row())
+    assert stats.seconds == 0.0123
+    assert stats.lock_seconds == 0.002
+    assert stats.rows_examined == 1_000
+    assert stats.no_index_used
+    assert stats.compact == (
+        "12.3ms, 10 sent / 1,000 examined, 2.0ms locked, "
+        "1 tmp table (1 on disk), no index used"
+    )
+
+
+def test_from_row_nulls() -> None:
+    row = (1, None, None, None, *([None] * 13))
+    stats = StatementStats.from_row(row)
+    assert stats.seconds == 0
+    assert stats.compact == "0.0ms, 0 sent / 0 examined"
+
+
+def test_summary_by_digest() -> None:
+    log = StatementStatsLog()
+    log.add(StatementStats.from_row(_row("fast", timer_wait=1_000_000_000)))
+    log.add(StatementStats.from_row(_row("slow", timer_wait=5_000_000_000)))
+    log.add(StatementStats.from_row(_row("slow", timer_wait=3_000_000_000)))
+    slow, fast = log.summary()
+    assert slow.count == 2
+    assert slow.total_seconds == 0.008
+    assert slow.max_seconds == 0.005
+    assert slow.mean_seconds == 0.004
+    assert slow.rows_examined == 2_000
+    assert slow.no_index_used == 2
+    assert fast.count == 1
+    assert log.summary(limit=1) == [slow]
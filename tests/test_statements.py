@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import pytest
+
+from harlequin_mysql.statements import (
+    CatalogChange,
+    add_limit,
+    add_max_execution_time,
+    can_prepare,
+    is_analyzable,
+    is_cacheable,
+    is_explainable,
+    is_read_only,
+    parse_catalog_changes,
+)
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("select 1", "select 1\nlimit 10"),
+        ("SELECT * FROM foo;", "SELECT * FROM foo\nlimit 10"),
+        ("  select a from foo -- comment", "  select a from foo -- comment\nlimit 10"),
+        (
+            "/* hi */ select 1 union all select 2",
+            "/* hi */ select 1 union all select 2\nlimit 10",
+        ),
+        ("-- hi\nselect 1", "-- hi\nselect 1\nlimit 10"),
+        ("select * from foo limit 5", None),
+        ("select * from (select * from foo limit 5) as f", None),
+        ("select * from foo for update", None),
+        ("select 1 into @a", None),
+        ("select 1; select 2", None),
+        ("show tables", None),
+        ("selection", None),
+        ("update foo set a = 1", None),
+    ],
+)
+def test_add_limit(query: str, expected: str | None) -> None:
+    assert add_limit(query, 10) == expected
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("select * from foo;", True),
+        ("-- hi\nselect a, b from foo where c > 1", True),
+        ("select * from foo where a like '%s'", False),
+        ("select * from foo where a = ?", False),
+        ("select 1; select 2", False),
+        ("show tables", False),
+    ],
+)
+def test_can_prepare(query: str, expected: bool) -> None:
+    assert can_prepare(query) is expected
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("select * from foo where a = 1;", True),
+        ("/* hi */ SELECT count(*) FROM foo", True),
+        ("select * from foo for update", False),
+        ("select a into @a from foo", False),
+        ("select now()", False),
+        ("select * from foo where d > current_date", False),
+        ("select rand() from foo", False),
+        ("select 1; select 2", False),
+        ("show tables", False),
+        ("insert into foo values (1)", False),
+    ],
+)
+def test_is_cacheable(query: str, expected: bool) -> None:
+    assert is_cacheable(query) is expected
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("select 1", True),
+        ("SHOW TABLES", True),
+        ("-- hi\nexplain select 1", True),
+        ("use foo", True),
+        ("insert into foo values (1)", False),
+        ("set @a = 1", False),
+        ("with a as (select 1) delete from foo", False),
+    ],
+)
+def test_is_read_only(query: str, expected: bool) -> None:
+    assert is_read_only(query) is expected
+
+
+@pytest.mark.parametrize(
+    "query,explainable,analyzable",
+    [
+        ("select 1", True, True),
+        ("/* hi */ WITH a AS (select 1) select * from a", True, True),
+        ("table foo", True, True),
+        ("update foo set a = 1", True, False),
+        ("with a as (select 1) delete from foo", True, False),
+        ("select 1 into @a", True, False),
+        ("show tables", False, False),
+        ("create table foo (a int)", False, False),
+    ],
+)
+def test_is_explainable(query: str, explainable: bool, analyzable: bool) -> None:
+    assert is_explainable(query) is explainable
+    assert is_analyzable(query) is analyzable
+
+
+@pytest.mark.parametrize(
+    "query,mariadb,expected",
+    [
+        ("select 1", False, "select /*+ MAX_EXECUTION_TIME(1500) */ 1"),
+        (
+            "-- hi\nSELECT * FROM foo",
+            False,
+            "-- hi\nSELECT /*+ MAX_EXECUTION_TIME(1500) */ * FROM foo",
+        ),
+        (
+            "select 1",
+            True,
+            "SET STATEMENT max_statement_time=1.500 FOR select 1",
+        ),
+        ("select /*+ MAX_EXECUTION_TIME(10) */ 1", False, None),
+        (
+            "select /*+ BKA(t) */ * from t",
+            False,
+            "select /*+ BKA(t) MAX_EXECUTION_TIME(1500) */ * from t",
+        ),
+        (
+            "SELECT/*+ NO_ICP(t)\n*/ * from t",
+            False,
+            "SELECT/*+ NO_ICP(t) MAX_EXECUTION_TIME(1500) */ * from t",
+        ),
+        (
+            "select /* not a hint */ 1",
+            False,
+            "select /*+ MAX_EXECUTION_TIME(1500) */ /* not a hint */ 1",
+        ),
+        ("show tables", False, None),
+        ("update foo set a = 1", True, None),
+    ],
+)
+def test_add_max_execution_time(
+    query: str, mariadb: bool, expected: str | None
+) -> None:
+    assert add_max_execution_time(query, 1.5, mariadb=mariadb) == expected
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("create database foo", [CatalogChange("databases", "foo")]),
+        ("DROP SCHEMA IF EXISTS `my db`", [CatalogChange("databases", "my db")]),
+        ("create table foo (a int)", [CatalogChange("relations", None, "foo")]),
+        (
+            "create or replace definer=`root`@`%` view db.v as select 1",
+            [CatalogChange("relations", "db", "v")],
+        ),
+        (
+            "drop table if exists a, `b`.c",
+            [
+                CatalogChange("relations", None, "a"),
+                CatalogChange("relations", "b", "c"),
+            ],
+        ),
+        (
+            "rename table a to b",
+            [
+                CatalogChange("relations", None, "a"),
+                CatalogChange("relations", None, "b"),
+            ],
+        ),
+        (
+            "alter table db.a rename to db.b",
+            [
+                CatalogChange("relations", "db", "a"),
+                CatalogChange("relations", "db", "b"),
+            ],
+        ),
+        ("alter table a add column b int", [CatalogChange("columns", None, "a")]),
+        ("alter table a rename column b to c", [CatalogChange("columns", None, "a")]),
+        ("create index ix on db.a (b)", [CatalogChange("columns", "db", "a")]),
+        ("select * from foo", []),
+        ("insert into foo values (1)", []),
+    ],
+)
+def test_parse_catalog_changes(query: str, expected: list[CatalogChange]) -> None:
+    assert parse_catalog_changes(query) == expected
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Any, cast
+
+import pytest
+from mysql.connector import FieldType
+from mysql.connector.cursor import MySQLCursor
+
+from harlequin_mysql.streaming import (
+    INITIAL_BATCH_SIZE,
+    StreamStats,
+    parse_bytes,
+    stream_record_batches,
+)
+
+DESCRIPTION = [
+    ("a", FieldType.LONGLONG, None, None, None, None, True, 0, 255),
+    ("b", FieldType.VAR_STRING, None, None, None, None, True, 0, 255),
+]
+
+
+class FakeCursor:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self.rows = rows
+
+    def fetchmany(self, size: int) -> list[tuple[Any, ...]]:
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+def _cursor(fake: FakeCursor) -> MySQLCursor:
+    return cast(MySQLCursor, fake)
+
+
+def _rows(n: int, width: int = 100) -> list[tuple[Any, ...]]:
+    return [(i, "x" * width) for i in range(n)]
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (1024, 1024),
+        ("1024", 1024),
+        ("2KB", 2048),
+        ("1.5 MB", 1572864),
+        ("1gb", 1024**3),
+    ],
+)
+def test_parse_bytes(value: str | int, expected: int) -> None:
+    assert parse_bytes(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "MB", "12 TB", "foo"])
+def test_parse_bytes_raises(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_bytes(value)
+
+
+def test_stream_no_budget() -> None:
+    stats = StreamStats()
+    batches = list(
+        stream_record_batches(
+            _cursor(FakeCursor(_rows(250))), DESCRIPTION, stats, batch_size=100
+        )
+    )
+    assert [b.num_rows for b in batches] == [100, 100, 50]
+    assert stats.rows == 250
+    assert stats.stopped_by is None
+    assert not stats.truncated
+
+
+def test_stream_row_budget() -> None:
+    cur = FakeCursor(_rows(250))
+    stats = StreamStats()
+    batches = list(
+        stream_record_batches(
+            _cursor(cur), DESCRIPTION, stats, max_rows=120, batch_size=100
+        )
+    )
+    assert sum(b.num_rows for b in batches) == 120
+    assert stats.stopped_by == "rows"
+    assert len(cur.rows) == 130
+
+
+def test_stream_byte_budget() -> None:
+    cur = FakeCursor(_rows(1000, width=1000))
+    stats = StreamStats()
+    batches = list(
+        stream_record_batches(_cursor(cur), DESCRIPTION, stats, max_bytes=50_000)
+    )
+    assert stats.stopped_by == "bytes"
+    assert 0 < stats.bytes <= 50_000
+    assert sum(b.num_rows for b in batches) == stats.rows
+    assert stats.unfetched_rows
+    assert stats.truncated
+    assert "memory budget" in stats.message
+
+
+def test_stream_byte_budget_reads_little_past_budget() -> None:
+    cur = FakeCursor(_rows(1000, width=1000))
+    stats = StreamStats()
+    batches = list(
+        stream_record_batches(_cursor(cur), DESCRIPTION, stats, max_bytes=500_000)
+    )
+    assert stats.stopped_by == "bytes"
+    assert stats.bytes <= 500_000
+    # once the row size is known, batches are capped by the rest of the
+    # budget, and only one row is read past it.
+    assert len(batches) > 2
+    assert 1000 - len(cur.rows) - stats.rows == 1
+
+
+def test_stream_adaptive_batch_size() -> None:
+    cur = FakeCursor(_rows(5000, width=10_000))
+    stats = StreamStats()
+    batches = list(stream_record_batches(_cursor(cur), DESCRIPTION, stats))
+    # the first batch is small; later batches grow, up to the target bytes.
+    sizes = [b.num_rows for b in batches]
+    assert sizes[:3] == [
+        INITIAL_BATCH_SIZE,
+        4 * INITIAL_BATCH_SIZE,
+        16 * INITIAL_BATCH_SIZE,
+    ]
+    assert max(sizes) < 2_000
+    assert all(b.nbytes <= 20 * 1024 * 1024 for b in batches)
+    assert stats.rows == 5000
+
+
+def test_stream_stats_message() -> None:
+    stats = StreamStats(rows=10, bytes=2048, stopped_by="rows", unfetched_rows=None)
+    assert stats.truncated
+    assert stats.message == (
+        "Fetched 10 rows (2.0 KB) before reaching the row budget; "
+        "more rows were not fetched."
+    )
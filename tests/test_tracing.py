@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from mysql.connector.cursor import MySQLCursor
+
+from harlequin_mysql.tracing import (
+    FirstRowTimer,
+    JsonLinesTraceHook,
+    LoggingTraceHook,
+    QueryTrace,
+    make_trace_hook,
+)
+
+
+class FakeCursor:
+    rowcount = 3
+
+    def __init__(self) -> None:
+        self.rows: list[tuple[Any, ...]] = [(1,), (2,), (3,)]
+
+    def fetchmany(self, size: int = 1) -> list[tuple[Any, ...]]:
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+def _trace() -> QueryTrace:
+    trace = QueryTrace(query="select 1", connection_id=7)
+    start = time.perf_counter()
+    trace.add_span("checkout", start, start + 0.001)
+    trace.add_span("execute", start + 0.001, start + 0.003)
+    trace.rows = 1
+    trace.bytes = 8
+    return trace
+
+
+def test_query_trace() -> None:
+    trace = _trace()
+    assert [s.name for s in trace.spans] == ["checkout", "execute"]
+    assert trace.phase_seconds("execute") == pytest.approx(0.002)
+    assert trace.phase_seconds("fetch") is None
+    assert trace.total_seconds >= 0.003
+    data = trace.to_dict()
+    assert data["connection_id"] == 7
+    assert [s["name"] for s in data["spans"]] == ["checkout", "execute"]
+
+
+def test_first_row_timer() -> None:
+    trace = QueryTrace(query="select n")
+    cur = cast(MySQLCursor, FirstRowTimer(cast(MySQLCursor, FakeCursor()), trace))
+    assert cur.rowcount == 3
+    assert cur.fetchmany(0) == []
+    assert trace.first_row_at is None
+    assert cur.fetchmany(2) == [(1,), (2,)]
+    first_row_at = trace.first_row_at
+    assert first_row_at is not None
+    assert cur.fetchmany(2) == [(3,)]
+    assert trace.first_row_at == first_row_at
+
+
+def test_json_lines_hook(tmp_path: Path) -> None:
+    path = tmp_path / "traces.jsonl"
+    hook = make_trace_hook(str(path))
+    assert isinstance(hook, JsonLinesTraceHook)
+    hook(_trace())
+    hook(_trace())
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["query"] == "select 1"
+
+
+def test_logging_hook(caplog: pytest.LogCaptureFixture) -> None:
+    hook = make_trace_hook("log")
+    assert isinstance(hook, LoggingTraceHook)
+    with caplog.at_level(logging.INFO, logger="harlequin_mysql.tracing"):
+        hook(_trace())
+    assert "checkout=1.0ms execute=2.0ms" in caplog.text
+    assert "select 1" in caplog.text
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("opentelemetry") is not None,
+    reason="opentelemetry is installed",
+)
+def test_otel_hook_requires_opentelemetry() -> None:
+    with pytest.raises(ValueError, match="opentelemetry-api"):
+        make_trace_hook("otel")